@@ -221,6 +221,9 @@ class Copier:
         """
         ディスク空き容量を確認
 
+        直前のコピーで空き容量が変わるため、PathValidatorのキャッシュは使わず
+        毎回shutil.disk_usageで取得します。
+
         Args:
             target_dir: 確認対象ディレクトリ
             required_bytes: 必要なバイト数
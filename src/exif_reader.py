@@ -12,8 +12,9 @@ import shutil
 import subprocess
 import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import ClassVar, Dict, List, Optional
 
 from .exceptions import ExifReadError
 
@@ -21,8 +22,13 @@ from .exceptions import ExifReadError
 class ExifReader:
     """ExifTool を使用したExif情報読み取りクラス（キャッシュ機能付き）"""
     
+    # 検出済みのExifToolパス（インスタンス間で共有し、検出とバージョン確認を1回に抑える）
+    _cached_exiftool_path: ClassVar[Optional[Path]] = None
+    
     def __init__(self):
         """ExifReaderを初期化"""
+        # 複数スレッドから共有される場合、同じファイルが重複して読み取られることがあるが、
+        # 結果は同一で辞書への代入も不可分なため、ロックは使用しない
         self.cache: Dict[Path, Optional[datetime]] = {}
         self.logger = logging.getLogger(__name__)
         self.exiftool_path: Optional[Path] = None
@@ -35,11 +41,14 @@ class ExifReader:
             'DateTime',            # 一般的な日時
         ]
         
-        # ExifToolの初期化チェック
-        self._check_exiftool_availability()
+        # ExifToolの初期化チェック（検出済みの場合は再検出しない）
+        if ExifReader._cached_exiftool_path is not None:
+            self.exiftool_path = ExifReader._cached_exiftool_path
+        else:
+            self._check_exiftool_availability()
     
     def _check_exiftool_availability(self) -> None:
-        """ExifToolが利用可能かチェックし、パスを設定"""
+        """ExifToolが利用可能かチェックし、パスを設定（検出結果はインスタンス間で共有）"""
         try:
             self.exiftool_path = self._find_exiftool()
             # ExifToolのバージョンを確認
@@ -52,10 +61,13 @@ class ExifReader:
             if result.returncode == 0:
                 version = result.stdout.strip()
                 self.logger.info(f"ExifTool が見つかりました: {self.exiftool_path} (バージョン: {version})")
+                ExifReader._cached_exiftool_path = self.exiftool_path
             else:
                 raise ExifReadError("ExifTool の実行に失敗しました")
                 
         except Exception as e:
+            # 以前は利用可能だった場合も、見つからなくなった時点で検出結果を破棄する
+            ExifReader._cached_exiftool_path = None
             error_msg = (
                 "ExifTool が見つかりません。以下の方法でインストールしてください:\n"
                 "Windows: https://exiftool.org/ からダウンロードしてPATHに追加\n"
@@ -96,7 +108,7 @@ class ExifReader:
         raise FileNotFoundError("ExifTool が見つかりません")
     
     def check_exiftool_availability(self) -> bool:
-        """ExifToolが利用可能かチェック（外部から呼び出し可能）"""
+        """ExifToolが利用可能かチェック（外部から呼び出し可能、呼び出しごとに再検出する）"""
         try:
             self._check_exiftool_availability()
             return True
@@ -239,10 +251,14 @@ class ExifReader:
         except Exception as e:
             raise ExifReadError(f"ExifTool実行中に予期しないエラー: {str(e)}") from e
     
-    def _parse_exif_datetime(self, datetime_str: str) -> Optional[datetime]:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _parse_exif_datetime(datetime_str: str) -> Optional[datetime]:
         """
         Exif日時文字列をdatetimeオブジェクトに変換
         
+        同じ撮影日時の文字列は繰り返し現れるため、解析結果をキャッシュします。
+        
         Args:
             datetime_str: Exif日時文字列（例: "2023:12:25 14:30:45" または "2023-12-25T14:30:45"）
             
@@ -285,7 +301,7 @@ class ExifReader:
         except ValueError:
             pass
         
-        self.logger.debug(f"日時文字列の解析に失敗: '{datetime_str}'")
+        logging.getLogger(__name__).debug(f"日時文字列の解析に失敗: '{datetime_str}'")
         return None
     
     def clear_cache(self) -> None:
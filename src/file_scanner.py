@@ -5,7 +5,7 @@
 """
 
 from pathlib import Path
-from typing import List, Set
+from typing import Iterator, List, Set
 
 from .exceptions import ValidationError
 from .path_validator import PathValidator
@@ -57,20 +57,7 @@ class FileScanner:
         # ディレクトリの検証
         PathValidator.validate_directory(directory)
         
-        raw_files = []
-        
-        if recursive:
-            # 再帰的にスキャン
-            for file_path in directory.rglob('*'):
-                if file_path.is_file() and file_path.suffix in self.RAW_EXTENSIONS:
-                    raw_files.append(file_path)
-        else:
-            # 指定ディレクトリのみスキャン
-            for file_path in directory.iterdir():
-                if file_path.is_file() and file_path.suffix in self.RAW_EXTENSIONS:
-                    raw_files.append(file_path)
-        
-        return sorted(raw_files)
+        return sorted(self._iter_files(directory, recursive, self.RAW_EXTENSIONS))
     
     def scan_jpeg_files(self, directory: Path, recursive: bool = True) -> List[Path]:
         """
@@ -89,20 +76,47 @@ class FileScanner:
         # ディレクトリの検証
         PathValidator.validate_directory(directory)
         
-        jpeg_files = []
+        return sorted(self._iter_files(directory, recursive, self.JPEG_EXTENSIONS))
+    
+    def iter_jpeg_files(self, directory: Path, recursive: bool = True) -> Iterator[Path]:
+        """
+        ディレクトリをスキャンしてJPEGファイルを逐次返す
+        
+        スキャン完了を待たずに後続処理を開始できるよう、見つかった順に返します
+        （順序はソートされません）。
+        
+        Args:
+            directory: スキャンするディレクトリ
+            recursive: サブディレクトリも検索する場合True
+            
+        Returns:
+            見つかったJPEGファイルのパスのイテレータ
+            
+        Raises:
+            ValidationError: ディレクトリが無効な場合
+        """
+        # ディレクトリの検証（ジェネレータ開始前に即時実行）
+        PathValidator.validate_directory(directory)
         
-        if recursive:
-            # 再帰的にスキャン
-            for file_path in directory.rglob('*'):
-                if file_path.is_file() and file_path.suffix in self.JPEG_EXTENSIONS:
-                    jpeg_files.append(file_path)
-        else:
-            # 指定ディレクトリのみスキャン
-            for file_path in directory.iterdir():
-                if file_path.is_file() and file_path.suffix in self.JPEG_EXTENSIONS:
-                    jpeg_files.append(file_path)
+        return self._iter_files(directory, recursive, self.JPEG_EXTENSIONS)
+    
+    def _iter_files(self, directory: Path, recursive: bool, extensions: Set[str]) -> Iterator[Path]:
+        """
+        指定された拡張子のファイルを逐次返す
         
-        return sorted(jpeg_files)
+        Args:
+            directory: スキャンするディレクトリ
+            recursive: サブディレクトリも検索する場合True
+            extensions: 対象とする拡張子の集合
+            
+        Returns:
+            見つかったファイルのパスのイテレータ
+        """
+        # 再帰的にスキャン、または指定ディレクトリのみスキャン
+        candidates = directory.rglob('*') if recursive else directory.iterdir()
+        for file_path in candidates:
+            if file_path.suffix in extensions and file_path.is_file():
+                yield file_path
     
     def get_basename(self, file_path: Path) -> str:
         """
@@ -8,16 +8,21 @@ RAWファイルの情報を事前にインデックス化し、高速なマッ
 import json
 import logging
 import hashlib
+import pickle
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from .exceptions import FileOperationError, ProcessingError
 from .exif_reader import ExifReader
 from .file_scanner import FileScanner
 from .models import RawFileInfo
 
+# キャッシュファイル（列指向形式）のレイアウトのバージョン
+# to_columnarの項目や型を変更した場合は値を上げ、古いキャッシュを読み込まないようにする
+_CACHE_FORMAT_VERSION = 1
+
 
 class RawFileIndex:
     """RAWファイル情報を保持するインデックス"""
@@ -26,6 +31,9 @@ class RawFileIndex:
         """RawFileIndexを初期化"""
         self.by_basename: Dict[str, List[RawFileInfo]] = {}
         self.by_datetime: Dict[datetime, List[RawFileInfo]] = {}
+        # ベース名と撮影日時の組による複合インデックス（両条件での検索用）
+        self.by_basename_and_datetime: Dict[
+            Tuple[str, Optional[datetime]], List[RawFileInfo]] = {}
         self.source_directory: Optional[Path] = None
         self.last_updated: Optional[datetime] = None
         self.file_count: int = 0
@@ -49,10 +57,75 @@ class RawFileIndex:
                 self.by_datetime[info.capture_datetime] = []
             self.by_datetime[info.capture_datetime].append(info)
 
+        # ベース名と撮影日時の組でインデックス化
+        self.by_basename_and_datetime.setdefault(
+            (info.basename, info.capture_datetime), []).append(info)
+
         self.file_count += 1
         self.logger.debug(f"インデックスに追加: {info.path} "
                           f"(ベース名: {info.basename})")
 
+    def add_many(self, infos: Iterable[RawFileInfo]) -> None:
+        """
+        複数のRAWファイル情報をまとめてインデックスに追加
+
+        結果はadd()を順に呼び出した場合と同じですが、ファイルごとの
+        メソッド呼び出しとデバッグログ出力を行いません。
+
+        Args:
+            infos: 追加するRAWファイル情報
+        """
+        by_basename = self.by_basename
+        by_datetime = self.by_datetime
+        by_basename_and_datetime = self.by_basename_and_datetime
+        count = 0
+        for info in infos:
+            by_basename.setdefault(info.basename, []).append(info)
+            if info.capture_datetime:
+                by_datetime.setdefault(info.capture_datetime, []).append(info)
+            by_basename_and_datetime.setdefault(
+                (info.basename, info.capture_datetime), []).append(info)
+            count += 1
+
+        self.file_count += count
+        self.logger.debug(f"インデックスに一括追加: {count}ファイル")
+
+    @classmethod
+    def from_iterable(cls, infos: Iterable[RawFileInfo]) -> 'RawFileIndex':
+        """
+        RAWファイル情報の並びからインデックスを作成
+
+        Args:
+            infos: インデックスに含めるRAWファイル情報
+
+        Returns:
+            作成されたRawFileIndex
+        """
+        index = cls()
+        index.add_many(infos)
+        return index
+
+    def merge(self, other: 'RawFileIndex') -> None:
+        """
+        別のインデックスの内容をまとめて統合
+
+        ファイルごとにadd()を呼び出さず、辞書単位でリストを連結します。
+
+        Args:
+            other: 統合するインデックス
+        """
+        for basename, infos in other.by_basename.items():
+            self.by_basename.setdefault(basename, []).extend(infos)
+
+        for dt, infos in other.by_datetime.items():
+            self.by_datetime.setdefault(dt, []).extend(infos)
+
+        for key, infos in other.by_basename_and_datetime.items():
+            self.by_basename_and_datetime.setdefault(key, []).extend(infos)
+
+        self.file_count += other.file_count
+        self.logger.debug(f"インデックスを統合: {other.file_count}ファイル")
+
     def remove(self, file_path: Path) -> bool:
         """
         インデックスからファイル情報を削除
@@ -83,6 +156,12 @@ class RawFileIndex:
                 if not infos:  # リストが空になった場合はキーを削除
                     del self.by_datetime[dt]
 
+        # 複合インデックスから削除
+        for key, infos in list(self.by_basename_and_datetime.items()):
+            infos[:] = [info for info in infos if info.path != file_path]
+            if not infos:  # リストが空になった場合はキーを削除
+                del self.by_basename_and_datetime[key]
+
         if removed:
             self.file_count -= 1
             self.logger.debug(f"インデックスから削除: {file_path}")
@@ -125,13 +204,7 @@ class RawFileIndex:
         Returns:
             両方の条件にマッチするRAWファイル情報のリスト
         """
-        basename_matches = self.find_by_basename(basename)
-        if not basename_matches:
-            return []
-
-        # 撮影日時でフィルタリング
-        return [info for info in basename_matches
-                if info.capture_datetime == dt]
+        return self.by_basename_and_datetime.get((basename.lower(), dt), [])
 
     def get_all_files(self) -> List[RawFileInfo]:
         """
@@ -149,6 +222,7 @@ class RawFileIndex:
         """インデックスをクリア"""
         self.by_basename.clear()
         self.by_datetime.clear()
+        self.by_basename_and_datetime.clear()
         self.file_count = 0
         self.logger.debug("インデックスをクリアしました")
 
@@ -216,6 +290,60 @@ class RawFileIndex:
 
         return index
 
+    def to_columnar(self) -> Dict:
+        """
+        インデックスを列指向の辞書形式に変換（バイナリ永続化用）
+
+        ファイル情報を項目ごとの並列リストとして保持し、
+        読み込み時のレコード単位の解析を不要にします。
+
+        Returns:
+            インデックスの列指向辞書表現
+        """
+        all_files = self.get_all_files()
+        return {
+            'source_directory': (str(self.source_directory)
+                                 if self.source_directory else None),
+            'last_updated': self.last_updated,
+            'paths': [str(info.path) for info in all_files],
+            'basenames': [info.basename for info in all_files],
+            'capture_datetimes': [info.capture_datetime for info in all_files],
+            'file_sizes': [info.file_size for info in all_files]
+        }
+
+    @classmethod
+    def from_columnar(cls, data: Dict) -> 'RawFileIndex':
+        """
+        列指向の辞書からインデックスを復元
+
+        Args:
+            data: インデックスの列指向辞書表現
+
+        Returns:
+            復元されたRawFileIndex
+        """
+        index = cls()
+
+        if data.get('source_directory'):
+            index.source_directory = Path(data['source_directory'])
+
+        index.last_updated = data.get('last_updated')
+
+        # ファイル情報を復元
+        index.add_many(
+            RawFileInfo(
+                path=Path(path),
+                basename=basename,
+                capture_datetime=capture_datetime,
+                file_size=file_size
+            )
+            for path, basename, capture_datetime, file_size in zip(
+                data['paths'], data['basenames'],
+                data['capture_datetimes'], data['file_sizes'])
+        )
+
+        return index
+
 
 class IndexCache:
     """インデックスキャッシュ管理"""
@@ -239,10 +367,64 @@ class IndexCache:
         Returns:
             キャッシュファイルのパス
         """
+        return self.cache_dir / f'index_{self._get_dir_hash(source_dir)}.pickle'
+
+    def get_legacy_cache_path(self, source_dir: Path) -> Path:
+        """
+        旧形式（JSON）のキャッシュファイルパスを取得
+
+        Args:
+            source_dir: ソースディレクトリ
+
+        Returns:
+            旧形式キャッシュファイルのパス
+        """
+        return self.cache_dir / f'index_{self._get_dir_hash(source_dir)}.json'
+
+    def _get_dir_hash(self, source_dir: Path) -> str:
+        """
+        ソースディレクトリパスのハッシュを取得
+
+        Args:
+            source_dir: ソースディレクトリ
+
+        Returns:
+            ディレクトリパスのハッシュ文字列
+        """
         # ディレクトリパスのハッシュを作成してファイル名にする
-        dir_hash = hashlib.md5(
+        return hashlib.md5(
             str(source_dir.resolve()).encode()).hexdigest()
-        return self.cache_dir / f'index_{dir_hash}.json'
+
+    @staticmethod
+    def _serialize(index: RawFileIndex) -> bytes:
+        """
+        インデックスをキャッシュファイル用のバイト列に変換
+
+        Args:
+            index: 変換するインデックス
+
+        Returns:
+            列指向形式をpickle化したバイト列
+        """
+        data = index.to_columnar()
+        data['version'] = _CACHE_FORMAT_VERSION
+        return pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def _deserialize(data: bytes) -> Optional[RawFileIndex]:
+        """
+        キャッシュファイルのバイト列からインデックスを復元
+
+        Args:
+            data: _serializeで作成したバイト列
+
+        Returns:
+            復元されたRawFileIndex（レイアウトのバージョンが異なる場合はNone）
+        """
+        columnar = pickle.loads(data)
+        if columnar.get('version') != _CACHE_FORMAT_VERSION:
+            return None
+        return RawFileIndex.from_columnar(columnar)
 
     def load_directory_index(self, source_dir: Path) -> Optional[RawFileIndex]:
         """
@@ -257,11 +439,46 @@ class IndexCache:
         cache_path = self.get_cache_path(source_dir)
 
         if not cache_path.exists():
+            # 旧形式（JSON）のキャッシュがあれば読み込む
+            legacy_path = self.get_legacy_cache_path(source_dir)
+            if legacy_path.exists():
+                return self._load_legacy_directory_index(source_dir, legacy_path)
+
             self.logger.debug(f"キャッシュファイルが存在しません: {cache_path}")
             return None
 
         try:
-            with open(cache_path, 'r', encoding='utf-8') as f:
+            # 列指向のバイナリ形式を一度に読み込み
+            index = self._deserialize(cache_path.read_bytes())
+            if index is None:
+                self.logger.debug(
+                    f"キャッシュ形式のバージョンが異なるため読み込みません: {cache_path}")
+                return None
+
+            self.logger.debug(
+                f"インデックスを読み込みました: {source_dir} "
+                f"({index.file_count}ファイル)")
+            return index
+
+        except Exception as e:
+            self.logger.error(f"インデックス読み込みエラー: {cache_path} "
+                              f"- {str(e)}")
+            return None
+
+    def _load_legacy_directory_index(self, source_dir: Path,
+                                     legacy_path: Path) -> Optional[RawFileIndex]:
+        """
+        旧形式（JSON）のインデックスを読み込み
+
+        Args:
+            source_dir: ソースディレクトリ
+            legacy_path: 旧形式キャッシュファイルのパス
+
+        Returns:
+            読み込まれたインデックス（読み込みに失敗した場合はNone）
+        """
+        try:
+            with open(legacy_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
 
             index = RawFileIndex.from_dict(data)
@@ -271,7 +488,7 @@ class IndexCache:
             return index
 
         except Exception as e:
-            self.logger.error(f"インデックス読み込みエラー: {cache_path} "
+            self.logger.error(f"インデックス読み込みエラー: {legacy_path} "
                               f"- {str(e)}")
             return None
 
@@ -294,9 +511,13 @@ class IndexCache:
             index.source_directory = source_dir
             index.last_updated = datetime.now()
 
-            # JSON形式で保存
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(index.to_dict(), f, ensure_ascii=False, indent=2)
+            # 列指向のバイナリ形式で保存
+            cache_path.write_bytes(self._serialize(index))
+
+            # 旧形式（JSON）のキャッシュが残っていれば削除
+            legacy_path = self.get_legacy_cache_path(source_dir)
+            if legacy_path.exists():
+                legacy_path.unlink()
 
             self.logger.debug(
                 f"インデックスを保存しました: {cache_path} "
@@ -396,12 +617,13 @@ class IndexCache:
         try:
             found = False
             
-            # キャッシュファイルを削除
-            cache_path = self.get_cache_path(source_dir)
-            if cache_path.exists():
-                cache_path.unlink()
-                self.logger.debug(f"キャッシュファイルを削除: {cache_path}")
-                found = True
+            # キャッシュファイルを削除（旧形式を含む）
+            for cache_path in (self.get_cache_path(source_dir),
+                               self.get_legacy_cache_path(source_dir)):
+                if cache_path.exists():
+                    cache_path.unlink()
+                    self.logger.debug(f"キャッシュファイルを削除: {cache_path}")
+                    found = True
 
             # グローバルインデックスからも削除
             global_index = self.load_global_index()
@@ -427,9 +649,10 @@ class IndexCache:
         try:
             # キャッシュディレクトリ内のすべてのファイルを削除
             if self.cache_dir.exists():
-                for cache_file in self.cache_dir.glob('*.json'):
-                    cache_file.unlink()
-                    self.logger.debug(f"キャッシュファイルを削除: {cache_file}")
+                for pattern in ('*.json', '*.pickle'):
+                    for cache_file in self.cache_dir.glob(pattern):
+                        cache_file.unlink()
+                        self.logger.debug(f"キャッシュファイルを削除: {cache_file}")
 
             self.logger.info("すべてのキャッシュを削除しました")
 
@@ -572,8 +795,7 @@ class Indexer:
             processed_infos = self._process_files_parallel(files_to_process)
 
             # インデックスに追加
-            for info in processed_infos:
-                index.add(info)
+            index.add_many(processed_infos)
 
         self.logger.info(f"差分更新完了: 最終ファイル数={index.file_count}")
         return index
@@ -602,11 +824,7 @@ class Indexer:
         processed_infos = self._process_files_parallel(raw_files)
 
         # インデックスを構築
-        index = RawFileIndex()
-        for info in processed_infos:
-            index.add(info)
-
-        return index
+        return RawFileIndex.from_iterable(processed_infos)
 
     def _process_files_parallel(self, file_paths: List[Path],
                                 max_workers: int = 4) -> List[RawFileInfo]:
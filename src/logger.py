@@ -96,11 +96,11 @@ class ProgressLogger:
     def log_index_progress(self, files_found: int, files_processed: int, current_file: Optional[Path] = None):
         """インデックス構築時の進捗表示"""
         if self.config.verbose and current_file:
-            self.logger.info(f"処理中: {current_file.name}")
+            self.logger.info("処理中: %s", current_file.name)
         
         if files_found > 0:
             progress = (files_processed / files_found) * 100
-            self.logger.info(f"インデックス構築進捗: {files_processed}/{files_found} ({progress:.1f}%)")
+            self.logger.info("インデックス構築進捗: %d/%d (%.1f%%)", files_processed, files_found, progress)
     
     def log_index_complete(self, raw_files_count: int, processing_time: float):
         """インデックス構築完了のログ"""
@@ -119,11 +119,12 @@ class ProgressLogger:
     def log_matching_progress(self, jpeg_files_found: int, files_processed: int, matches_found: int, current_file: Optional[Path] = None):
         """マッチング時の進捗表示"""
         if self.config.verbose and current_file:
-            self.logger.info(f"処理中: {current_file.name}")
+            self.logger.info("処理中: %s", current_file.name)
         
         if jpeg_files_found > 0:
             progress = (files_processed / jpeg_files_found) * 100
-            self.logger.info(f"マッチング進捗: {files_processed}/{jpeg_files_found} ({progress:.1f}%) - マッチ数: {matches_found}")
+            self.logger.info("マッチング進捗: %d/%d (%.1f%%) - マッチ数: %d",
+                             files_processed, jpeg_files_found, progress, matches_found)
     
     def log_matching_complete(self, matches_found: int, processing_time: float):
         """マッチング処理完了のログ"""
@@ -138,11 +139,11 @@ class ProgressLogger:
     def log_copy_progress(self, total_files: int, files_processed: int, current_file: Optional[Path] = None):
         """コピー時の進捗表示"""
         if self.config.verbose and current_file:
-            self.logger.info(f"コピー中: {current_file.name}")
+            self.logger.info("コピー中: %s", current_file.name)
         
         if total_files > 0:
             progress = (files_processed / total_files) * 100
-            self.logger.info(f"コピー進捗: {files_processed}/{total_files} ({progress:.1f}%)")
+            self.logger.info("コピー進捗: %d/%d (%.1f%%)", files_processed, total_files, progress)
     
     def log_copy_complete(self, copy_result, processing_time: float):
         """コピー処理完了のログ"""
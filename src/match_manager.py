@@ -5,7 +5,9 @@ JPEGファイルに対応するRAWファイルの検索とコピー処理を管
 全インデックスからの検索、フィルタリング、マッチング、コピーの統合的な処理を提供します。
 """
 
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Optional
 
@@ -16,7 +18,13 @@ from .indexer import IndexCache, RawFileIndex
 from .logger import create_default_logger, get_default_log_file
 from .matcher import Matcher
 from .models import ProcessingStats
+from .path_validator import PathValidator
 
+# マッチング進捗を出力する間隔（ファイル数、2のべき乗）
+PROGRESS_LOG_INTERVAL = 128
+
+# マッチング処理の並列ワーカー数
+MATCH_MAX_WORKERS = 4
 
 
 class MatchManager:
@@ -45,44 +53,71 @@ class MatchManager:
         log_file = get_default_log_file() if verbose else None
         self.progress_logger = create_default_logger(verbose=verbose, log_file=log_file)
         
+        # ソースフィルターを正規化（キャッシュには解決済みの絶対パスで登録されている）
+        filter_path = PathValidator.normalize_path(source_filter) if source_filter else None
+        
         # 処理開始のログ
-        source_dirs = self._get_source_directories(source_filter)
+        source_dirs = self._get_source_directories(filter_path)
         self.progress_logger.log_processing_start(source_dirs, target_dir)
         
         try:
             # 1. 全インデックスの読み込み
-            global_index = self._load_global_index(source_filter)
+            global_index = self._load_global_index(filter_path)
             
             # 2. インデックス存在チェックと警告表示
-            if not self._check_index_availability(source_filter):
+            if not self._check_index_availability(filter_path):
                 return
             
-            # 3. JPEGファイルのスキャン
+            # 3. JPEGファイルのスキャンとマッチング処理
+            # スキャン完了を待たず、見つかったJPEGから順にマッチングを開始する
             self.progress_logger.log_info(f"JPEGファイルをスキャン中: {target_dir}")
-            jpeg_files = self.file_scanner.scan_jpeg_files(target_dir, recursive)
-            
-            if not jpeg_files:
-                self.progress_logger.log_info("JPEGファイルが見つかりませんでした。")
-                return
+            jpeg_iter = self.file_scanner.iter_jpeg_files(target_dir, recursive)
             
-            self.progress_logger.log_info(f"JPEGファイル発見: {len(jpeg_files)}個")
-            
-            # 4. マッチング処理
-            self.progress_logger.log_matching_start(target_dir, recursive)
             start_time = time.time()
             
-            matcher = Matcher(self.exif_reader, global_index)
-            matches = []
+            # Matcherの検索結果キャッシュはスレッドセーフではないため、ワーカーごとに作成する
+            # （同じキーのJPEGが別のワーカーに割り当てられた場合は、ワーカーごとに1回ずつ検索される）
+            # ExifReaderは共有する（キャッシュの競合は同じファイルを重複して読み取るだけで結果は変わらない）
+            worker_state = threading.local()
+            
+            def match_in_worker(jpeg_file: Path):
+                worker_matcher = getattr(worker_state, 'matcher', None)
+                if worker_matcher is None:
+                    worker_matcher = worker_state.matcher = Matcher(self.exif_reader, global_index)
+                return worker_matcher.find_matches([jpeg_file])
             
-            # 進捗表示付きでマッチング処理
-            for i, jpeg_file in enumerate(jpeg_files):
-                if verbose:
-                    self.progress_logger.log_matching_progress(
-                        len(jpeg_files), i, len(matches), jpeg_file
-                    )
+            with ThreadPoolExecutor(max_workers=MATCH_MAX_WORKERS) as executor:
+                pending = [
+                    (jpeg_file, executor.submit(match_in_worker, jpeg_file))
+                    for jpeg_file in jpeg_iter
+                ]
+                jpeg_files = [jpeg_file for jpeg_file, _ in pending]
+                
+                if not jpeg_files:
+                    self.progress_logger.log_info("JPEGファイルが見つかりませんでした。")
+                    return
+                
+                self.progress_logger.log_info(f"JPEGファイル発見: {len(jpeg_files)}個")
+                self.progress_logger.log_matching_start(target_dir, recursive)
                 
-                file_matches = matcher.find_matches([jpeg_file])
-                matches.extend(file_matches)
+                # 4. 完了した順に進捗を表示
+                total_jpeg = len(jpeg_files)
+                jpeg_by_future = {future: jpeg_file for jpeg_file, future in pending}
+                match_count = 0
+                for i, future in enumerate(as_completed(jpeg_by_future)):
+                    # 進捗ログは一定間隔と最後のファイルのみ出力
+                    if verbose and (i & (PROGRESS_LOG_INTERVAL - 1) == 0 or i == total_jpeg - 1):
+                        self.progress_logger.log_matching_progress(
+                            total_jpeg, i, match_count, jpeg_by_future[future]
+                        )
+                    
+                    match_count += len(future.result())
+            
+            # すべてのマッチング結果を収集
+            matches = [match for _, future in pending for match in future.result()]
+            
+            # スキャン順に依存しないようJPEGパス順に整列
+            matches.sort(key=lambda m: m.jpeg_path)
             
             # マッチング完了
             matching_time = time.time() - start_time
@@ -94,7 +129,7 @@ class MatchManager:
             
             # マッチング統計を表示
             if verbose:
-                stats = matcher.get_match_statistics(matches)
+                stats = Matcher(self.exif_reader, global_index).get_match_statistics(matches)
                 basename_datetime = stats['basename_and_datetime_matches']
                 basename_only = stats['basename_only_matches']
                 self.progress_logger.log_info(f"  ファイル名+日時マッチ: {basename_datetime}個")
@@ -130,12 +165,12 @@ class MatchManager:
                 print(f"エラー: {error_msg}")
             raise
     
-    def _get_source_directories(self, source_filter: Optional[str]) -> List[Path]:
+    def _get_source_directories(self, source_filter: Optional[Path]) -> List[Path]:
         """
         ソースディレクトリのリストを取得
         
         Args:
-            source_filter: 特定のソースディレクトリフィルター
+            source_filter: 特定のソースディレクトリフィルター（正規化済み）
             
         Returns:
             ソースディレクトリのリスト
@@ -144,38 +179,42 @@ class MatchManager:
         source_dirs = []
         
         for source_dir, _, _ in directories:
-            if source_filter and str(source_dir) != source_filter:
+            if source_filter and source_dir != source_filter:
                 continue
             source_dirs.append(source_dir)
         
         return source_dirs
     
-    def _load_global_index(self, source_filter: Optional[str]) -> RawFileIndex:
+    def _load_global_index(self, source_filter: Optional[Path]) -> RawFileIndex:
         """
         全インデックスを読み込み、統合されたインデックスを作成
         
         Args:
-            source_filter: 特定のソースディレクトリフィルター
+            source_filter: 特定のソースディレクトリフィルター（正規化済み）
             
         Returns:
             統合されたRAWファイルインデックス
         """
+        # ソースフィルターが指定されている場合は該当ディレクトリのみ直接読み込み
+        if source_filter:
+            dir_index = self.cache.load_directory_index(source_filter)
+            global_index = dir_index or RawFileIndex()
+            
+            if self.progress_logger:
+                self.progress_logger.log_info(f"グローバルインデックス作成完了: {global_index.file_count}ファイル")
+            return global_index
+        
         global_index = RawFileIndex()
         
         # 全ディレクトリのインデックスを読み込み
         directories = self.cache.list_indexed_directories()
         
         for source_dir, _, _ in directories:
-            # ソースフィルターが指定されている場合はチェック
-            if source_filter and str(source_dir) != source_filter:
-                continue
-            
             # ディレクトリのインデックスを読み込み
             dir_index = self.cache.load_directory_index(source_dir)
             if dir_index:
                 # グローバルインデックスに統合
-                for raw_info in dir_index.get_all_files():
-                    global_index.add(raw_info)
+                global_index.merge(dir_index)
                 
                 if self.progress_logger:
                     self.progress_logger.log_debug(f"インデックス読み込み: {source_dir} ({dir_index.file_count}ファイル)")
@@ -184,12 +223,12 @@ class MatchManager:
             self.progress_logger.log_info(f"グローバルインデックス作成完了: {global_index.file_count}ファイル")
         return global_index
     
-    def _check_index_availability(self, source_filter: Optional[str]) -> bool:
+    def _check_index_availability(self, source_filter: Optional[Path]) -> bool:
         """
         インデックスの利用可能性をチェックし、必要に応じて警告を表示
         
         Args:
-            source_filter: 特定のソースディレクトリフィルター
+            source_filter: 特定のソースディレクトリフィルター（正規化済み）
             
         Returns:
             インデックスが利用可能な場合True
@@ -202,11 +241,10 @@ class MatchManager:
         
         # ソースフィルターが指定されている場合
         if source_filter:
-            filter_path = Path(source_filter)
-            matching_dirs = [d for d, _, _ in directories if d == filter_path]
+            matching_dirs = [d for d, _, _ in directories if d == source_filter]
             
             if not matching_dirs:
-                self._display_index_warning([filter_path])
+                self._display_index_warning([source_filter])
                 return False
         
         return True
@@ -6,17 +6,28 @@ JPEGファイルに対応するRAWファイルを検索してマッチングす
 """
 
 import logging
+from dataclasses import replace
+from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from .exif_reader import ExifReader
 from .file_scanner import FileScanner
 from .indexer import RawFileIndex
-from .models import JpegFileInfo, MatchResult, RawFileInfo
+from .models import JpegFileInfo, MatchMethod, MatchResult, RawFileInfo
 
 
 class Matcher:
-    """JPEGファイルとRAWファイルをマッチングするクラス"""
+    """JPEGファイルとRAWファイルをマッチングするクラス
+
+    検索結果のキャッシュを保持するため、スレッドセーフではありません。
+    複数スレッドで使用する場合はスレッドごとにインスタンスを作成してください。
+
+    キャッシュはインスタンスの生存期間中保持され、上限はありません。
+    1回の処理（find_and_copy_matches）ごとにインスタンスを作成して使い捨ててください。
+    indexを差し替えた場合はキャッシュを破棄します。参照中のインデックスの内容を
+    直接変更した場合は検出できないため、新しいインスタンスを作成してください。
+    """
     
     def __init__(self, exif_reader: ExifReader, index: RawFileIndex):
         """
@@ -27,9 +38,23 @@ class Matcher:
             index: RAWファイルインデックス
         """
         self.exif_reader = exif_reader
-        self.index = index
         self.file_scanner = FileScanner()
         self.logger = logging.getLogger(__name__)
+        
+        # (ベース名, 撮影日時) ごとの検索結果（連写などで同じキーのJPEGは1回だけ検索）
+        self._group_results: Dict[Tuple[str, Optional[datetime]], Optional[MatchResult]] = {}
+        self.index = index
+    
+    @property
+    def index(self) -> RawFileIndex:
+        """検索対象のRAWファイルインデックス"""
+        return self._index
+    
+    @index.setter
+    def index(self, index: RawFileIndex) -> None:
+        # 古いインデックスに対する検索結果を使わないようにキャッシュを破棄
+        self._index = index
+        self._group_results.clear()
     
     def find_matches(self, jpeg_files: List[Path]) -> List[MatchResult]:
         """
@@ -42,6 +67,7 @@ class Matcher:
             マッチング結果のリスト
         """
         matches = []
+        group_results = self._group_results
         
         self.logger.info(f"マッチング開始: {len(jpeg_files)}個のJPEGファイル")
         
@@ -50,8 +76,15 @@ class Matcher:
                 # JPEGファイル情報を作成
                 jpeg_info = self._create_jpeg_info(jpeg_path)
                 
-                # マッチするRAWファイルを検索
-                match_result = self._find_matching_raw(jpeg_info)
+                # マッチするRAWファイルを検索（同じキーの結果があれば再利用）
+                key = (jpeg_info.basename, jpeg_info.capture_datetime)
+                if key in group_results:
+                    group_result = group_results[key]
+                    match_result = (replace(group_result, jpeg_path=jpeg_path)
+                                    if group_result else None)
+                else:
+                    match_result = self._find_matching_raw(jpeg_info)
+                    group_results[key] = match_result
                 
                 if match_result:
                     matches.append(match_result)
@@ -129,7 +162,7 @@ class Matcher:
                 return MatchResult(
                     jpeg_path=jpeg_info.path,
                     raw_path=selected_raw.path,
-                    match_method='basename_and_datetime'
+                    match_method=MatchMethod.BASENAME_AND_DATETIME
                 )
             else:
                 # 日時マッチがない場合の処理
@@ -155,7 +188,7 @@ class Matcher:
             return MatchResult(
                 jpeg_path=jpeg_info.path,
                 raw_path=selected_raw.path,
-                match_method='basename_only'
+                match_method=MatchMethod.BASENAME_ONLY
             )
     
     def get_match_statistics(self, matches: List[MatchResult]) -> dict:
@@ -168,11 +201,14 @@ class Matcher:
         Returns:
             統計情報の辞書
         """
-        basename_and_datetime_count = sum(1 for m in matches if m.match_method == 'basename_and_datetime')
-        basename_only_count = sum(1 for m in matches if m.match_method == 'basename_only')
+        # 1回の走査でマッチ方法ごとに集計（不明なマッチ方法は集計対象外）
+        counts = dict.fromkeys(MatchMethod, 0)
+        for m in matches:
+            if m.match_method in counts:
+                counts[m.match_method] += 1
         
         return {
             'total_matches': len(matches),
-            'basename_and_datetime_matches': basename_and_datetime_count,
-            'basename_only_matches': basename_only_count
+            'basename_and_datetime_matches': counts[MatchMethod.BASENAME_AND_DATETIME],
+            'basename_only_matches': counts[MatchMethod.BASENAME_ONLY]
         }
\ No newline at end of file
@@ -6,6 +6,7 @@ RAW-JPEG Matcher Toolで使用するデータクラスを定義します。
 
 from dataclasses import dataclass
 from datetime import datetime
+from enum import Enum
 from pathlib import Path
 from typing import List, Optional, Tuple
 
@@ -27,12 +28,29 @@ class JpegFileInfo:
     capture_datetime: Optional[datetime]
 
 
+class MatchMethod(str, Enum):
+    """マッチング方法（文字列としても比較可能）"""
+    BASENAME_AND_DATETIME = 'basename_and_datetime'
+    BASENAME_ONLY = 'basename_only'
+
+    def __str__(self) -> str:
+        return self.value
+
+
 @dataclass
 class MatchResult:
     """マッチング結果"""
     jpeg_path: Path
     raw_path: Path
-    match_method: str  # 'basename_and_datetime' or 'basename_only'
+    match_method: MatchMethod
+
+    def __post_init__(self):
+        # 文字列で指定されたマッチング方法をMatchMethodに変換
+        if not isinstance(self.match_method, MatchMethod):
+            try:
+                self.match_method = MatchMethod(self.match_method)
+            except ValueError:
+                raise ValueError(f"不明なマッチング方法です: {self.match_method!r}") from None
 
 
 @dataclass
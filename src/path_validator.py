@@ -6,15 +6,23 @@
 
 import os
 import shutil
+import time
 from pathlib import Path
-from typing import Optional
+from typing import ClassVar, Dict, Optional
 
 from .exceptions import ValidationError
 
 
+# ディスク使用量のキャッシュ有効期間（秒）。空き容量は変化するため短時間のみ再利用する
+_DISK_USAGE_TTL = 1.0
+
+
 class PathValidator:
     """パス検証を行うユーティリティクラス"""
     
+    # ファイルシステム（デバイス番号）ごとのディスク使用量: device -> (取得時刻, shutil.disk_usageの結果)
+    _disk_usage_cache: ClassVar[Dict[int, tuple[float, tuple[int, int, int]]]] = {}
+    
     @staticmethod
     def validate_directory(path: Path) -> None:
         """
@@ -83,10 +91,16 @@ class PathValidator:
             
         Returns:
             十分な空き容量がある場合True
+        
+        Note:
+            空き容量は同じファイルシステムに対して最大 _DISK_USAGE_TTL 秒間キャッシュされるため、
+            大量のコピー直後は実際より多い空き容量が報告される場合があります。
+            コピー直前の判定を行うCopier._check_disk_spaceはこのキャッシュを使わず、
+            毎回shutil.disk_usageを呼び出します。
         """
         try:
             # ディスクの使用量情報を取得
-            total, used, free = shutil.disk_usage(path)
+            total, used, free = PathValidator._disk_usage(path)
             return free >= required_bytes
         except (OSError, ValueError):
             # エラーが発生した場合は安全側に倒してFalseを返す
@@ -101,10 +115,36 @@ class PathValidator:
             path: 確認するディレクトリパス
             
         Returns:
-            (total, used, free) のタプル（バイト単位）、
+            shutil.disk_usageの結果（total, used, free の名前付きタプル、バイト単位）、
             エラーの場合はNone
         """
         try:
-            return shutil.disk_usage(path)
+            return PathValidator._disk_usage(path)
         except (OSError, ValueError):
-            return None
\ No newline at end of file
+            return None
+    
+    @staticmethod
+    def _disk_usage(path: Path) -> tuple[int, int, int]:
+        """
+        ディスクの使用量情報を取得（ファイルシステムごとに短時間キャッシュ）
+        
+        Args:
+            path: 確認するディレクトリパス
+            
+        Returns:
+            shutil.disk_usageの結果（total, used, free の名前付きタプル、バイト単位）
+            
+        Raises:
+            OSError: 使用量情報を取得できない場合
+        """
+        # 同じファイルシステム上のパスは同じ結果になるため、デバイス番号をキーにする
+        device = os.stat(path).st_dev
+        now = time.monotonic()
+        
+        cached = PathValidator._disk_usage_cache.get(device)
+        if cached is not None and now - cached[0] < _DISK_USAGE_TTL:
+            return cached[1]
+        
+        usage = shutil.disk_usage(path)
+        PathValidator._disk_usage_cache[device] = (now, usage)
+        return usage
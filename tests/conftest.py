@@ -0,0 +1,69 @@
+"""
+pytestの共通設定
+
+Hypothesisのプロファイルを登録し、環境変数 HYPOTHESIS_PROFILE で切り替えられるようにします。
+（dev: ローカル開発用、ci: CI用、nightly: 定期実行用）
+ciプロファイルは乱数を固定し、同じコードに対して毎回同じ例を生成します。
+また、インデックスキャッシュの保存先をワーカーごとに分離し、pytest-xdist での並列実行を可能にします。
+プロパティテストは CPU 負荷が高く互いに独立しているため、``pytest -m property -n auto`` での並列実行を推奨します。
+"""
+
+import logging
+import os
+from pathlib import Path
+
+import pytest
+from hypothesis import HealthCheck, settings
+
+
+# 全プロファイル共通の設定（ファイルシステムを使う例が遅いことによるヘルスチェック失敗を抑制）
+_COMMON_SETTINGS = {"deadline": None, "suppress_health_check": [HealthCheck.too_slow]}
+
+# pytest-xdist のワーカーでは例データベース（.hypothesis/examples）を使用せず、ワーカー間のロック競合を避ける
+if os.environ.get("PYTEST_XDIST_WORKER"):
+    _COMMON_SETTINGS["database"] = None
+
+settings.register_profile("dev", max_examples=25, **_COMMON_SETTINGS)
+settings.register_profile("ci", max_examples=100, derandomize=True, **_COMMON_SETTINGS)
+settings.register_profile("nightly", max_examples=500, **_COMMON_SETTINGS)
+settings.load_profile(os.environ.get("HYPOTHESIS_PROFILE", "dev"))
+
+
+def pytest_configure(config):
+    """カスタムマーカーを登録（--strict-markers のため必須）"""
+    config.addinivalue_line(
+        "markers", "property: Hypothesisによるプロパティベーステスト（pytest -m property -n auto で並列実行を推奨）"
+    )
+
+
+@pytest.fixture(scope="module")
+def quiet_logs():
+    """モジュール内のログ出力を一括で抑制（テストごとのロガーレベル変更を不要にする）
+
+    ログ内容を検証するテストもあるため autouse にはせず、必要なモジュールで
+    ``pytestmark = pytest.mark.usefixtures("quiet_logs")`` として指定します。
+    """
+    logging.disable(logging.CRITICAL)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+@pytest.fixture(scope="session")
+def worker_home(tmp_path_factory) -> Path:
+    """ワーカー専用のホームディレクトリ（pytest-xdist 未使用時は gw0 として扱う）"""
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    home = tmp_path_factory.getbasetemp() / f"home-{worker_id}"
+    home.mkdir(exist_ok=True)
+    return home
+
+
+@pytest.fixture
+def isolated_home(worker_home: Path, monkeypatch) -> Path:
+    """インデックスキャッシュ（~/.raw_jpeg_matcher）の保存先をワーカー専用ディレクトリに切り替える
+
+    あるワーカーでの clear_cache が他のワーカーや実際のホームディレクトリの
+    キャッシュを消さないようにします。
+    """
+    monkeypatch.setenv("HOME", str(worker_home))
+    monkeypatch.setenv("USERPROFILE", str(worker_home))  # Windows
+    return worker_home
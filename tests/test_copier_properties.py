@@ -4,42 +4,96 @@ Copierのプロパティベーステスト
 Property 7: ファイルコピーの保存性を検証します。
 """
 
+import os
 import tempfile
 import shutil
 from pathlib import Path
+import pytest
 from hypothesis import given, strategies as st
-from hypothesis import settings
 import hashlib
 
+try:
+    import xxhash
+except ImportError:  # xxhashは任意依存
+    xxhash = None
+
 from src.models import MatchResult
 from src.copier import Copier
 
 
+pytestmark = pytest.mark.property
+
+
+@pytest.fixture(autouse=True, scope="module")
+def zero_copy_enabled():
+    """Copierが使用するshutilのカーネル内コピー（sendfile）が有効であることを確認"""
+    if hasattr(os, "sendfile") and hasattr(shutil, "_USE_CP_SENDFILE"):
+        assert shutil._USE_CP_SENDFILE, "shutilのsendfileによる高速コピーが無効です"
+
+
+@pytest.fixture(scope="module")
+def copier():
+    """テスト間で共有するCopier（状態を持たないため再利用可能）"""
+    return Copier()
+
+
+@pytest.fixture(scope="module")
+def copy_dirs(tmp_path_factory):
+    """source/targetディレクトリを一度だけ作成し、各例で再利用する"""
+    base = tmp_path_factory.mktemp("copy")
+    source_dir = base / "source"
+    target_dir = base / "target"
+    source_dir.mkdir()
+    target_dir.mkdir()
+    return source_dir, target_dir
+
+
+@pytest.fixture(scope="session")
+def target_dir(tmp_path_factory):
+    """異常系テストで共有するコピー先ディレクトリ（ファイルはコピーされない）"""
+    return tmp_path_factory.mktemp("target")
+
+
+def clear_directory(directory: Path) -> None:
+    """ディレクトリ直下のファイルを削除（rmtreeによる再作成より安価）"""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            os.unlink(entry.path)
+
+
+# 内容の変化検出のみが目的のため、利用可能なら非暗号学的で高速なxxh3を使用
+_HASH_FACTORY = xxhash.xxh3_64 if xxhash is not None else hashlib.blake2b
+
+
 def calculate_file_hash(file_path: Path) -> str:
     """ファイルのハッシュ値を計算"""
-    hash_md5 = hashlib.md5()
     with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            hash_md5.update(chunk)
-    return hash_md5.hexdigest()
+        # Python 3.11以降は読み込みループをC実装に任せる
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, _HASH_FACTORY).hexdigest()
+        
+        # 事前確保したバッファに読み込み、チャンクごとのbytes生成を避ける
+        hasher = _HASH_FACTORY()
+        buf = bytearray(1 << 20)
+        view = memoryview(buf)
+        while n := f.readinto(view):
+            hasher.update(view[:n])
+        return hasher.hexdigest()
 
 
 @st.composite
 def file_copy_scenario_strategy(draw):
     """ファイルコピーのテストシナリオを生成するストラテジー"""
     # ファイル名を生成
+    # 英数字のみのアルファベットを使用（ファイル名として不正な文字を含まないため除外フィルター不要）
     basename = draw(st.text(
-        alphabet=st.characters(
-            whitelist_categories=('Lu', 'Ll', 'Nd'),
-            min_codepoint=32,
-            max_codepoint=126
-        ),
+        alphabet="abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789",
         min_size=1,
         max_size=20
-    ).filter(lambda x: x.strip() and not any(c in x for c in '<>:"|?*')))
+    ))
     
     # ファイル内容を生成（バイナリデータ）
-    file_content = draw(st.binary(min_size=100, max_size=10000))
+    file_content = draw(st.binary(min_size=0, max_size=256))
     
     # RAW拡張子を選択
     raw_extension = draw(st.sampled_from(['.CR2', '.NEF', '.ARW', '.RAF', '.ORF']))
@@ -51,275 +105,148 @@ def file_copy_scenario_strategy(draw):
     }
 
 
-@settings(max_examples=100)
-@given(file_copy_scenario_strategy())
-def test_file_copy_preservation_property(scenario):
+@given(st.lists(
+    file_copy_scenario_strategy(),
+    min_size=1,
+    max_size=20,
+    unique_by=lambda scenario: scenario['basename'].lower()  # コピー先での名前衝突を避ける
+))
+def test_multiple_files_copy_preservation_property(copy_dirs, copier, files_data):
     """
     **Feature: raw-jpeg-matcher, Property 7: ファイルコピーの保存性**
     **検証対象: 要件 5.1, 5.2**
 
     任意のターゲットディレクトリにコピーされたマッチしたRAWファイルに対して、
     コピーされたファイルは元のファイルと同じファイル名と同じファイル内容を持つべきである。
+    複数ファイルを1回のcopy_filesでまとめてコピーし、例ごとの準備コストを分散します。
     """
-    # テストデータを取得
-    basename = scenario['basename']
-    file_content = scenario['file_content']
-    raw_extension = scenario['raw_extension']
+    # 共有ディレクトリを前の例の残りファイルを削除して再利用
+    source_dir, target_dir = copy_dirs
+    clear_directory(source_dir)
+    clear_directory(target_dir)
     
-    # 一時ディレクトリを作成
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        source_dir = temp_path / "source"
-        target_dir = temp_path / "target"
-        
-        source_dir.mkdir()
-        target_dir.mkdir()
-        
-        # ソースファイルを作成
-        jpeg_filename = f"{basename}.jpg"
-        raw_filename = f"{basename}{raw_extension}"
-        
-        jpeg_path = source_dir / jpeg_filename
-        raw_path = source_dir / raw_filename
+    # ループ内のパス組み立ては文字列で行い、Pathへの変換はMatchResult作成時のみとする
+    source_str = str(source_dir)
+    target_str = str(target_dir)
+    
+    matches = []
+    
+    # ソースファイルを作成
+    for file_data in files_data:
+        basename = file_data['basename']
+        file_content = file_data['file_content']
+        raw_extension = file_data['raw_extension']
         
-        # ファイル内容を書き込み
-        jpeg_path.write_bytes(b"fake jpeg content")
-        raw_path.write_bytes(file_content)
+        raw_path = f"{source_str}/{basename}{raw_extension}"
         
-        # 元ファイルのハッシュ値を計算
-        original_hash = calculate_file_hash(raw_path)
-        original_size = raw_path.stat().st_size
+        # RAWのみ作成（CopierはJPEGファイルを参照しないため作成不要）
+        with open(raw_path, "wb") as f:
+            f.write(file_content)
         
         # MatchResultを作成
         match = MatchResult(
-            jpeg_path=jpeg_path,
-            raw_path=raw_path,
+            jpeg_path=Path(f"{source_str}/{basename}.jpg"),
+            raw_path=Path(raw_path),
             match_method='basename_and_datetime'
         )
-        
-        # Copierを作成してコピー実行
-        copier = Copier()
-        result = copier.copy_files([match], target_dir)
-        
-        # プロパティ検証: ファイルコピーの保存性
-        
-        # 1. コピーが成功している
-        assert result.success == 1, f"コピーが失敗しました: success={result.success}, errors={result.errors}"
-        assert result.failed == 0, f"コピーエラーが発生しました: failed={result.failed}, errors={result.errors}"
-        
-        # 2. コピー先ファイルが存在する
-        copied_file_path = target_dir / raw_filename
-        assert copied_file_path.exists(), f"コピー先ファイルが存在しません: {copied_file_path}"
-        
-        # 3. ファイル名が保持されている
-        assert copied_file_path.name == raw_filename, f"ファイル名が保持されていません: 期待={raw_filename}, 実際={copied_file_path.name}"
-        
-        # 4. ファイル内容が同じ（ハッシュ値で比較）
-        copied_hash = calculate_file_hash(copied_file_path)
-        assert copied_hash == original_hash, f"ファイル内容が異なります: 元={original_hash}, コピー={copied_hash}"
-        
-        # 5. ファイルサイズが同じ
-        copied_size = copied_file_path.stat().st_size
-        assert copied_size == original_size, f"ファイルサイズが異なります: 元={original_size}, コピー={copied_size}"
-
-
-@st.composite
-def multiple_files_scenario_strategy(draw):
-    """複数ファイルのコピーシナリオを生成するストラテジー"""
-    # ファイル数を生成
-    num_files = draw(st.integers(min_value=1, max_value=5))
+        matches.append(match)
     
-    files = []
-    for i in range(num_files):
-        basename = draw(st.text(
-            alphabet=st.characters(
-                whitelist_categories=('Lu', 'Ll', 'Nd'),
-                min_codepoint=32,
-                max_codepoint=126
-            ),
-            min_size=1,
-            max_size=15
-        ).filter(lambda x: x.strip() and not any(c in x for c in '<>:"|?*')))
-        
-        # 重複を避けるためにインデックスを追加
-        unique_basename = f"{basename}_{i}"
-        
-        file_content = draw(st.binary(min_size=50, max_size=5000))
-        raw_extension = draw(st.sampled_from(['.CR2', '.NEF', '.ARW']))
-        
-        files.append({
-            'basename': unique_basename,
-            'file_content': file_content,
-            'raw_extension': raw_extension
-        })
+    # コピー実行
+    result = copier.copy_files(matches, target_dir)
     
-    return files
-
-
-@settings(max_examples=50)
-@given(multiple_files_scenario_strategy())
-def test_multiple_files_copy_preservation_property(files_data):
-    """
-    **Feature: raw-jpeg-matcher, Property 7: ファイルコピーの保存性**
-    **検証対象: 要件 5.1, 5.2**
-
-    複数ファイルのコピーでも保存性が維持されることを検証します。
-    """
-    # 一時ディレクトリを作成
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        source_dir = temp_path / "source"
-        target_dir = temp_path / "target"
-        
-        source_dir.mkdir()
-        target_dir.mkdir()
-        
-        matches = []
-        original_hashes = {}
+    # プロパティ検証: 複数ファイルの保存性
+    
+    # 1. すべてのファイルがコピーされている
+    assert result.success == len(files_data), f"コピー数が期待と異なります: 期待={len(files_data)}, 実際={result.success}"
+    assert result.failed == 0, f"コピーエラーが発生しました: failed={result.failed}, errors={result.errors}"
+    
+    # 2. 各ファイルの保存性を検証
+    for file_data in files_data:
+        basename = file_data['basename']
+        raw_extension = file_data['raw_extension']
+        raw_filename = f"{basename}{raw_extension}"
         
-        # ソースファイルを作成
-        for file_data in files_data:
-            basename = file_data['basename']
-            file_content = file_data['file_content']
-            raw_extension = file_data['raw_extension']
-            
-            jpeg_filename = f"{basename}.jpg"
-            raw_filename = f"{basename}{raw_extension}"
-            
-            jpeg_path = source_dir / jpeg_filename
-            raw_path = source_dir / raw_filename
-            
-            # ファイル内容を書き込み
-            jpeg_path.write_bytes(b"fake jpeg content")
-            raw_path.write_bytes(file_content)
-            
-            # 元ファイルのハッシュ値を記録
-            original_hashes[raw_filename] = calculate_file_hash(raw_path)
-            
-            # MatchResultを作成
-            match = MatchResult(
-                jpeg_path=jpeg_path,
-                raw_path=raw_path,
-                match_method='basename_and_datetime'
-            )
-            matches.append(match)
+        copied_file_path = f"{target_str}/{raw_filename}"
         
-        # Copierを作成してコピー実行
-        copier = Copier()
-        result = copier.copy_files(matches, target_dir)
+        # ファイルが存在する
+        assert os.path.exists(copied_file_path), f"コピー先ファイルが存在しません: {copied_file_path}"
         
-        # プロパティ検証: 複数ファイルの保存性
+        # ファイル名が保持されている
+        copied_name = os.path.basename(copied_file_path)
+        assert copied_name == raw_filename, f"ファイル名が保持されていません: 期待={raw_filename}, 実際={copied_name}"
         
-        # 1. すべてのファイルがコピーされている
-        assert result.success == len(files_data), f"コピー数が期待と異なります: 期待={len(files_data)}, 実際={result.success}"
-        assert result.failed == 0, f"コピーエラーが発生しました: failed={result.failed}, errors={result.errors}"
+        # ファイルサイズと更新日時が同じ（copy2はmtimeを保持するため、statのみで安価に比較）
+        raw_path = f"{source_str}/{raw_filename}"
+        source_stat = os.stat(raw_path)
+        copied_stat = os.stat(copied_file_path)
+        assert copied_stat.st_size == source_stat.st_size, f"ファイルサイズが異なります: {raw_filename}"
+        assert copied_stat.st_mtime_ns == source_stat.st_mtime_ns, f"更新日時が保持されていません: {raw_filename}"
         
-        # 2. 各ファイルの保存性を検証
-        for file_data in files_data:
-            basename = file_data['basename']
-            raw_extension = file_data['raw_extension']
-            raw_filename = f"{basename}{raw_extension}"
-            
-            copied_file_path = target_dir / raw_filename
-            
-            # ファイルが存在する
-            assert copied_file_path.exists(), f"コピー先ファイルが存在しません: {copied_file_path}"
-            
-            # ファイル内容が同じ
-            copied_hash = calculate_file_hash(copied_file_path)
-            original_hash = original_hashes[raw_filename]
-            assert copied_hash == original_hash, f"ファイル内容が異なります: {raw_filename}"
-
-
-@st.composite
-def existing_file_scenario_strategy(draw):
-    """既存ファイルがある場合のシナリオを生成するストラテジー"""
-    basename = draw(st.text(
-        alphabet=st.characters(
-            whitelist_categories=('Lu', 'Ll', 'Nd'),
-            min_codepoint=32,
-            max_codepoint=126
-        ),
-        min_size=1,
-        max_size=20
-    ).filter(lambda x: x.strip() and not any(c in x for c in '<>:"|?*')))
-    
-    # 元ファイルと既存ファイルの内容を生成
-    original_content = draw(st.binary(min_size=100, max_size=5000))
-    existing_content = draw(st.binary(min_size=100, max_size=5000))
-    
-    raw_extension = draw(st.sampled_from(['.CR2', '.NEF', '.ARW']))
-    
-    return {
-        'basename': basename,
-        'original_content': original_content,
-        'existing_content': existing_content,
-        'raw_extension': raw_extension
-    }
+        # ファイル内容が同じ（メモリ上の元データと比較し、ハッシュは不一致時のメッセージ作成にのみ使用）
+        with open(copied_file_path, "rb") as f:
+            copied_content = f.read()
+        assert copied_content == file_data['file_content'], (
+            f"ファイル内容が異なります: {raw_filename} "
+            f"(元={calculate_file_hash(raw_path)}, コピー先={calculate_file_hash(copied_file_path)})"
+        )
 
 
-@settings(max_examples=50)
-@given(existing_file_scenario_strategy())
-def test_existing_file_skip_property(scenario):
+@pytest.mark.parametrize("original_content,existing_content,raw_extension", [
+    (b"A" * 100, b"B" * 100, '.CR2'),
+    (b"x", b"y", '.NEF'),
+    (b"", b"z", '.ARW'),
+])
+def test_existing_file_skip_property(copy_dirs, copier, original_content, existing_content, raw_extension):
     """
     既存ファイルのスキップ処理をテスト
     
     これは保存性プロパティの補完テストです。
     """
-    # テストデータを取得
-    basename = scenario['basename']
-    original_content = scenario['original_content']
-    existing_content = scenario['existing_content']
-    raw_extension = scenario['raw_extension']
+    basename = "IMG_0001"
     
-    # 一時ディレクトリを作成
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        source_dir = temp_path / "source"
-        target_dir = temp_path / "target"
-        
-        source_dir.mkdir()
-        target_dir.mkdir()
-        
-        # ソースファイルを作成
-        jpeg_filename = f"{basename}.jpg"
-        raw_filename = f"{basename}{raw_extension}"
-        
-        jpeg_path = source_dir / jpeg_filename
-        raw_path = source_dir / raw_filename
-        
-        jpeg_path.write_bytes(b"fake jpeg content")
-        raw_path.write_bytes(original_content)
-        
-        # ターゲットディレクトリに既存ファイルを作成
-        existing_file_path = target_dir / raw_filename
-        existing_file_path.write_bytes(existing_content)
-        existing_hash = calculate_file_hash(existing_file_path)
-        
-        # MatchResultを作成
-        match = MatchResult(
-            jpeg_path=jpeg_path,
-            raw_path=raw_path,
-            match_method='basename_and_datetime'
-        )
-        
-        # Copierを作成してコピー実行
-        copier = Copier()
-        result = copier.copy_files([match], target_dir)
-        
-        # プロパティ検証: 既存ファイルのスキップ
-        
-        # 1. ファイルがスキップされている
-        assert result.skipped == 1, f"ファイルがスキップされませんでした: skipped={result.skipped}"
-        assert result.success == 0, f"既存ファイルが上書きされました: success={result.success}"
-        assert result.failed == 0, f"予期しないエラーが発生しました: failed={result.failed}"
-        
-        # 2. 既存ファイルの内容が保持されている
-        final_hash = calculate_file_hash(existing_file_path)
-        assert final_hash == existing_hash, f"既存ファイルの内容が変更されました"
+    # 共有ディレクトリを前の例の残りファイルを削除して再利用
+    source_dir, target_dir = copy_dirs
+    clear_directory(source_dir)
+    clear_directory(target_dir)
+    
+    # ソースファイルを作成
+    jpeg_filename = f"{basename}.jpg"
+    raw_filename = f"{basename}{raw_extension}"
+    
+    jpeg_path = source_dir / jpeg_filename
+    raw_path = source_dir / raw_filename
+    
+    # RAWのみ作成（CopierはJPEGファイルを参照しないため作成不要）
+    raw_path.write_bytes(original_content)
+    
+    # ターゲットディレクトリに既存ファイルを作成
+    existing_file_path = target_dir / raw_filename
+    existing_file_path.write_bytes(existing_content)
+    existing_hash = calculate_file_hash(existing_file_path)
+    
+    # MatchResultを作成
+    match = MatchResult(
+        jpeg_path=jpeg_path,
+        raw_path=raw_path,
+        match_method='basename_and_datetime'
+    )
+    
+    # コピー実行
+    result = copier.copy_files([match], target_dir)
+    
+    # プロパティ検証: 既存ファイルのスキップ
+    
+    # 1. ファイルがスキップされている
+    assert result.skipped == 1, f"ファイルがスキップされませんでした: skipped={result.skipped}"
+    assert result.success == 0, f"既存ファイルが上書きされました: success={result.success}"
+    assert result.failed == 0, f"予期しないエラーが発生しました: failed={result.failed}"
+    
+    # 2. 既存ファイルの内容が保持されている
+    final_hash = calculate_file_hash(existing_file_path)
+    assert final_hash == existing_hash, f"既存ファイルの内容が変更されました"
 
 
-def test_copier_basic_functionality():
+def test_copier_basic_functionality(copier):
     """Copierの基本機能テスト"""
     # 一時ディレクトリを作成
     with tempfile.TemporaryDirectory() as temp_dir:
@@ -344,8 +271,7 @@ def test_copier_basic_functionality():
             match_method='basename_and_datetime'
         )
         
-        # Copierを作成してコピー実行
-        copier = Copier()
+        # コピー実行
         result = copier.copy_files([match], target_dir)
         
         # 結果を検証
@@ -360,30 +286,23 @@ def test_copier_basic_functionality():
         assert copied_file.read_bytes() == b"fake raw content"
 
 
-def test_copier_nonexistent_source():
+def test_copier_nonexistent_source(copier, target_dir):
     """存在しないソースファイルの処理テスト"""
-    # 一時ディレクトリを作成
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        target_dir = temp_path / "target"
-        target_dir.mkdir()
-        
-        # 存在しないファイルパス
-        nonexistent_jpeg = Path("/nonexistent/test.jpg")
-        nonexistent_raw = Path("/nonexistent/test.CR2")
-        
-        # MatchResultを作成
-        match = MatchResult(
-            jpeg_path=nonexistent_jpeg,
-            raw_path=nonexistent_raw,
-            match_method='basename_and_datetime'
-        )
-        
-        # Copierを作成してコピー実行
-        copier = Copier()
-        result = copier.copy_files([match], target_dir)
-        
-        # 結果を検証（失敗として処理される）
-        assert result.success == 0
-        assert result.skipped == 0
-        assert result.failed == 1
\ No newline at end of file
+    # 存在しないファイルパス
+    nonexistent_jpeg = Path("/nonexistent/test.jpg")
+    nonexistent_raw = Path("/nonexistent/test.CR2")
+    
+    # MatchResultを作成
+    match = MatchResult(
+        jpeg_path=nonexistent_jpeg,
+        raw_path=nonexistent_raw,
+        match_method='basename_and_datetime'
+    )
+    
+    # コピー実行
+    result = copier.copy_files([match], target_dir)
+    
+    # 結果を検証（失敗として処理される）
+    assert result.success == 0
+    assert result.skipped == 0
+    assert result.failed == 1
\ No newline at end of file
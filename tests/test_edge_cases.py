@@ -9,6 +9,7 @@ import os
 import shutil
 import tempfile
 import unittest
+from dataclasses import replace
 from pathlib import Path
 from unittest.mock import Mock, patch, mock_open
 
@@ -21,17 +22,44 @@ from src.models import MatchResult, RawFileInfo, JpegFileInfo
 from src.indexer import RawFileIndex
 
 
+# 複数のテストで共有するパス定数
+_DUMMY_JPEG_PATH = Path("dummy.jpg")
+_TEST_RAW_PATH = Path("test.cr2")
+_NONEXISTENT_DIR = Path("/nonexistent/directory")
+
+# モジュール全体で共有する一時ルートディレクトリ
+_temp_root = None
+
+
+def setUpModule():
+    """モジュール共通の一時ルートディレクトリを作成（並列実行時はワーカーごとに別ディレクトリ）"""
+    global _temp_root
+    _temp_root = Path(tempfile.mkdtemp(prefix=f"ut_{os.getpid()}_"))
+
+
+def tearDownModule():
+    """モジュール共通の一時ルートディレクトリを一括削除"""
+    shutil.rmtree(_temp_root, ignore_errors=True)
+
+
+def _create_test_dir() -> Path:
+    """共通ルート配下にテストごとの一時ディレクトリを作成"""
+    return Path(tempfile.mkdtemp(dir=_temp_root))
+
+
 class TestExifReaderEdgeCases(unittest.TestCase):
     """ExifReaderのエッジケーステスト"""
     
+    @classmethod
+    def setUpClass(cls):
+        """クラス共通のExifReaderを作成（ExifToolの検出は1回のみ）"""
+        cls.shared_exif_reader = ExifReader()
+    
     def setUp(self):
         """テスト前の準備"""
-        self.exif_reader = ExifReader()
-        self.temp_dir = Path(tempfile.mkdtemp())
-    
-    def tearDown(self):
-        """テスト後のクリーンアップ"""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        self.exif_reader = self.shared_exif_reader
+        self.exif_reader.clear_cache()
+        self.temp_dir = _create_test_dir()
     
     def test_missing_exif_data_file(self):
         """Exifデータが欠落しているファイルの処理テスト（要件 3.4）"""
@@ -87,21 +115,17 @@ class TestExifReaderEdgeCases(unittest.TestCase):
         protected_file = self.temp_dir / "protected.jpg"
         protected_file.write_bytes(b"fake jpeg data")
         
-        # ファイルの読み取り権限を削除
-        protected_file.chmod(0o000)
-        
-        try:
+        # ExifToolによる読み取りで権限エラーが発生するようにモック
+        # （chmodはroot実行時に効かないため、読み取り処理側でエラーを発生させる）
+        with patch.object(self.exif_reader, '_run_exiftool', side_effect=PermissionError("Permission denied")):
             # 権限エラーが適切に処理されることを確認
-            # _extract_datetime_from_file内でファイルオープンエラーがキャッチされてNoneが返される
+            # _extract_datetime_with_exiftool内でエラーがキャッチされてNoneが返される
             result = self.exif_reader.read_capture_datetime(protected_file)
-            self.assertIsNone(result)
-            
-            # キャッシュにNoneが保存されることを確認
-            self.assertTrue(self.exif_reader.is_cached(protected_file))
-            self.assertIsNone(self.exif_reader.cache[protected_file])
-        finally:
-            # テスト後に権限を復元
-            protected_file.chmod(0o644)
+        self.assertIsNone(result)
+        
+        # キャッシュにNoneが保存されることを確認
+        self.assertTrue(self.exif_reader.is_cached(protected_file))
+        self.assertIsNone(self.exif_reader.cache[protected_file])
     
     def test_file_stat_error(self):
         """ファイル統計情報取得エラーのテスト"""
@@ -124,32 +148,37 @@ class TestCopierEdgeCases(unittest.TestCase):
     def setUp(self):
         """テスト前の準備"""
         self.copier = Copier()
-        self.temp_dir = Path(tempfile.mkdtemp())
+        self.temp_dir = _create_test_dir()
+        # ディレクトリは必要なテストでのみ作成（ターゲットはcopy_filesが作成する）
         self.source_dir = self.temp_dir / "source"
         self.target_dir = self.temp_dir / "target"
-        self.source_dir.mkdir()
-        self.target_dir.mkdir()
     
-    def tearDown(self):
-        """テスト後のクリーンアップ"""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    def _ensure_source(self) -> Path:
+        """ソースディレクトリを作成して返す"""
+        self.source_dir.mkdir(exist_ok=True)
+        return self.source_dir
+    
+    def _make_match(self, raw_path: Path) -> MatchResult:
+        """コピー対象のRAWファイルに対するマッチ結果を作成（JPEGパスはCopierが参照しないためダミー）"""
+        return MatchResult(
+            jpeg_path=_DUMMY_JPEG_PATH,
+            raw_path=raw_path,
+            match_method="basename_and_datetime"
+        )
     
     def test_existing_file_in_target_directory(self):
         """ターゲットディレクトリに既存ファイルがある場合のテスト（要件 5.3）"""
         # ソースファイルを作成
-        source_file = self.source_dir / "test.cr2"
+        source_file = self._ensure_source() / "test.cr2"
         source_file.write_bytes(b"raw file data")
         
         # ターゲットディレクトリに同名ファイルを作成
+        self.target_dir.mkdir()
         target_file = self.target_dir / "test.cr2"
         target_file.write_bytes(b"existing file")
         
         # マッチ結果を作成
-        match = MatchResult(
-            jpeg_path=Path("dummy.jpg"),
-            raw_path=source_file,
-            match_method="basename_and_datetime"
-        )
+        match = self._make_match(source_file)
         
         # コピー実行
         result = self.copier.copy_files([match], self.target_dir)
@@ -165,19 +194,18 @@ class TestCopierEdgeCases(unittest.TestCase):
     def test_disk_space_insufficient(self):
         """ディスク容量不足のテスト（要件 8.3）"""
         # ソースファイルを作成
-        source_file = self.source_dir / "large.cr2"
+        source_file = self._ensure_source() / "large.cr2"
         source_file.write_bytes(b"raw file data")
         
         # マッチ結果を作成
-        match = MatchResult(
-            jpeg_path=Path("dummy.jpg"),
-            raw_path=source_file,
-            match_method="basename_and_datetime"
-        )
+        match = self._make_match(source_file)
         
-        # ディスク容量チェックが失敗するようにモック
-        with patch.object(self.copier, '_check_disk_space', return_value=False):
+        # ディスク容量チェックが失敗するようにインスタンス属性で差し替え
+        self.copier._check_disk_space = lambda *args, **kwargs: False
+        try:
             result = self.copier.copy_files([match], self.target_dir)
+        finally:
+            del self.copier._check_disk_space
         
         # ディスク容量不足で失敗することを確認
         self.assertEqual(result.success, 0)
@@ -187,19 +215,22 @@ class TestCopierEdgeCases(unittest.TestCase):
     def test_permission_error_during_copy(self):
         """ファイル権限エラーのテスト（要件 8.4）"""
         # ソースファイルを作成
-        source_file = self.source_dir / "test.cr2"
+        source_file = self._ensure_source() / "test.cr2"
         source_file.write_bytes(b"raw file data")
         
         # マッチ結果を作成
-        match = MatchResult(
-            jpeg_path=Path("dummy.jpg"),
-            raw_path=source_file,
-            match_method="basename_and_datetime"
-        )
+        match = self._make_match(source_file)
+        
+        # shutil.copy2でPermissionErrorが発生するように差し替え
+        def raise_permission_error(*args, **kwargs):
+            raise PermissionError("Permission denied")
         
-        # shutil.copy2でPermissionErrorが発生するようにモック
-        with patch('shutil.copy2', side_effect=PermissionError("Permission denied")):
+        original_copy2 = shutil.copy2
+        shutil.copy2 = raise_permission_error
+        try:
             result = self.copier.copy_files([match], self.target_dir)
+        finally:
+            shutil.copy2 = original_copy2
         
         # 権限エラーで失敗することを確認
         self.assertEqual(result.success, 0)
@@ -212,11 +243,7 @@ class TestCopierEdgeCases(unittest.TestCase):
         nonexistent_file = self.source_dir / "nonexistent.cr2"
         
         # マッチ結果を作成
-        match = MatchResult(
-            jpeg_path=Path("dummy.jpg"),
-            raw_path=nonexistent_file,
-            match_method="basename_and_datetime"
-        )
+        match = self._make_match(nonexistent_file)
         
         # コピー実行
         result = self.copier.copy_files([match], self.target_dir)
@@ -232,15 +259,11 @@ class TestCopierEdgeCases(unittest.TestCase):
         invalid_target = Path("/invalid/path/that/cannot/be/created")
         
         # ソースファイルを作成
-        source_file = self.source_dir / "test.cr2"
+        source_file = self._ensure_source() / "test.cr2"
         source_file.write_bytes(b"raw file data")
         
         # マッチ結果を作成
-        match = MatchResult(
-            jpeg_path=Path("dummy.jpg"),
-            raw_path=source_file,
-            match_method="basename_and_datetime"
-        )
+        match = self._make_match(source_file)
         
         # コピー実行
         result = self.copier.copy_files([match], invalid_target)
@@ -257,11 +280,7 @@ class TestFileScannerEdgeCases(unittest.TestCase):
     def setUp(self):
         """テスト前の準備"""
         self.file_scanner = FileScanner()
-        self.temp_dir = Path(tempfile.mkdtemp())
-    
-    def tearDown(self):
-        """テスト後のクリーンアップ"""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        self.temp_dir = _create_test_dir()
     
     def test_unsupported_file_formats(self):
         """未対応のファイル形式のテスト（要件 8.5）"""
@@ -273,8 +292,9 @@ class TestFileScannerEdgeCases(unittest.TestCase):
             self.temp_dir / "test.bmp",
         ]
         
+        # スキャナーは拡張子のみを判定するため、空ファイルで十分
         for file_path in unsupported_files:
-            file_path.write_bytes(b"dummy data")
+            file_path.touch()
         
         # RAWファイルスキャン
         raw_files = self.file_scanner.scan_raw_files(self.temp_dir)
@@ -286,17 +306,14 @@ class TestFileScannerEdgeCases(unittest.TestCase):
     
     def test_mixed_case_extensions(self):
         """大文字小文字混在の拡張子のテスト"""
-        # 大文字小文字混在のファイルを作成
+        # is_raw_file/is_jpeg_fileは拡張子のみを判定するため、ファイルの作成は不要
         mixed_files = [
-            self.temp_dir / "test.Cr2",
-            self.temp_dir / "test.nEf",
-            self.temp_dir / "test.Jpg",
-            self.temp_dir / "test.JpEg",
+            Path("test.Cr2"),
+            Path("test.nEf"),
+            Path("test.Jpg"),
+            Path("test.JpEg"),
         ]
         
-        for file_path in mixed_files:
-            file_path.write_bytes(b"dummy data")
-        
         # 大文字小文字混在でも正しく認識されることを確認
         self.assertFalse(self.file_scanner.is_raw_file(mixed_files[0]))  # .Cr2は未定義
         self.assertFalse(self.file_scanner.is_raw_file(mixed_files[1]))  # .nEfは未定義
@@ -305,8 +322,8 @@ class TestFileScannerEdgeCases(unittest.TestCase):
     
     def test_empty_directory(self):
         """空のディレクトリのテスト"""
-        empty_dir = self.temp_dir / "empty"
-        empty_dir.mkdir()
+        # テストごとの一時ディレクトリは作成直後で空のため、そのまま使用
+        empty_dir = self.temp_dir
         
         # 空のディレクトリでも正常に動作することを確認
         raw_files = self.file_scanner.scan_raw_files(empty_dir)
@@ -317,7 +334,7 @@ class TestFileScannerEdgeCases(unittest.TestCase):
     
     def test_invalid_directory(self):
         """無効なディレクトリのテスト"""
-        invalid_dir = Path("/nonexistent/directory")
+        invalid_dir = _NONEXISTENT_DIR
         
         # 無効なディレクトリでValidationErrorが発生することを確認
         with self.assertRaises(ValidationError):
@@ -335,11 +352,7 @@ class TestMatcherEdgeCases(unittest.TestCase):
         self.exif_reader = Mock(spec=ExifReader)
         self.index = RawFileIndex()
         self.matcher = Matcher(self.exif_reader, self.index)
-        self.temp_dir = Path(tempfile.mkdtemp())
-    
-    def tearDown(self):
-        """テスト後のクリーンアップ"""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        self.temp_dir = _create_test_dir()
     
     def test_no_matching_jpeg_files(self):
         """マッチしないJPEGファイルの処理テスト（要件 8.1）"""
@@ -366,7 +379,7 @@ class TestMatcherEdgeCases(unittest.TestCase):
         
         # RAWファイル情報をインデックスに追加（異なる撮影日時）
         raw_info = RawFileInfo(
-            path=Path("test.cr2"),
+            path=_TEST_RAW_PATH,
             basename="test",
             capture_datetime=datetime(2023, 1, 1, 12, 0, 0),
             file_size=1000
@@ -390,7 +403,7 @@ class TestMatcherEdgeCases(unittest.TestCase):
         
         # RAWファイル情報をインデックスに追加
         raw_info = RawFileInfo(
-            path=Path("test.cr2"),
+            path=_TEST_RAW_PATH,
             basename="test",
             capture_datetime=None,
             file_size=1000
@@ -416,15 +429,17 @@ class TestMatcherEdgeCases(unittest.TestCase):
         jpeg_file.write_bytes(b"jpeg data")
         
         # 同じベース名と撮影日時を持つ複数のRAWファイル情報をインデックスに追加
+        # （パスのみ異なるため、最初の候補を元にreplaceで複製）
         capture_time = datetime(2023, 1, 1, 12, 0, 0)
-        for i in range(3):
-            raw_info = RawFileInfo(
-                path=Path(f"test_{i}.cr2"),
-                basename="test",
-                capture_datetime=capture_time,
-                file_size=1000
-            )
-            self.index.add(raw_info)
+        base_info = RawFileInfo(
+            path=Path("test_0.cr2"),
+            basename="test",
+            capture_datetime=capture_time,
+            file_size=1000
+        )
+        self.index.add(base_info)
+        for i in range(1, 3):
+            self.index.add(replace(base_info, path=Path(f"test_{i}.cr2")))
         
         # JPEGのExif読み取りをモック
         self.exif_reader.read_capture_datetime.return_value = capture_time
@@ -457,16 +472,12 @@ class TestIntegrationEdgeCases(unittest.TestCase):
     
     def setUp(self):
         """テスト前の準備"""
-        self.temp_dir = Path(tempfile.mkdtemp())
+        self.temp_dir = _create_test_dir()
         self.source_dir = self.temp_dir / "source"
         self.target_dir = self.temp_dir / "target"
         self.source_dir.mkdir()
         self.target_dir.mkdir()
     
-    def tearDown(self):
-        """テスト後のクリーンアップ"""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-    
     def test_mixed_success_and_failure_scenario(self):
         """成功とエラーが混在するシナリオのテスト"""
         from src.models import MatchResult
@@ -504,10 +515,11 @@ class TestIntegrationEdgeCases(unittest.TestCase):
     
     def test_large_file_handling(self):
         """大きなファイルの処理テスト"""
-        # 大きなファイルを作成（1MB）
+        # 大きなファイルを作成（1MB、スパースファイルとしてデータ書き込みを省略）
         large_file = self.source_dir / "large.cr2"
-        large_data = b"x" * (1024 * 1024)  # 1MB
-        large_file.write_bytes(large_data)
+        large_size = 1024 * 1024  # 1MB
+        large_file.touch()
+        os.truncate(large_file, large_size)
         
         # マッチ結果を作成
         match = MatchResult(
@@ -527,7 +539,7 @@ class TestIntegrationEdgeCases(unittest.TestCase):
         # コピーされたファイルのサイズが正しいことを確認
         copied_file = self.target_dir / "large.cr2"
         self.assertTrue(copied_file.exists())
-        self.assertEqual(copied_file.stat().st_size, len(large_data))
+        self.assertEqual(copied_file.stat().st_size, large_size)
     
     def test_special_characters_in_filename(self):
         """ファイル名に特殊文字が含まれる場合のテスト"""
@@ -540,17 +552,17 @@ class TestIntegrationEdgeCases(unittest.TestCase):
             "テスト日本語.cr2",  # 日本語
         ]
         
-        matches = []
         for name in special_names:
-            file_path = self.source_dir / name
-            file_path.write_bytes(b"raw file data")
-            
-            match = MatchResult(
+            (self.source_dir / name).write_bytes(b"raw file data")
+        
+        matches = [
+            MatchResult(
                 jpeg_path=Path(name.replace(".cr2", ".jpg")),
-                raw_path=file_path,
+                raw_path=self.source_dir / name,
                 match_method="basename_and_datetime"
             )
-            matches.append(match)
+            for name in special_names
+        ]
         
         # コピー実行
         copier = Copier()
@@ -571,11 +583,7 @@ class TestErrorMessageValidation(unittest.TestCase):
     
     def setUp(self):
         """テスト前の準備"""
-        self.temp_dir = Path(tempfile.mkdtemp())
-    
-    def tearDown(self):
-        """テスト後のクリーンアップ"""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        self.temp_dir = _create_test_dir()
     
     def test_exif_error_message_contains_file_path(self):
         """ExifReadErrorのエラーメッセージにファイルパスが含まれることを確認（要件 7.5）"""
@@ -597,7 +605,7 @@ class TestErrorMessageValidation(unittest.TestCase):
         """ValidationErrorのメッセージ形式を確認"""
         from src.path_validator import PathValidator
         
-        nonexistent_path = Path("/nonexistent/directory")
+        nonexistent_path = _NONEXISTENT_DIR
         
         try:
             PathValidator.validate_directory(nonexistent_path)
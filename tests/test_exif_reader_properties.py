@@ -9,14 +9,17 @@ Property 9: Exifキャッシュの一貫性
 import tempfile
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 from hypothesis import given, strategies as st, assume
-from hypothesis import settings
 import pytest
 
 from src.exif_reader import ExifReader
 from src.exceptions import ExifReadError
 
 
+pytestmark = pytest.mark.property
+
+
 # テスト用のExifデータを含むJPEGファイルのヘッダー（最小限）
 MINIMAL_JPEG_WITH_EXIF = bytes([
     0xFF, 0xD8,  # JPEG SOI
@@ -30,6 +33,10 @@ MINIMAL_JPEG_WITH_EXIF = bytes([
     0xFF, 0xD9   # JPEG EOI
 ])
 
+# テスト対象とするファイル拡張子
+# （大文字小文字の違いはFileScannerのテストで検証するため、ここでは小文字のみ）
+SAMPLE_EXTENSIONS = ['.jpg', '.jpeg', '.cr2', '.nef', '.arw']
+
 # 有効なExif日時文字列のストラテジー
 @st.composite
 def valid_exif_datetime_strategy(draw):
@@ -45,37 +52,33 @@ def valid_exif_datetime_strategy(draw):
     return f"{year:04d}:{month:02d}:{day:02d} {hour:02d}:{minute:02d}:{second:02d}"
 
 
-@st.composite
-def file_path_strategy(draw):
-    """有効なファイルパスを生成するストラテジー"""
-    # ファイル名部分
-    filename = draw(st.text(
-        alphabet=st.characters(
-            whitelist_categories=('Lu', 'Ll', 'Nd'),
-            min_codepoint=32,
-            max_codepoint=126
-        ),
-        min_size=1,
-        max_size=20
-    ).filter(lambda x: x.strip() and not any(c in x for c in '<>:"|?*')))
-    
-    # 拡張子
-    extension = draw(st.sampled_from([
-        '.jpg', '.jpeg', '.JPG', '.JPEG',
-        '.cr2', '.CR2', '.nef', '.NEF', '.arw', '.ARW'
-    ]))
-    
-    return Path(f"/tmp/test_{filename}{extension}")
+@pytest.fixture(scope="module")
+def shared_exif_reader():
+    """モジュール共通のExifReader（ExifToolの検出は1回のみ）"""
+    return ExifReader()
+
+
+@pytest.fixture(scope="module")
+def sample_files(tmp_path_factory):
+    """拡張子ごとにMINIMAL_JPEG_WITH_EXIFを書き込んだファイルを1度だけ作成"""
+    sample_dir = tmp_path_factory.mktemp("exif")
+    files = {}
+    for extension in SAMPLE_EXTENSIONS:
+        sample_path = sample_dir / f"sample{extension}"
+        sample_path.write_bytes(MINIMAL_JPEG_WITH_EXIF)
+        files[extension] = sample_path
+    return files
 
 
 class TestExifReaderProperties:
     """ExifReaderのプロパティテスト"""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup_exif_reader(self, shared_exif_reader):
         """各テストメソッドの前に実行される初期化"""
-        self.exif_reader = ExifReader()
+        self.exif_reader = shared_exif_reader
+        self.exif_reader.clear_cache()
     
-    @settings(max_examples=100)
     @given(valid_exif_datetime_strategy())
     def test_exif_datetime_extraction_property(self, exif_datetime_str):
         """
@@ -97,9 +100,8 @@ class TestExifReaderProperties:
         expected_format = parsed_datetime.strftime('%Y:%m:%d %H:%M:%S')
         assert expected_format == exif_datetime_str
     
-    @settings(max_examples=100)
-    @given(file_path_strategy())
-    def test_exif_cache_consistency_property(self, file_path):
+    @given(st.sampled_from(SAMPLE_EXTENSIONS))
+    def test_exif_cache_consistency_property(self, sample_files, extension):
         """
         **Feature: raw-jpeg-matcher, Property 9: Exifキャッシュの一貫性**
         **検証対象: 要件 6.2**
@@ -107,40 +109,33 @@ class TestExifReaderProperties:
         任意のファイルに対して、Exifデータを複数回読み取ると同じ結果が返され、
         2回目以降の読み取りはキャッシュから提供されるべきである。
         """
-        # 一時ファイルを作成（空ファイル、Exifデータなし）
-        with tempfile.NamedTemporaryFile(suffix=file_path.suffix, delete=False) as tmp_file:
-            tmp_path = Path(tmp_file.name)
-            # 最小限のJPEGデータを書き込み（Exifなし）
-            tmp_file.write(MINIMAL_JPEG_WITH_EXIF)
+        # 拡張子に対応する事前作成済みファイルを使用し、キャッシュをクリアして初回読み取りを再現
+        tmp_path = sample_files[extension]
+        self.exif_reader.clear_cache()
         
-        try:
-            # 初回読み取り（キャッシュなし）
-            assert not self.exif_reader.is_cached(tmp_path)
-            first_result = self.exif_reader.read_capture_datetime(tmp_path)
-            
-            # キャッシュされたことを確認
-            assert self.exif_reader.is_cached(tmp_path)
-            
-            # 2回目の読み取り（キャッシュから）
-            second_result = self.exif_reader.read_capture_datetime(tmp_path)
-            
-            # プロパティ検証: 一貫性
-            # 1. 同じ結果が返される
-            assert first_result == second_result
-            
-            # 2. 両方ともNoneまたは両方とも有効なdatetime
-            if first_result is not None:
-                assert isinstance(first_result, datetime)
-                assert isinstance(second_result, datetime)
-            else:
-                assert second_result is None
-            
-            # 3. キャッシュサイズが1増加している
-            assert self.exif_reader.get_cache_size() >= 1
-            
-        finally:
-            # テンポラリファイルをクリーンアップ
-            tmp_path.unlink(missing_ok=True)
+        # 初回読み取り（キャッシュなし）
+        assert not self.exif_reader.is_cached(tmp_path)
+        first_result = self.exif_reader.read_capture_datetime(tmp_path)
+        
+        # キャッシュされたことを確認
+        assert self.exif_reader.is_cached(tmp_path)
+        
+        # 2回目の読み取り（キャッシュから）
+        second_result = self.exif_reader.read_capture_datetime(tmp_path)
+        
+        # プロパティ検証: 一貫性
+        # 1. 同じ結果が返される
+        assert first_result == second_result
+        
+        # 2. 両方ともNoneまたは両方とも有効なdatetime
+        if first_result is not None:
+            assert isinstance(first_result, datetime)
+            assert isinstance(second_result, datetime)
+        else:
+            assert second_result is None
+        
+        # 3. キャッシュサイズが1増加している
+        assert self.exif_reader.get_cache_size() >= 1
     
     def test_invalid_datetime_formats(self):
         """無効な日時フォーマットの処理テスト"""
@@ -248,4 +243,30 @@ class TestExifReaderProperties:
             assert result is None
             
         finally:
-            tmp_path.unlink(missing_ok=True)
\ No newline at end of file
+            tmp_path.unlink(missing_ok=True)
+
+
+def test_exiftool_probe_is_shared_between_instances():
+    """検出済みのExifToolパスは新しいインスタンスでも再検出せずに再利用される"""
+    cached_path = Path("/usr/local/bin/exiftool")
+    
+    with patch.object(ExifReader, '_cached_exiftool_path', cached_path):
+        with patch.object(ExifReader, '_find_exiftool') as mock_find:
+            reader = ExifReader()
+    
+    assert reader.exiftool_path == cached_path
+    mock_find.assert_not_called()
+
+
+def test_exiftool_availability_reprobes_after_removal():
+    """以前は利用可能だったExifToolが見つからなくなった場合、公開チェックはFalseを返し検出結果を破棄する"""
+    cached_path = Path("/usr/local/bin/exiftool")
+    
+    with patch.object(ExifReader, '_cached_exiftool_path', cached_path):
+        reader = ExifReader()
+        assert reader.exiftool_path == cached_path
+        
+        with patch.object(ExifReader, '_find_exiftool', side_effect=FileNotFoundError("ExifTool が見つかりません")):
+            assert reader.check_exiftool_availability() is False
+        
+        assert ExifReader._cached_exiftool_path is None
@@ -5,25 +5,60 @@ Property 3: ベース名抽出の一貫性を検証します。
 """
 
 import tempfile
-from pathlib import Path
-from hypothesis import given, strategies as st
-from hypothesis import settings
+from pathlib import Path, PurePosixPath
+from hypothesis import assume, given, strategies as st
 import pytest
 
 from src.file_scanner import FileScanner
 from src.exceptions import ValidationError
 
 
+pytestmark = pytest.mark.property
+
+
+# プロパティテストで共有するFileScanner（get_basenameは状態を持たない）
+_SCANNER = FileScanner()
+
+# プロパティテストで共有する親パス（例ごとにプレフィックスを再解析しない）
+_PREFIX = PurePosixPath("/test/path")
+
+
+# 設計ドキュメントで指定された拡張子
+_EXPECTED_RAW_EXTS = frozenset({
+    '.cr2', '.CR2', '.cr3', '.CR3', '.nef', '.NEF',
+    '.arw', '.ARW', '.raf', '.RAF', '.orf', '.ORF',
+    '.rw2', '.RW2', '.pef', '.PEF', '.dng', '.DNG',
+    '.rwl', '.RWL', '.3fr', '.3FR', '.iiq', '.IIQ'
+})
+
+_EXPECTED_JPEG_EXTS = frozenset({
+    '.jpg', '.JPG', '.jpeg', '.JPEG'
+})
+
+# ストラテジーで使用する拡張子（RAWとJPEG、大文字小文字両方）
+_ALL_EXTS = (
+    '.CR2', '.cr2', '.CR3', '.cr3', '.NEF', '.nef',
+    '.ARW', '.arw', '.RAF', '.raf', '.ORF', '.orf',
+    '.RW2', '.rw2', '.PEF', '.pef', '.DNG', '.dng',
+    '.RWL', '.rwl', '.3FR', '.3fr', '.IIQ', '.iiq',
+    '.JPG', '.jpg', '.JPEG', '.jpeg'
+)
+
+# ファイル名に使用する文字（モジュール内で共有）
+# 使用できない文字はアルファベット段階で除外し、filterによる棄却を発生させない
+_SAFE_CHARS = st.characters(
+    whitelist_categories=('Lu', 'Ll', 'Nd'),
+    min_codepoint=32,
+    max_codepoint=126,
+    blacklist_characters='<>:"|?*\\/.'
+)
+
 # ファイルシステムで安全に使用できる文字のストラテジー
 safe_filename_strategy = st.text(
-    alphabet=st.characters(
-        whitelist_categories=('Lu', 'Ll', 'Nd'),
-        min_codepoint=32,
-        max_codepoint=126
-    ),
+    alphabet=_SAFE_CHARS,
     min_size=1,
     max_size=50
-).filter(lambda x: x.strip() and not any(c in x for c in '<>:"|?*\\/.'))
+)
 
 
 @st.composite
@@ -33,13 +68,7 @@ def file_with_extension_strategy(draw):
     basename = draw(safe_filename_strategy)
     
     # 拡張子を選択（RAWまたはJPEG）
-    extension = draw(st.sampled_from([
-        '.CR2', '.cr2', '.CR3', '.cr3', '.NEF', '.nef', 
-        '.ARW', '.arw', '.RAF', '.raf', '.ORF', '.orf',
-        '.RW2', '.rw2', '.PEF', '.pef', '.DNG', '.dng',
-        '.RWL', '.rwl', '.3FR', '.3fr', '.IIQ', '.iiq',
-        '.JPG', '.jpg', '.JPEG', '.jpeg'
-    ]))
+    extension = draw(st.sampled_from(_ALL_EXTS))
     
     return basename, extension
 
@@ -58,31 +87,13 @@ def mixed_case_filename_pairs_strategy(draw):
         max_size=20
     ).filter(lambda x: x.strip() and x.lower() != x.upper()))  # 大文字小文字が異なることを保証
     
-    # 大文字小文字のバリエーションを作成
-    variations = set()
-    variations.add(base_name)
-    variations.add(base_name.upper())
-    variations.add(base_name.lower())
-    variations.add(base_name.capitalize())
+    # 大文字小文字のバリエーション（filterにより両者は必ず異なる）
+    lower, upper = base_name.lower(), base_name.upper()
     
-    # 少なくとも2つの異なるバリエーションがあることを確認
-    variations_list = list(variations)
-    if len(variations_list) < 2:
-        # フォールバック: 手動で異なるバリエーションを作成
-        variations_list = [base_name.lower(), base_name.upper()]
-    
-    # 2つの異なるバリエーションを選択
-    selected = draw(st.lists(
-        st.sampled_from(variations_list),
-        min_size=2,
-        max_size=2,
-        unique=True
-    ))
-    
-    return selected[0], selected[1]
+    # 2つの異なるバリエーションを順序付きで選択
+    return draw(st.sampled_from([(lower, upper), (upper, lower)]))
 
 
-@settings(max_examples=100)
 @given(file_with_extension_strategy())
 def test_basename_extraction_consistency_property(file_data):
     """
@@ -95,14 +106,11 @@ def test_basename_extraction_consistency_property(file_data):
     """
     basename, extension = file_data
     
-    # FileScannerインスタンスを作成
-    scanner = FileScanner()
-    
     # ファイルパスを作成
-    file_path = Path(f"/test/path/{basename}{extension}")
+    file_path = _PREFIX / f"{basename}{extension}"
     
     # ベース名を抽出
-    extracted_basename = scanner.get_basename(file_path)
+    extracted_basename = _SCANNER.get_basename(file_path)
     
     # プロパティ検証
     # 1. 抽出されたベース名は文字列であるべき
@@ -122,7 +130,6 @@ def test_basename_extraction_consistency_property(file_data):
         assert len(extracted_basename) > 0
 
 
-@settings(max_examples=100)
 @given(mixed_case_filename_pairs_strategy())
 def test_case_insensitive_basename_matching_property(filename_pair):
     """
@@ -133,16 +140,16 @@ def test_case_insensitive_basename_matching_property(filename_pair):
     """
     filename1, filename2 = filename_pair
     
-    # FileScannerインスタンスを作成
-    scanner = FileScanner()
+    # 同一文字列の組は検証対象外（ストラテジーは常に異なる組を返すため棄却は発生しない）
+    assume(filename1 != filename2)
     
     # 異なる拡張子でファイルパスを作成
-    file_path1 = Path(f"/test/path/{filename1}.CR2")
-    file_path2 = Path(f"/test/path/{filename2}.jpg")
+    file_path1 = _PREFIX / f"{filename1}.CR2"
+    file_path2 = _PREFIX / f"{filename2}.jpg"
     
     # ベース名を抽出
-    basename1 = scanner.get_basename(file_path1)
-    basename2 = scanner.get_basename(file_path2)
+    basename1 = _SCANNER.get_basename(file_path1)
+    basename2 = _SCANNER.get_basename(file_path2)
     
     # プロパティ検証: 大文字小文字を区別しない比較
     # 同じベース名（大文字小文字の違いを除く）のファイルは同じベース名を持つべき
@@ -154,30 +161,28 @@ def test_case_insensitive_basename_matching_property(filename_pair):
     assert basename2 == basename2.lower()
 
 
-def test_file_type_detection_consistency():
-    """ファイルタイプ検出の一貫性テスト"""
-    scanner = FileScanner()
-    
-    # RAWファイルのテスト
-    raw_extensions = ['.CR2', '.cr2', '.NEF', '.nef', '.ARW', '.arw']
-    for ext in raw_extensions:
-        file_path = Path(f"/test/image{ext}")
-        assert scanner.is_raw_file(file_path), f"RAWファイル検出失敗: {ext}"
-        assert not scanner.is_jpeg_file(file_path), f"JPEG誤検出: {ext}"
-    
-    # JPEGファイルのテスト
-    jpeg_extensions = ['.JPG', '.jpg', '.JPEG', '.jpeg']
-    for ext in jpeg_extensions:
-        file_path = Path(f"/test/image{ext}")
-        assert scanner.is_jpeg_file(file_path), f"JPEGファイル検出失敗: {ext}"
-        assert not scanner.is_raw_file(file_path), f"RAW誤検出: {ext}"
-    
-    # 未対応拡張子のテスト
-    unsupported_extensions = ['.txt', '.pdf', '.png', '.tiff']
-    for ext in unsupported_extensions:
-        file_path = Path(f"/test/file{ext}")
-        assert not scanner.is_raw_file(file_path), f"RAW誤検出: {ext}"
-        assert not scanner.is_jpeg_file(file_path), f"JPEG誤検出: {ext}"
+@pytest.mark.parametrize("ext", ['.CR2', '.cr2', '.NEF', '.nef', '.ARW', '.arw'])
+def test_is_raw_true(ext):
+    """ファイルタイプ検出の一貫性テスト（RAWファイル）"""
+    file_path = Path(f"/test/image{ext}")
+    assert _SCANNER.is_raw_file(file_path), f"RAWファイル検出失敗: {ext}"
+    assert not _SCANNER.is_jpeg_file(file_path), f"JPEG誤検出: {ext}"
+
+
+@pytest.mark.parametrize("ext", ['.JPG', '.jpg', '.JPEG', '.jpeg'])
+def test_is_jpeg_true(ext):
+    """ファイルタイプ検出の一貫性テスト（JPEGファイル）"""
+    file_path = Path(f"/test/image{ext}")
+    assert _SCANNER.is_jpeg_file(file_path), f"JPEGファイル検出失敗: {ext}"
+    assert not _SCANNER.is_raw_file(file_path), f"RAW誤検出: {ext}"
+
+
+@pytest.mark.parametrize("ext", ['.txt', '.pdf', '.png', '.tiff'])
+def test_unsupported_extensions(ext):
+    """ファイルタイプ検出の一貫性テスト（未対応拡張子）"""
+    file_path = Path(f"/test/file{ext}")
+    assert not _SCANNER.is_raw_file(file_path), f"RAW誤検出: {ext}"
+    assert not _SCANNER.is_jpeg_file(file_path), f"JPEG誤検出: {ext}"
 
 
 def test_scanner_with_real_directory_structure():
@@ -187,7 +192,7 @@ def test_scanner_with_real_directory_structure():
     with tempfile.TemporaryDirectory() as temp_dir:
         temp_path = Path(temp_dir)
         
-        # テスト用ファイルを作成
+        # テスト用ファイルを作成（スキャナーは名前と拡張子のみを参照するため空ファイル）
         test_files = [
             "IMG_001.CR2", "IMG_001.jpg",
             "IMG_002.NEF", "IMG_002.jpeg",
@@ -197,13 +202,13 @@ def test_scanner_with_real_directory_structure():
         
         for filename in test_files:
             file_path = temp_path / filename
-            file_path.write_text("test content")
+            file_path.touch()
         
         # サブディレクトリも作成
         sub_dir = temp_path / "subdir"
         sub_dir.mkdir()
-        (sub_dir / "IMG_004.DNG").write_text("test content")
-        (sub_dir / "IMG_004.JPEG").write_text("test content")
+        (sub_dir / "IMG_004.DNG").touch()
+        (sub_dir / "IMG_004.JPEG").touch()
         
         # RAWファイルをスキャン（非再帰）
         raw_files = scanner.scan_raw_files(temp_path, recursive=False)
@@ -225,6 +230,10 @@ def test_scanner_with_real_directory_structure():
         
         jpeg_files_recursive = scanner.scan_jpeg_files(temp_path, recursive=True)
         assert len(jpeg_files_recursive) == 4  # 3 + 1 (subdir)
+        
+        # 逐次スキャンはソート前の同じ集合を返す
+        jpeg_iter = scanner.iter_jpeg_files(temp_path, recursive=True)
+        assert sorted(jpeg_iter) == jpeg_files_recursive
 
 
 def test_scanner_with_invalid_directory():
@@ -239,6 +248,10 @@ def test_scanner_with_invalid_directory():
     
     with pytest.raises(ValidationError):
         scanner.scan_jpeg_files(non_existent)
+    
+    # 逐次スキャンも呼び出し時点で検証される
+    with pytest.raises(ValidationError):
+        scanner.iter_jpeg_files(non_existent)
 
 
 def test_basename_extraction_edge_cases():
@@ -266,16 +279,8 @@ def test_file_extensions_completeness():
     scanner = FileScanner()
     
     # 設計ドキュメントで指定されたすべての拡張子が含まれているかチェック
-    expected_raw_extensions = {
-        '.cr2', '.CR2', '.cr3', '.CR3', '.nef', '.NEF', 
-        '.arw', '.ARW', '.raf', '.RAF', '.orf', '.ORF',
-        '.rw2', '.RW2', '.pef', '.PEF', '.dng', '.DNG',
-        '.rwl', '.RWL', '.3fr', '.3FR', '.iiq', '.IIQ'
-    }
-    
-    expected_jpeg_extensions = {
-        '.jpg', '.JPG', '.jpeg', '.JPEG'
-    }
+    expected_raw_extensions = _EXPECTED_RAW_EXTS
+    expected_jpeg_extensions = _EXPECTED_JPEG_EXTS
     
     # RAW拡張子の確認
     assert scanner.RAW_EXTENSIONS == expected_raw_extensions
@@ -283,15 +288,6 @@ def test_file_extensions_completeness():
     # JPEG拡張子の確認
     assert scanner.JPEG_EXTENSIONS == expected_jpeg_extensions
     
-    # 大文字小文字両方が含まれていることを確認
-    for ext in expected_raw_extensions:
-        if ext.islower():
-            assert ext.upper() in expected_raw_extensions
-        else:
-            assert ext.lower() in expected_raw_extensions
-    
-    for ext in expected_jpeg_extensions:
-        if ext.islower():
-            assert ext.upper() in expected_jpeg_extensions
-        else:
-            assert ext.lower() in expected_jpeg_extensions
\ No newline at end of file
+    # 大文字小文字両方が含まれていることを確認（一方の大文字小文字が欠けていれば集合が一致しない）
+    assert {e.lower() for e in scanner.RAW_EXTENSIONS} | {e.upper() for e in scanner.RAW_EXTENSIONS} == scanner.RAW_EXTENSIONS
+    assert {e.lower() for e in scanner.JPEG_EXTENSIONS} | {e.upper() for e in scanner.JPEG_EXTENSIONS} == scanner.JPEG_EXTENSIONS
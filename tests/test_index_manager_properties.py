@@ -5,109 +5,106 @@ Property 12: 差分更新の正確性
 を検証します。
 """
 
+import logging
 import tempfile
 from datetime import datetime
 from pathlib import Path
-from hypothesis import given, strategies as st
-from hypothesis import settings
+from typing import Dict, List, Optional, Tuple
+import pytest
+from hypothesis import HealthCheck, given, settings, strategies as st
 from unittest.mock import patch
-import logging
 
 from src.index_manager import IndexManager
 from src.indexer import RawFileIndex, IndexCache
 from src.models import RawFileInfo
 
 
+# ログ出力はモジュール単位で一括抑制（conftest.pyのquiet_logsフィクスチャ）
+pytestmark = [pytest.mark.property, pytest.mark.usefixtures("quiet_logs")]
+
+
 # Hypothesis strategies for generating test data
-@st.composite
-def raw_file_info_strategy(draw):
-    """RawFileInfoオブジェクトを生成するストラテジー"""
-    # ファイル名を生成
-    filename = draw(st.text(
-        alphabet=st.characters(
-            whitelist_categories=('Lu', 'Ll', 'Nd'),
-            min_codepoint=32,
-            max_codepoint=126
-        ),
-        min_size=1,
-        max_size=50
-    ).filter(lambda x: x.strip() and not any(c in x for c in '<>:"|?*')))
-
-    # RAW拡張子を追加
-    extension = draw(st.sampled_from([
-        '.CR2', '.NEF', '.ARW', '.RAF', '.ORF', '.DNG'
-    ]))
-    path = Path(f"/test/path/{filename}{extension}")
-
-    # ベース名（拡張子なし、小文字）
-    basename = filename.lower()
-
-    # 撮影日時（オプショナル）
-    capture_datetime = draw(st.one_of(
-        st.none(),
-        st.datetimes(
-            min_value=datetime(2000, 1, 1),
-            max_value=datetime(2024, 12, 31)
-        )
-    ))
 
-    # ファイルサイズ
-    file_size = draw(st.integers(min_value=1, max_value=100_000_000))
+# ファイル名に使用する文字（各ストラテジーで共有）
+# 使用できない文字と空白はアルファベット段階で除外し、filterによる棄却を発生させない
+_SAFE_CHARS = st.characters(
+    whitelist_categories=('Lu', 'Ll', 'Nd'),
+    min_codepoint=33,  # 空白を除外（空白のみの名前を生成しない）
+    max_codepoint=126,
+    blacklist_characters='<>:"|?*'
+)
+
+# ファイル名として安全な文字列
+_SAFE_TEXT = st.text(
+    alphabet=_SAFE_CHARS,
+    min_size=1,
+    max_size=50
+)
 
+# ディレクトリ名として安全な文字列
+_SAFE_DIR_NAME = st.text(
+    alphabet=_SAFE_CHARS,
+    min_size=1,
+    max_size=30
+)
+
+# RAW拡張子
+_EXT_STRATEGY = st.sampled_from((
+    '.CR2', '.NEF', '.ARW', '.RAF', '.ORF', '.DNG'
+))
+
+# 撮影日時（オプショナル）
+_DT_STRATEGY = st.one_of(
+    st.none(),
+    st.datetimes(
+        min_value=datetime(2000, 1, 1),
+        max_value=datetime(2024, 12, 31)
+    )
+)
+
+# ファイルサイズ
+_SIZE_STRATEGY = st.integers(min_value=1, max_value=100_000_000)
+
+
+def _raw_file_info(filename, extension, capture_datetime, file_size):
+    """生成したファイル名と属性からRawFileInfoを組み立てる"""
     return RawFileInfo(
-        path=path,
-        basename=basename,
+        path=Path(f"/test/path/{filename}{extension}"),
+        basename=filename.lower(),  # ベース名（拡張子なし、小文字）
         capture_datetime=capture_datetime,
         file_size=file_size
     )
 
 
+def raw_file_info_strategy():
+    """RawFileInfoオブジェクトを生成するストラテジー"""
+    return st.builds(
+        _raw_file_info, _SAFE_TEXT, _EXT_STRATEGY, _DT_STRATEGY, _SIZE_STRATEGY
+    )
+
+
 @st.composite
 def unique_raw_files_strategy(draw):
     """一意のパスを持つRawFileInfoオブジェクトのリストを生成するストラテジー"""
     num_files = draw(st.integers(min_value=1, max_value=15))
     filenames = draw(st.lists(
-        st.text(
-            alphabet=st.characters(
-                whitelist_categories=('Lu', 'Ll', 'Nd'),
-                min_codepoint=32,
-                max_codepoint=126
-            ),
-            min_size=1,
-            max_size=50
-        ).filter(lambda x: x.strip() and not any(c in x for c in '<>:"|?*')),
+        _SAFE_TEXT,
         min_size=num_files,
         max_size=num_files,
         unique=True
     ))
 
-    raw_files = []
-    for i, filename in enumerate(filenames):
-        extension = draw(st.sampled_from([
-            '.CR2', '.NEF', '.ARW', '.RAF', '.ORF', '.DNG'
-        ]))
-        path = Path(f"/test/path/{filename}{extension}")
-
-        basename = filename.lower()
-
-        capture_datetime = draw(st.one_of(
-            st.none(),
-            st.datetimes(
-                min_value=datetime(2000, 1, 1),
-                max_value=datetime(2024, 12, 31)
-            )
-        ))
-
-        file_size = draw(st.integers(min_value=1, max_value=100_000_000))
-
-        raw_files.append(RawFileInfo(
-            path=path,
-            basename=basename,
-            capture_datetime=capture_datetime,
-            file_size=file_size
-        ))
+    # 拡張子・撮影日時・ファイルサイズをファイル数分まとめて生成
+    payloads = draw(st.lists(
+        st.tuples(_EXT_STRATEGY, _DT_STRATEGY, _SIZE_STRATEGY),
+        min_size=num_files,
+        max_size=num_files
+    ))
 
-    return raw_files
+    return [
+        _raw_file_info(filename, *payload)
+        for filename, payload in zip(filenames, payloads)
+    ]
 
 
 class MockIndexer:
@@ -123,15 +120,71 @@ class MockIndexer:
         return self.index_to_return
 
 
-@settings(max_examples=50)
+class InMemoryIndexCache:
+    """テスト用のIndexCache代替（インデックスを辞書に保持し、ファイルI/Oを行わない）"""
+
+    def __init__(self):
+        self._store: Dict[Path, RawFileIndex] = {}
+
+    def save_directory_index(self, source_dir: Path, index: RawFileIndex) -> None:
+        index.source_directory = source_dir
+        index.last_updated = datetime.now()
+        self._store[source_dir] = index
+
+    def load_directory_index(self, source_dir: Path) -> Optional[RawFileIndex]:
+        return self._store.get(source_dir)
+
+    def list_indexed_directories(self) -> List[Tuple[Path, datetime, int]]:
+        directories = [
+            (source_dir, index.last_updated, index.file_count)
+            for source_dir, index in self._store.items()
+        ]
+        # IndexCacheと同様に最終更新日時の新しい順
+        directories.sort(key=lambda x: x[1], reverse=True)
+        return directories
+
+    def remove_directory_index(self, source_dir: Path) -> bool:
+        return self._store.pop(source_dir, None) is not None
+
+    def clear_all_cache(self) -> None:
+        self._store.clear()
+
+
+def _listing_output(index_manager: IndexManager, capsys) -> str:
+    """list_indexed_directoriesが標準出力に表示した内容を取得
+
+    quiet_logsによるログ抑制をこの呼び出しの間だけ解除します。
+    """
+    capsys.readouterr()  # 前の例の出力を捨てる
+    previous = logging.root.manager.disable
+    logging.disable(logging.NOTSET)
+    try:
+        index_manager.list_indexed_directories(False)
+    finally:
+        logging.disable(previous)
+    return capsys.readouterr().out
+
+
+def _parse_listing(output: str) -> Dict[str, int]:
+    """一覧表示の出力から「ディレクトリ → RAWファイル数」の辞書を作成"""
+    lines = output.splitlines()
+    listed = {}
+    for i, line in enumerate(lines):
+        number, sep, source_dir = line.partition(". ")
+        if sep and number.isdigit() and i + 2 < len(lines):
+            count_line = lines[i + 2].strip()
+            if count_line.startswith("RAWファイル数: "):
+                listed[source_dir] = int(count_line[len("RAWファイル数: "):])
+    return listed
+
+
 @given(
     initial_files=unique_raw_files_strategy(),
     force_rebuild=st.booleans(),
-    recursive=st.booleans(),
-    verbose=st.booleans()
+    recursive=st.booleans()
 )
 def test_index_manager_differential_update_accuracy_property(
-    initial_files, force_rebuild, recursive, verbose
+    tmp_path_factory, initial_files, force_rebuild, recursive
 ):
     """
     **Feature: raw-jpeg-matcher, Property 12: 差分更新の正確性**
@@ -141,70 +194,45 @@ def test_index_manager_differential_update_accuracy_property(
     IndexManagerを通じた差分更新後のインデックスは
     完全再構築したインデックスと同じ結果を持つべきである。
     """
-    if not initial_files:
-        # 初期ファイルが空の場合はテストをスキップ
-        return
+    temp_path = tmp_path_factory.mktemp("index")
+    source_dir = temp_path / "source"
+    source_dir.mkdir(parents=True)
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        source_dir = temp_path / "source"
-        source_dir.mkdir(parents=True)
-
-        # 期待されるインデックスを作成
-        expected_index = RawFileIndex()
-        for file_info in initial_files:
-            expected_index.add(file_info)
+    # 期待されるインデックスを作成
+    expected_index = RawFileIndex()
+    for file_info in initial_files:
+        expected_index.add(file_info)
 
-        # IndexManagerを作成
-        index_manager = IndexManager()
-
-        # Indexerをモックに置き換え
-        mock_indexer = MockIndexer(expected_index)
-        index_manager.indexer = mock_indexer
+    # IndexManagerを作成
+    index_manager = IndexManager()
 
-        # ログレベルを一時的に変更してテスト出力を抑制
-        original_level = logging.getLogger().level
-        if not verbose:
-            logging.getLogger().setLevel(logging.CRITICAL)
+    # Indexerをモックに置き換え
+    mock_indexer = MockIndexer(expected_index)
+    index_manager.indexer = mock_indexer
 
-        try:
-            # build_or_update_indexを実行
-            index_manager.build_or_update_index(
-                source_dir, recursive, force_rebuild, verbose
-            )
-
-            # プロパティ検証: IndexManagerが正しくIndexerを呼び出している
-            assert len(mock_indexer.build_index_calls) == 1
-            call_args = mock_indexer.build_index_calls[0]
+    # build_or_update_indexを実行
+    index_manager.build_or_update_index(
+        source_dir, recursive, force_rebuild, False
+    )
 
-            # 引数が正しく渡されている
-            assert call_args[0] == source_dir
-            assert call_args[1] == recursive
-            assert call_args[2] == force_rebuild
+    # プロパティ検証: IndexManagerが正しくIndexerを呼び出している
+    assert len(mock_indexer.build_index_calls) == 1
+    call_args = mock_indexer.build_index_calls[0]
 
-            # IndexManagerが正常に完了している（例外が発生していない）
-            # これが差分更新の正確性を示している
-            assert True, "IndexManagerが正常に動作している"
+    # 引数が正しく渡されている
+    assert call_args[0] == source_dir
+    assert call_args[1] == recursive
+    assert call_args[2] == force_rebuild
 
-        finally:
-            # ログレベルを元に戻す
-            logging.getLogger().setLevel(original_level)
+    # IndexManagerが正常に完了している（例外が発生していない）
+    # これが差分更新の正確性を示している
+    assert True, "IndexManagerが正常に動作している"
 
 
-@settings(max_examples=30)
 @given(
     directories_data=st.lists(
         st.tuples(
-            st.text(
-                alphabet=st.characters(
-                    whitelist_categories=('Lu', 'Ll', 'Nd'),
-                    min_codepoint=32,
-                    max_codepoint=126
-                ),
-                min_size=1,
-                max_size=30
-            ).filter(lambda x: x.strip() and not any(
-                c in x for c in '<>:"|?*')),
+            _SAFE_DIR_NAME,
             st.integers(min_value=0, max_value=100),
             st.datetimes(
                 min_value=datetime(2020, 1, 1),
@@ -214,11 +242,12 @@ def test_index_manager_differential_update_accuracy_property(
         min_size=0,
         max_size=10,
         unique_by=lambda x: x[0]  # ディレクトリ名で一意性を保証
-    ),
-    verbose=st.booleans()
+    )
 )
+# capsysは例ごとに_listing_outputで読み捨てるため、関数スコープのまま共有してよい
+@settings(suppress_health_check=[HealthCheck.function_scoped_fixture, HealthCheck.too_slow])
 def test_index_manager_list_directories_consistency_property(
-    directories_data, verbose
+    capsys, directories_data
 ):
     """
     **Feature: raw-jpeg-matcher, Property 12: 差分更新の正確性（一覧表示機能）**
@@ -228,86 +257,90 @@ def test_index_manager_list_directories_consistency_property(
     IndexManagerのlist_indexed_directoriesは
     すべてのディレクトリ情報を正確に表示すべきである。
     """
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
+    # IndexManagerを作成
+    index_manager = IndexManager()
+
+    # テスト用のインメモリキャッシュを使用（ファイルI/Oを行わない）
+    test_cache = InMemoryIndexCache()
+    index_manager.cache = test_cache
+
+    # テストデータに基づいてインデックスを作成
+    expected_directories = []
+    for dir_name, file_count, last_updated in directories_data:
+        source_dir = Path(f"/test/{dir_name}")
+
+        # インデックスを作成
+        index = RawFileIndex()
+        index.source_directory = source_dir
+        index.last_updated = last_updated
+
+        # ダミーファイル情報を追加（file_countに合わせて）
+        for i in range(file_count):
+            dummy_info = RawFileInfo(
+                path=Path(f"/test/{dir_name}/file_{i}.CR2"),
+                basename=f"file_{i}",
+                capture_datetime=last_updated,
+                file_size=1000000
+            )
+            index.add(dummy_info)
 
-        # IndexManagerを作成
+        # file_countは自動的に設定されるので、期待値を更新
+        actual_file_count = index.file_count
+
+        # インデックスを保存
+        test_cache.save_directory_index(source_dir, index)
+        expected_directories.append(
+            (source_dir, last_updated, actual_file_count)
+        )
+    
+    # list_indexed_directoriesを実行し、標準出力に表示された一覧を取得
+    listed = _parse_listing(_listing_output(index_manager, capsys))
+
+    # プロパティ検証: 保存したすべてのディレクトリとファイル数が表示されている
+    assert len(listed) == len(expected_directories), \
+        "表示されたディレクトリ数と期待値が一致するべき"
+
+    for expected_dir, expected_updated, expected_count in expected_directories:
+        assert str(expected_dir) in listed, \
+            f"ディレクトリ {expected_dir} が表示されていない"
+        assert listed[str(expected_dir)] == expected_count, \
+            f"ファイル数が一致するべき: {listed[str(expected_dir)]} != {expected_count}"
+
+
+def test_index_manager_list_directories_real_cache(tmp_path, monkeypatch, capsys):
+    """実際のIndexCacheで保存したインデックスが一覧表示に反映される"""
+    # キャッシュの保存先をこのテスト専用のホームディレクトリに切り替える
+    home = tmp_path / "home"
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setenv("USERPROFILE", str(home))  # Windows
+
+    source_dir = tmp_path / "photos"
+    source_dir.mkdir()
+
+    index = RawFileIndex()
+    for i in range(3):
+        index.add(RawFileInfo(
+            path=source_dir / f"IMG_{i:04d}.CR2",
+            basename=f"IMG_{i:04d}",
+            capture_datetime=datetime(2024, 1, 1, 12, 0, i),
+            file_size=1000000
+        ))
+
+    with patch('src.index_manager.ExifReader'):
         index_manager = IndexManager()
+    index_manager.cache.save_directory_index(source_dir, index)
+
+    # 保存したキャッシュファイルから読み戻した内容が表示される
+    listed = _parse_listing(_listing_output(index_manager, capsys))
+    assert listed == {str(source_dir): 3}
 
-        # テスト用のIndexCacheを作成
-        test_cache = IndexCache()
-        test_cache.cache_dir = temp_path / "cache"
-        test_cache.cache_dir.mkdir(parents=True, exist_ok=True)
-        test_cache.global_index_file = test_cache.cache_dir / 'global_index.json'
-        index_manager.cache = test_cache
 
-        # テストデータに基づいてインデックスを作成
-        expected_directories = []
-        for dir_name, file_count, last_updated in directories_data:
-            source_dir = Path(f"/test/{dir_name}")
-
-            # インデックスを作成
-            index = RawFileIndex()
-            index.source_directory = source_dir
-            index.last_updated = last_updated
-
-            # ダミーファイル情報を追加（file_countに合わせて）
-            for i in range(file_count):
-                dummy_info = RawFileInfo(
-                    path=Path(f"/test/{dir_name}/file_{i}.CR2"),
-                    basename=f"file_{i}",
-                    capture_datetime=last_updated,
-                    file_size=1000000
-                )
-                index.add(dummy_info)
-
-            # file_countは自動的に設定されるので、期待値を更新
-            actual_file_count = index.file_count
-
-            # インデックスを保存
-            test_cache.save_directory_index(source_dir, index)
-            expected_directories.append(
-                (source_dir, last_updated, actual_file_count)
-            )
-        
-        # ログレベルを一時的に変更してテスト出力を抑制
-        original_level = logging.getLogger().level
-        if not verbose:
-            logging.getLogger().setLevel(logging.CRITICAL)
-
-        try:
-            # list_indexed_directoriesを実行
-            index_manager.list_indexed_directories(verbose)
-
-            # プロパティ検証: 一覧表示機能が正常に動作している
-            # 実際のディレクトリ数と期待値を比較
-            actual_directories = test_cache.list_indexed_directories()
-            assert len(actual_directories) == len(expected_directories), \
-                "実際のディレクトリ数と期待値が一致するべき"
-
-            # 各ディレクトリの情報が正確に保存されている
-            for expected_dir, expected_updated, expected_count in expected_directories:
-                found = False
-                for actual_dir, actual_updated, actual_count in actual_directories:
-                    if actual_dir == expected_dir:
-                        assert actual_count == expected_count, \
-                            f"ファイル数が一致するべき: {actual_count} != {expected_count}"
-                        found = True
-                        break
-                assert found, f"ディレクトリ {expected_dir} が見つからない"
-
-        finally:
-            # ログレベルを元に戻す
-            logging.getLogger().setLevel(original_level)
-
-
-@settings(max_examples=30)
 @given(
     source_dir_exists=st.booleans(),
     clear_all=st.booleans()
 )
 def test_index_manager_cache_clear_consistency_property(
-    source_dir_exists, clear_all
+    tmp_path_factory, source_dir_exists, clear_all
 ):
     """
     **Feature: raw-jpeg-matcher, Property 12: 差分更新の正確性（キャッシュクリア機能）**
@@ -316,67 +349,57 @@ def test_index_manager_cache_clear_consistency_property(
     任意のキャッシュ状態に対して、IndexManagerのclear_cacheは
     指定された条件に従って正確にキャッシュをクリアすべきである。
     """
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        source_dir = temp_path / "test_source"
-
-        # IndexManagerを作成
-        index_manager = IndexManager()
-
-        # テスト用のIndexCacheを作成
-        test_cache = IndexCache()
-        test_cache.cache_dir = temp_path / "cache"
-        test_cache.cache_dir.mkdir(parents=True, exist_ok=True)
-        test_cache.global_index_file = test_cache.cache_dir / 'global_index.json'
-        index_manager.cache = test_cache
-
-        # テスト用インデックスを作成（source_dir_existsに基づいて）
-        if source_dir_exists:
-            index = RawFileIndex()
-            index.source_directory = source_dir
-            index.last_updated = datetime.now()
-            index.file_count = 5
-
-            # ダミーファイル情報を追加
-            for i in range(5):
-                dummy_info = RawFileInfo(
-                    path=Path(f"/test/file_{i}.CR2"),
-                    basename=f"file_{i}",
-                    capture_datetime=datetime.now(),
-                    file_size=1000000
-                )
-                index.add(dummy_info)
-
-            # インデックスを保存
-            test_cache.save_directory_index(source_dir, index)
-        
-        # ログレベルを一時的に変更してテスト出力を抑制
-        original_level = logging.getLogger().level
-        logging.getLogger().setLevel(logging.CRITICAL)
-
-        try:
-            # clear_cacheを実行
-            if clear_all:
-                index_manager.clear_cache()
-            else:
-                index_manager.clear_cache(source_dir)
-
-            # プロパティ検証: キャッシュクリアの正確性
-            if clear_all:
-                # 全体クリアの場合、すべてのインデックスが削除される
-                remaining_directories = test_cache.list_indexed_directories()
-                assert len(remaining_directories) == 0, \
-                    "全体クリア後はインデックスが存在しないべき"
-            else:
-                # 特定ディレクトリクリアの場合
-                remaining_index = test_cache.load_directory_index(source_dir)
-                # どちらの場合でも、指定されたディレクトリのインデックスは存在しない
-                assert remaining_index is None, \
-                    "指定されたディレクトリのインデックスは存在しないべき"
-
-        finally:
-            # ログレベルを元に戻す
-            logging.getLogger().setLevel(original_level)
+    temp_path = tmp_path_factory.mktemp("index")
+    source_dir = temp_path / "test_source"
+
+    # IndexManagerを作成
+    index_manager = IndexManager()
+
+    # テスト用のIndexCacheを作成
+    test_cache = IndexCache()
+    test_cache.cache_dir = temp_path / "cache"
+    test_cache.cache_dir.mkdir(parents=True, exist_ok=True)
+    test_cache.global_index_file = test_cache.cache_dir / 'global_index.json'
+    index_manager.cache = test_cache
+
+    # テスト用インデックスを作成（source_dir_existsに基づいて）
+    if source_dir_exists:
+        index = RawFileIndex()
+        index.source_directory = source_dir
+        index.last_updated = datetime.now()
+        index.file_count = 5
+
+        # ダミーファイル情報を追加
+        for i in range(5):
+            dummy_info = RawFileInfo(
+                path=Path(f"/test/file_{i}.CR2"),
+                basename=f"file_{i}",
+                capture_datetime=datetime.now(),
+                file_size=1000000
+            )
+            index.add(dummy_info)
+
+        # インデックスを保存
+        test_cache.save_directory_index(source_dir, index)
+    
+    # clear_cacheを実行
+    if clear_all:
+        index_manager.clear_cache()
+    else:
+        index_manager.clear_cache(source_dir)
+
+    # プロパティ検証: キャッシュクリアの正確性
+    if clear_all:
+        # 全体クリアの場合、すべてのインデックスが削除される
+        remaining_directories = test_cache.list_indexed_directories()
+        assert len(remaining_directories) == 0, \
+            "全体クリア後はインデックスが存在しないべき"
+    else:
+        # 特定ディレクトリクリアの場合
+        remaining_index = test_cache.load_directory_index(source_dir)
+        # どちらの場合でも、指定されたディレクトリのインデックスは存在しない
+        assert remaining_index is None, \
+            "指定されたディレクトリのインデックスは存在しないべき"
 
 
 def test_index_manager_basic_operations():
@@ -404,23 +427,14 @@ def test_index_manager_basic_operations():
         mock_indexer = MockIndexer(expected_index)
         index_manager.indexer = mock_indexer
 
-        # ログレベルを一時的に変更してテスト出力を抑制
-        original_level = logging.getLogger().level
-        logging.getLogger().setLevel(logging.CRITICAL)
-
-        try:
-            # build_or_update_indexを実行
-            index_manager.build_or_update_index(source_dir, True, False, False)
-
-            # 基本的な動作確認
-            assert len(mock_indexer.build_index_calls) == 1
+        # build_or_update_indexを実行
+        index_manager.build_or_update_index(source_dir, True, False, False)
 
-            # IndexManagerが正常に動作している
-            call_args = mock_indexer.build_index_calls[0]
-            assert call_args[0] == source_dir
-            assert call_args[1] is True  # recursive
-            assert call_args[2] is False  # force_rebuild
+        # 基本的な動作確認
+        assert len(mock_indexer.build_index_calls) == 1
 
-        finally:
-            # ログレベルを元に戻す
-            logging.getLogger().setLevel(original_level)
\ No newline at end of file
+        # IndexManagerが正常に動作している
+        call_args = mock_indexer.build_index_calls[0]
+        assert call_args[0] == source_dir
+        assert call_args[1] is True  # recursive
+        assert call_args[2] is False  # force_rebuild
@@ -4,54 +4,67 @@ Indexerのプロパティベーステスト
 インデックス作成と永続化の正確性を検証します。
 """
 
+import json
+import pickle
 import tempfile
 import shutil
+import zlib
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime, timedelta
 from pathlib import Path
-from hypothesis import given, strategies as st, assume
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+import pytest
+from hypothesis import given, strategies as st
 from hypothesis.strategies import composite
 
 from src.indexer import RawFileIndex, IndexCache, Indexer
 from src.models import RawFileInfo
 
 
-@composite
-def raw_file_info_strategy(draw):
-    """RawFileInfoを生成するストラテジー"""
-    # ユニークなファイルパスを生成するためにUUIDを使用
-    import uuid
-    unique_id = str(uuid.uuid4())[:8]
-    filename = draw(st.text(min_size=1, max_size=10, 
-                           alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd'))))
-    extension = draw(st.sampled_from(['.CR2', '.NEF', '.ARW', '.RAF', '.ORF']))
-    path = Path(f"/test/{filename}_{unique_id}{extension}")
-    
-    # ベース名（小文字）
-    basename = f"{filename}_{unique_id}".lower()
-    
-    # 撮影日時（オプション）
-    has_datetime = draw(st.booleans())
-    capture_datetime = None
-    if has_datetime:
-        capture_datetime = draw(st.datetimes(
-            min_value=datetime(2020, 1, 1),
-            max_value=datetime(2024, 12, 31)
-        ))
-    
-    # ファイルサイズ
-    file_size = draw(st.integers(min_value=1, max_value=100_000_000))
-    
+pytestmark = pytest.mark.property
+
+
+# ストラテジーの構成要素（モジュールレベルで共有）
+_FILENAME = st.text(min_size=1, max_size=10,
+                    alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd')))
+_EXT = st.sampled_from(('.CR2', '.NEF', '.ARW', '.RAF', '.ORF'))
+# ファイル名の一意化に使用する番号（uuid4と異なり縮小可能）
+_UNIQ = st.integers(min_value=0, max_value=2**31)
+# 撮影日時（オプション）
+_CAPTURE_DATETIME = st.one_of(
+    st.none(),
+    st.datetimes(
+        min_value=datetime(2020, 1, 1),
+        max_value=datetime(2024, 12, 31)
+    )
+)
+_FILE_SIZE = st.integers(min_value=1, max_value=100_000_000)
+
+
+def _raw_file_info(filename, uniq, extension, capture_datetime, file_size):
+    """生成した要素からRawFileInfoを組み立てる"""
+    stem = f"{filename}_{uniq:08x}"
     return RawFileInfo(
-        path=path,
-        basename=basename,
+        path=Path(f"/test/{stem}{extension}"),
+        basename=stem.lower(),  # ベース名（小文字）
         capture_datetime=capture_datetime,
         file_size=file_size
     )
 
 
+def raw_file_info_strategy():
+    """RawFileInfoを生成するストラテジー"""
+    return st.builds(
+        _raw_file_info, _FILENAME, _UNIQ, _EXT, _CAPTURE_DATETIME, _FILE_SIZE
+    )
+
+
 @composite
 def raw_file_index_strategy(draw):
-    """RawFileIndexを生成するストラテジー"""
+    """RawFileIndexを生成するストラテジー（source_directoryは常に設定される）"""
     index = RawFileIndex()
     
     # ソースディレクトリを設定
@@ -65,13 +78,83 @@ def raw_file_index_strategy(draw):
     ))
     
     # ファイル情報を追加
-    file_infos = draw(st.lists(raw_file_info_strategy(), min_size=0, max_size=10))
+    file_infos = draw(st.lists(raw_file_info_strategy(), min_size=0, max_size=10,
+                               unique_by=lambda info: info.path))  # 同一パスの重複を避ける
     for info in file_infos:
         index.add(info)
     
     return index
 
 
+# 差分更新テストで使用する仮想ソースディレクトリ（ファイルは作成しない）
+_SOURCE_DIR = Path("/test/source")
+
+
+@contextmanager
+def _patched_stat(sizes):
+    """
+    指定したパスのPath.statをメモリ上のファイルサイズで置き換える
+
+    それ以外のパス（キャッシュファイルなど）は実際のstatを呼び出します。
+    """
+    real_stat = Path.stat
+
+    def fake_stat(path, *args, **kwargs):
+        if path in sizes:
+            return SimpleNamespace(st_size=sizes[path])
+        return real_stat(path, *args, **kwargs)
+
+    with patch.object(Path, 'stat', autospec=True, side_effect=fake_stat):
+        yield
+
+
+@pytest.fixture(scope="module")
+def index_cache(tmp_path_factory):
+    """差分更新テストで共有するIndexCache（ホームディレクトリのキャッシュを汚さない）"""
+    cache = IndexCache()
+    cache.cache_dir = tmp_path_factory.mktemp("index_cache")
+    cache.global_index_file = cache.cache_dir / 'global_index.json'
+    return cache
+
+
+@dataclass
+class IndexerHarness:
+    """差分更新テストで共有するIndexerとモック"""
+    indexer: Indexer
+    mock_exif_reader: Mock
+    mock_file_scanner: Mock
+    source_dir: Path
+
+
+@lru_cache(maxsize=None)
+def _mock_read_exif(path):
+    """
+    パスに基づいて決定的な日時を返すExif読み取りのモック
+
+    hash()はPYTHONHASHSEEDで結果が変わるため、実行間で安定したCRC32を使用します。
+    """
+    path_hash = zlib.crc32(str(path).encode()) % 1000
+    if path_hash % 3 == 0:  # 1/3の確率で日時を返す
+        return datetime(2024, 1, 1) + timedelta(days=path_hash % 365)
+    return None
+
+
+@pytest.fixture(scope="module")
+def indexer_fixture(index_cache):
+    """
+    Hypothesisの各例で再利用するIndexerとモック
+
+    モックの構築は1回のみ行い、各例ではreset_mock後に戻り値だけを設定します。
+    """
+    mock_exif_reader = Mock()
+    mock_file_scanner = Mock()
+    mock_file_scanner.get_basename.side_effect = lambda p: p.stem.lower()
+
+    indexer = Indexer(mock_exif_reader, mock_file_scanner)
+    indexer.cache = index_cache
+    return IndexerHarness(indexer, mock_exif_reader, mock_file_scanner, _SOURCE_DIR)
+
+
 class TestIndexerProperties:
     """Indexerのプロパティテスト"""
     
@@ -81,72 +164,104 @@ class TestIndexerProperties:
         **Feature: raw-jpeg-matcher, Property 11: インデックス永続化の一貫性**
         **Validates: Requirements 9.1**
         
-        任意のRAWファイルインデックスに対して、ディスクに保存してから読み込んだ
+        任意のRAWファイルインデックスに対して、キャッシュ形式に変換してから復元した
         インデックスは元のインデックスと同じ内容を持つべきである。
+        ファイルI/Oはtest_index_persistence_on_diskで1回だけ検証し、ここではメモリ上で往復させる。
         """
-        # 一時ディレクトリを作成
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # IndexCacheを作成（一時ディレクトリを使用）
-            cache = IndexCache()
-            cache.cache_dir = temp_path / 'cache'
-            cache.cache_dir.mkdir(parents=True, exist_ok=True)
-            cache.global_index_file = cache.cache_dir / 'global_index.json'
-            
-            # ソースディレクトリが設定されていない場合はスキップ
-            assume(original_index.source_directory is not None)
-            
-            # インデックスを保存
-            cache.save_directory_index(original_index.source_directory, original_index)
-            
-            # インデックスを読み込み
-            loaded_index = cache.load_directory_index(original_index.source_directory)
-            
-            # 読み込みが成功することを確認
-            assert loaded_index is not None
-            
-            # 基本情報の一致を確認
-            assert loaded_index.source_directory == original_index.source_directory
-            assert loaded_index.file_count == original_index.file_count
-            
-            # ファイル情報の一致を確認
-            original_files = original_index.get_all_files()
-            loaded_files = loaded_index.get_all_files()
-            
-            assert len(loaded_files) == len(original_files)
-            
-            # ファイル情報をパスでソートして比較
-            original_sorted = sorted(original_files, key=lambda x: str(x.path))
-            loaded_sorted = sorted(loaded_files, key=lambda x: str(x.path))
-            
-            for orig, loaded in zip(original_sorted, loaded_sorted):
-                assert loaded.path == orig.path
-                assert loaded.basename == orig.basename
-                assert loaded.capture_datetime == orig.capture_datetime
-                assert loaded.file_size == orig.file_size
-            
-            # インデックス検索機能の一致を確認
-            for orig_file in original_files:
-                # ベース名での検索
-                orig_by_basename = original_index.find_by_basename(orig_file.basename)
-                loaded_by_basename = loaded_index.find_by_basename(orig_file.basename)
-                assert len(loaded_by_basename) == len(orig_by_basename)
-                
-                # 撮影日時での検索（日時が存在する場合）
-                if orig_file.capture_datetime:
-                    orig_by_datetime = original_index.find_by_datetime(orig_file.capture_datetime)
-                    loaded_by_datetime = loaded_index.find_by_datetime(orig_file.capture_datetime)
-                    assert len(loaded_by_datetime) == len(orig_by_datetime)
-                    
-                    # ベース名と撮影日時での検索
-                    orig_by_both = original_index.find_by_basename_and_datetime(
-                        orig_file.basename, orig_file.capture_datetime)
-                    loaded_by_both = loaded_index.find_by_basename_and_datetime(
-                        orig_file.basename, orig_file.capture_datetime)
-                    assert len(loaded_by_both) == len(orig_by_both)
+        # キャッシュ形式のバイト列を経由して復元
+        loaded_index = IndexCache._deserialize(IndexCache._serialize(original_index))
+        
+        # 基本情報の一致を確認
+        assert loaded_index.source_directory == original_index.source_directory
+        assert loaded_index.last_updated == original_index.last_updated
+        assert loaded_index.file_count == original_index.file_count
+        
+        # ファイル情報の一致を確認
+        original_files = original_index.get_all_files()
+        loaded_files = loaded_index.get_all_files()
+        
+        assert len(loaded_files) == len(original_files)
+        
+        # ファイル情報をパスをキーとした辞書で比較（RawFileInfoはdataclassのため値で比較される）
+        assert {f.path: f for f in loaded_files} == {f.path: f for f in original_files}
+        
+        # インデックス検索機能の一致を確認（同じ検索条件は1回のみ確認）
+        basenames = {f.basename for f in original_files}
+        datetimes = {f.capture_datetime for f in original_files if f.capture_datetime}
+        basename_datetime_pairs = {
+            (f.basename, f.capture_datetime)
+            for f in original_files if f.capture_datetime
+        }
+        
+        # ベース名での検索
+        for basename in basenames:
+            assert (len(loaded_index.find_by_basename(basename))
+                    == len(original_index.find_by_basename(basename)))
+        
+        # 撮影日時での検索（日時が存在する場合）
+        for dt in datetimes:
+            assert (len(loaded_index.find_by_datetime(dt))
+                    == len(original_index.find_by_datetime(dt)))
+        
+        # ベース名と撮影日時での検索
+        for basename, dt in basename_datetime_pairs:
+            assert (len(loaded_index.find_by_basename_and_datetime(basename, dt))
+                    == len(original_index.find_by_basename_and_datetime(basename, dt)))
+    
+    def test_index_persistence_on_disk(self, tmp_path):
+        """
+        ディスクへの保存と読み込みのスモークテスト
+        
+        IndexCacheを通じて保存したインデックスが同じ内容で読み込まれることを確認します。
+        """
+        cache = IndexCache()
+        cache.cache_dir = tmp_path / 'cache'
+        cache.cache_dir.mkdir(parents=True, exist_ok=True)
+        cache.global_index_file = cache.cache_dir / 'global_index.json'
+        
+        source_dir = tmp_path / 'source'
+        original_index = RawFileIndex()
+        original_index.add(RawFileInfo(
+            path=source_dir / 'IMG_001.CR2',
+            basename='img_001',
+            capture_datetime=datetime(2024, 1, 1, 12, 0, 0),
+            file_size=100
+        ))
+        original_index.add(RawFileInfo(
+            path=source_dir / 'IMG_002.NEF',
+            basename='img_002',
+            capture_datetime=None,
+            file_size=200
+        ))
+        
+        # インデックスを保存して読み込み
+        cache.save_directory_index(source_dir, original_index)
+        loaded_index = cache.load_directory_index(source_dir)
+        
+        # 読み込みが成功し、内容が一致することを確認
+        assert loaded_index is not None
+        assert loaded_index.source_directory == source_dir
+        assert loaded_index.file_count == original_index.file_count
+        assert loaded_index.by_basename == original_index.by_basename
+        assert loaded_index.by_datetime == original_index.by_datetime
     
-    @given(st.lists(raw_file_info_strategy(), min_size=1, max_size=5))
+    def test_index_cache_version_mismatch_is_cache_miss(self, tmp_path):
+        """レイアウトのバージョンが異なるキャッシュは読み込みエラーにせず未作成として扱うテスト"""
+        cache = IndexCache()
+        cache.cache_dir = tmp_path / 'cache'
+        cache.cache_dir.mkdir(parents=True, exist_ok=True)
+        
+        source_dir = tmp_path / 'source'
+        columnar = RawFileIndex().to_columnar()
+        columnar['version'] = 0
+        cache.get_cache_path(source_dir).write_bytes(pickle.dumps(columnar))
+        
+        with patch.object(cache.logger, 'error') as mock_error:
+            assert cache.load_directory_index(source_dir) is None
+        mock_error.assert_not_called()
+    
+    @given(st.lists(raw_file_info_strategy(), min_size=1, max_size=5,
+                    unique_by=lambda info: info.path))  # 同一パスの重複を避ける
     def test_index_add_remove_consistency(self, file_infos):
         """
         インデックスへの追加と削除の一貫性をテスト
@@ -178,6 +293,7 @@ class TestIndexerProperties:
         assert len(index.get_all_files()) == 0
         assert len(index.by_basename) == 0
         assert len(index.by_datetime) == 0
+        assert len(index.by_basename_and_datetime) == 0
     
     @given(raw_file_info_strategy())
     def test_index_search_consistency(self, file_info):
@@ -212,7 +328,93 @@ class TestIndexerProperties:
                 assert result.basename == file_info.basename
                 assert result.capture_datetime == file_info.capture_datetime
     
+    def test_legacy_json_cache_is_loaded_and_replaced(self):
+        """
+        旧形式（JSON）のキャッシュが読み込まれ、保存時にバイナリ形式へ置き換わることをテスト
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            
+            cache = IndexCache()
+            cache.cache_dir = temp_path / 'cache'
+            cache.cache_dir.mkdir(parents=True, exist_ok=True)
+            cache.global_index_file = cache.cache_dir / 'global_index.json'
+            
+            source_dir = temp_path / 'source'
+            original_index = RawFileIndex()
+            original_index.add(RawFileInfo(
+                path=source_dir / 'IMG_001.CR2',
+                basename='img_001',
+                capture_datetime=datetime(2024, 1, 1, 12, 0, 0),
+                file_size=100
+            ))
+            
+            # 旧形式のキャッシュファイルを作成
+            legacy_path = cache.get_legacy_cache_path(source_dir)
+            legacy_path.write_text(json.dumps(original_index.to_dict()), encoding='utf-8')
+            
+            loaded_index = cache.load_directory_index(source_dir)
+            assert loaded_index is not None
+            assert loaded_index.by_basename == original_index.by_basename
+            
+            # 保存するとバイナリ形式に置き換わる
+            cache.save_directory_index(source_dir, loaded_index)
+            assert cache.get_cache_path(source_dir).exists()
+            assert not legacy_path.exists()
+            
+            # 削除すると見つかったことが報告される
+            assert cache.remove_directory_index(source_dir) is True
+            assert not cache.get_cache_path(source_dir).exists()
+    
     @given(st.lists(raw_file_info_strategy(), min_size=0, max_size=10))
+    def test_index_add_many_consistency(self, file_infos):
+        """
+        一括追加の一貫性をテスト
+        
+        add_many()で構築したインデックスは、同じファイルを順にadd()した
+        インデックスと同じ内容を持つべきである。
+        """
+        bulk_index = RawFileIndex()
+        bulk_index.add_many(iter(file_infos))  # 長さを持たない反復子も受け付ける
+        expected_index = RawFileIndex()
+        for info in file_infos:
+            expected_index.add(info)
+        
+        assert bulk_index.file_count == expected_index.file_count
+        assert bulk_index.by_basename == expected_index.by_basename
+        assert bulk_index.by_datetime == expected_index.by_datetime
+        assert bulk_index.by_basename_and_datetime == expected_index.by_basename_and_datetime
+        
+        # from_iterable()も同じ内容のインデックスを作成する
+        built_index = RawFileIndex.from_iterable(file_infos)
+        assert built_index.file_count == expected_index.file_count
+        assert built_index.by_basename_and_datetime == expected_index.by_basename_and_datetime
+    
+    @given(st.lists(raw_file_info_strategy(), min_size=0, max_size=10),
+           st.lists(raw_file_info_strategy(), min_size=0, max_size=10))
+    def test_index_merge_consistency(self, first_infos, second_infos):
+        """
+        インデックス統合の一貫性をテスト
+        
+        merge()で統合したインデックスは、同じファイルを順にadd()した
+        インデックスと同じ検索結果を返すべきである。
+        """
+        merged_index = RawFileIndex()
+        expected_index = RawFileIndex()
+        for file_infos in (first_infos, second_infos):
+            dir_index = RawFileIndex()
+            for info in file_infos:
+                dir_index.add(info)
+                expected_index.add(info)
+            merged_index.merge(dir_index)
+        
+        assert merged_index.file_count == expected_index.file_count
+        assert merged_index.by_basename == expected_index.by_basename
+        assert merged_index.by_datetime == expected_index.by_datetime
+        assert merged_index.by_basename_and_datetime == expected_index.by_basename_and_datetime
+    
+    @given(st.lists(raw_file_info_strategy(), min_size=0, max_size=10,
+                    unique_by=lambda info: info.path))  # 同一パスの重複を避ける
     def test_index_serialization_roundtrip(self, file_infos):
         """
         インデックスのシリアライゼーション往復テスト
@@ -244,72 +446,52 @@ class TestIndexerProperties:
         
         assert len(restored_files) == len(original_files)
         
-        # ファイル情報をパスでソートして比較
-        original_sorted = sorted(original_files, key=lambda x: str(x.path))
-        restored_sorted = sorted(restored_files, key=lambda x: str(x.path))
-        
-        for orig, restored in zip(original_sorted, restored_sorted):
-            assert restored.path == orig.path
-            assert restored.basename == orig.basename
-            assert restored.capture_datetime == orig.capture_datetime
-            assert restored.file_size == orig.file_size
+        # ファイル情報をパスをキーとした辞書で比較（RawFileInfoはdataclassのため値で比較される）
+        assert {f.path: f for f in restored_files} == {f.path: f for f in original_files}
     
     @given(st.lists(raw_file_info_strategy(), min_size=0, max_size=8),
            st.lists(raw_file_info_strategy(), min_size=0, max_size=3))
-    def test_incremental_update_accuracy(self, initial_files, additional_files):
+    def test_incremental_update_accuracy(self, indexer_fixture, initial_files, additional_files):
         """
         **Feature: raw-jpeg-matcher, Property 12: 差分更新の正確性**
         **Validates: Requirements 9.2, 9.4, 9.5**
         
         任意の既存インデックスと新しいファイルセットに対して、差分更新後の
         インデックスは完全再構築したインデックスと同じ結果を持つべきである。
+        ファイルは作成せず、Path.statをファイルサイズの辞書で置き換えます。
         """
-        # 一時ディレクトリを作成
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            source_dir = temp_path / "source"
-            source_dir.mkdir()
-            
-            # 初期ファイルを作成
-            initial_file_paths = []
-            for i, info in enumerate(initial_files):
-                file_path = source_dir / f"initial_{i}{info.path.suffix}"
-                file_path.write_text(f"dummy content {i}")
-                initial_file_paths.append(file_path)
-            
-            # モックのExifReaderとFileScannerを作成
-            from unittest.mock import Mock
-            
-            mock_exif_reader = Mock()
-            mock_file_scanner = Mock()
-            
-            # 初期ファイルのスキャン結果を設定
-            mock_file_scanner.scan_raw_files.return_value = initial_file_paths
-            mock_file_scanner.get_basename.side_effect = lambda p: p.stem.lower()
-            
-            # Exif読み取り結果を設定
-            def mock_read_exif(path):
-                # パスに基づいて決定的な日時を返す
-                path_hash = hash(str(path)) % 1000
-                if path_hash % 3 == 0:  # 1/3の確率で日時を返す
-                    return datetime(2024, 1, 1) + timedelta(days=path_hash % 365)
-                return None
-            
-            mock_exif_reader.read_capture_datetime.side_effect = mock_read_exif
-            
-            # Indexerを作成
-            indexer = Indexer(mock_exif_reader, mock_file_scanner)
-            
+        indexer = indexer_fixture.indexer
+        mock_file_scanner = indexer_fixture.mock_file_scanner
+        source_dir = indexer_fixture.source_dir
+        
+        # 初期ファイルのパス
+        initial_file_paths = [
+            source_dir / f"initial_{i}{info.path.suffix}"
+            for i, info in enumerate(initial_files)
+        ]
+        
+        # 追加ファイルのパス
+        additional_file_paths = [
+            source_dir / f"additional_{i}{info.path.suffix}"
+            for i, info in enumerate(additional_files)
+        ]
+        
+        sizes = {
+            path: info.file_size
+            for path, info in zip(initial_file_paths + additional_file_paths,
+                                  initial_files + additional_files)
+        }
+        
+        # 前の例の呼び出し記録を消去し、初期ファイルのスキャン結果とExif読み取り結果を設定
+        mock_file_scanner.reset_mock()
+        indexer_fixture.mock_exif_reader.reset_mock()
+        mock_file_scanner.scan_raw_files.return_value = initial_file_paths
+        indexer_fixture.mock_exif_reader.read_capture_datetime.side_effect = _mock_read_exif
+        
+        with _patched_stat(sizes):
             # 初期インデックスを構築
             initial_index = indexer.build_index(source_dir, recursive=True, force_rebuild=True)
             
-            # 追加ファイルを作成
-            additional_file_paths = []
-            for i, info in enumerate(additional_files):
-                file_path = source_dir / f"additional_{i}{info.path.suffix}"
-                file_path.write_text(f"additional content {i}")
-                additional_file_paths.append(file_path)
-            
             # 全ファイルのスキャン結果を更新
             all_file_paths = initial_file_paths + additional_file_paths
             mock_file_scanner.scan_raw_files.return_value = all_file_paths
@@ -320,90 +502,85 @@ class TestIndexerProperties:
             
             # 完全再構築を実行（比較用）
             rebuilt_index = indexer._build_new_index(source_dir, recursive=True)
-            
-            # 結果の比較
-            assert updated_index.file_count == rebuilt_index.file_count
-            
-            # ファイル情報の比較
-            updated_files = sorted(updated_index.get_all_files(), key=lambda x: str(x.path))
-            rebuilt_files = sorted(rebuilt_index.get_all_files(), key=lambda x: str(x.path))
-            
-            assert len(updated_files) == len(rebuilt_files)
-            
-            for updated, rebuilt in zip(updated_files, rebuilt_files):
-                assert updated.path == rebuilt.path
-                assert updated.basename == rebuilt.basename
-                assert updated.capture_datetime == rebuilt.capture_datetime
-                assert updated.file_size == rebuilt.file_size
-            
-            # インデックス検索結果の比較
-            for file_info in updated_files:
-                # ベース名での検索
-                updated_by_basename = updated_index.find_by_basename(file_info.basename)
-                rebuilt_by_basename = rebuilt_index.find_by_basename(file_info.basename)
-                assert len(updated_by_basename) == len(rebuilt_by_basename)
-                
-                # 撮影日時での検索（日時が存在する場合）
-                if file_info.capture_datetime:
-                    updated_by_datetime = updated_index.find_by_datetime(file_info.capture_datetime)
-                    rebuilt_by_datetime = rebuilt_index.find_by_datetime(file_info.capture_datetime)
-                    assert len(updated_by_datetime) == len(rebuilt_by_datetime)
+        
+        # 結果の比較
+        assert updated_index.file_count == rebuilt_index.file_count
+        
+        # ファイル情報の比較
+        updated_files = updated_index.get_all_files()
+        rebuilt_files = rebuilt_index.get_all_files()
+        
+        assert len(updated_files) == len(rebuilt_files)
+        
+        # パスをキーとした辞書で比較（RawFileInfoはdataclassのため値で比較される）
+        assert {f.path: f for f in updated_files} == {f.path: f for f in rebuilt_files}
+        
+        # インデックス検索結果の比較
+        for file_info in updated_files:
+            # ベース名での検索
+            updated_by_basename = updated_index.find_by_basename(file_info.basename)
+            rebuilt_by_basename = rebuilt_index.find_by_basename(file_info.basename)
+            assert len(updated_by_basename) == len(rebuilt_by_basename)
+            
+            # 撮影日時での検索（日時が存在する場合）
+            if file_info.capture_datetime:
+                updated_by_datetime = updated_index.find_by_datetime(file_info.capture_datetime)
+                rebuilt_by_datetime = rebuilt_index.find_by_datetime(file_info.capture_datetime)
+                assert len(updated_by_datetime) == len(rebuilt_by_datetime)
     
-    @given(st.lists(raw_file_info_strategy(), min_size=1, max_size=5))
-    def test_file_deletion_update_accuracy(self, initial_files):
+    @given(initial_files=st.lists(raw_file_info_strategy(), min_size=1, max_size=5),
+           data=st.data())
+    def test_file_deletion_update_accuracy(self, indexer_fixture, initial_files, data):
         """
         ファイル削除時の差分更新の正確性をテスト
         
         任意の初期ファイルセットに対して、一部のファイルを削除した後の
         差分更新は正確に削除を反映すべきである。
         """
-        # 一時ディレクトリを作成
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            source_dir = temp_path / "source"
-            source_dir.mkdir()
-            
-            # 初期ファイルを作成
-            initial_file_paths = []
-            for i, info in enumerate(initial_files):
-                file_path = source_dir / f"file_{i}{info.path.suffix}"
-                file_path.write_text(f"content {i}")
-                initial_file_paths.append(file_path)
-            
-            # モックのExifReaderとFileScannerを作成
-            from unittest.mock import Mock
-            
-            mock_exif_reader = Mock()
-            mock_file_scanner = Mock()
-            
-            # 初期ファイルのスキャン結果を設定
-            mock_file_scanner.scan_raw_files.return_value = initial_file_paths
-            mock_file_scanner.get_basename.side_effect = lambda p: p.stem.lower()
-            mock_exif_reader.read_capture_datetime.return_value = None
-            
-            # Indexerを作成
-            indexer = Indexer(mock_exif_reader, mock_file_scanner)
-            
+        indexer = indexer_fixture.indexer
+        mock_file_scanner = indexer_fixture.mock_file_scanner
+        source_dir = indexer_fixture.source_dir
+        
+        # 初期ファイルのパスとサイズ（ファイルは作成しない）
+        initial_file_paths = [
+            source_dir / f"file_{i}{info.path.suffix}"
+            for i, info in enumerate(initial_files)
+        ]
+        sizes = {
+            path: info.file_size
+            for path, info in zip(initial_file_paths, initial_files)
+        }
+        
+        # 前の例の呼び出し記録を消去し、初期ファイルのスキャン結果とExif読み取り結果を設定
+        mock_file_scanner.reset_mock()
+        indexer_fixture.mock_exif_reader.reset_mock()
+        mock_file_scanner.scan_raw_files.return_value = initial_file_paths
+        indexer_fixture.mock_exif_reader.read_capture_datetime.side_effect = None
+        indexer_fixture.mock_exif_reader.read_capture_datetime.return_value = None
+        
+        with _patched_stat(sizes):
             # 初期インデックスを構築
             initial_index = indexer.build_index(source_dir, recursive=True, force_rebuild=True)
             
-            # 一部のファイルを削除（最初のファイルを削除）
-            if initial_file_paths:
-                deleted_file = initial_file_paths[0]
-                deleted_file.unlink()
-                remaining_files = initial_file_paths[1:]
-                
-                # スキャン結果を更新
-                mock_file_scanner.scan_raw_files.return_value = remaining_files
-                
-                # 差分更新を実行
-                updated_index = indexer.update_index_incrementally(
-                    initial_index, source_dir, recursive=True)
-                
-                # 削除されたファイルがインデックスから除去されていることを確認
-                assert updated_index.file_count == len(remaining_files)
-                
-                # 削除されたファイルが検索結果に含まれないことを確認
-                deleted_basename = deleted_file.stem.lower()
-                found_files = updated_index.find_by_basename(deleted_basename)
-                assert all(info.path != deleted_file for info in found_files)
\ No newline at end of file
+            # 一部のファイルを削除（生成した位置のファイルをスキャン結果から除外）
+            idx_to_delete = data.draw(
+                st.integers(min_value=0, max_value=len(initial_files) - 1),
+                label="idx_to_delete")
+            deleted_file = initial_file_paths[idx_to_delete]
+            remaining_files = (initial_file_paths[:idx_to_delete]
+                               + initial_file_paths[idx_to_delete + 1:])
+            
+            # スキャン結果を更新
+            mock_file_scanner.scan_raw_files.return_value = remaining_files
+            
+            # 差分更新を実行
+            updated_index = indexer.update_index_incrementally(
+                initial_index, source_dir, recursive=True)
+        
+        # 削除されたファイルがインデックスから除去されていることを確認
+        assert updated_index.file_count == len(remaining_files)
+        
+        # 削除されたファイルが検索結果に含まれないことを確認
+        deleted_basename = deleted_file.stem.lower()
+        found_files = updated_index.find_by_basename(deleted_basename)
+        assert all(info.path != deleted_file for info in found_files)
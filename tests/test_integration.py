@@ -7,74 +7,186 @@
 """
 
 import os
+import platform
 import shutil
-import subprocess
 import sys
 import tempfile
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List
 import pytest
 
 from src.cli import main
 from src.index_manager import IndexManager
 from src.match_manager import MatchManager
-from src.models import ProcessingStats
+
+
+# キャッシュをワーカー専用のホームディレクトリに置き、並列実行時にワーカー間で共有しない
+pytestmark = pytest.mark.usefixtures("isolated_home")
+
+
+# テストで使用するサンプルファイル
+_RAW_FILES = ["test001.CR3", "test002.cr3", "test004.CR3"]
+_JPEG_FILES = ["test001.JPG", "test002.jpg", "test003.JPG", "test004.JPG"]
+
+# 実行中のプラットフォーム（テストごとに問い合わせない）
+_PLATFORM = platform.system()
+
+# サンプルファイルの配置場所
+_TEST_DATA_DIR = Path(__file__).parent / "data"
+
+# 結果検証で使用する拡張子（小文字）
+RAW_EXTS = frozenset({'.cr2', '.cr3', '.nef', '.arw'})
+JPG_EXTS = frozenset({'.jpg', '.jpeg'})
+
+
+def _count_by_ext(directory: Path, exts: frozenset) -> int:
+    """ディレクトリ直下で指定拡張子（小文字で比較）を持つファイル数を数える"""
+    with os.scandir(directory) as entries:
+        return sum(1 for e in entries
+                   if e.is_file() and os.path.splitext(e.name)[1].lower() in exts)
+
+
+def _copy_master(samples: Dict[str, Path], master_dir: Path, filenames: List[str]) -> Path:
+    """サンプルファイルをセッション共有のマスターディレクトリへ1回だけコピー"""
+    for filename in filenames:
+        if filename in samples:
+            shutil.copy2(samples[filename], master_dir / filename)
+    return master_dir
+
+
+def _link_files(master_dir: Path, dest_dir: Path) -> Path:
+    """
+    マスターディレクトリのファイルをハードリンクで作業ディレクトリに配置
+
+    ハードリンクを作成できない場合（別ファイルシステム、非対応環境など）はコピーします。
+    """
+    with os.scandir(master_dir) as entries:
+        for entry in entries:
+            dest_file = dest_dir / entry.name
+            try:
+                os.link(entry.path, dest_file)
+            except OSError:
+                shutil.copy2(entry.path, dest_file)
+    return dest_dir
+
+
+@pytest.fixture(scope="session")
+def test_data_dir() -> Path:
+    """テストデータディレクトリのパスを取得"""
+    return _TEST_DATA_DIR
+
+
+@pytest.fixture(scope="session")
+def samples(test_data_dir: Path) -> Dict[str, Path]:
+    """
+    存在するサンプルファイルのファイル名とパスの対応（存在確認はセッション内で1回のみ）
+
+    テストでは ``exists()`` を呼ばずに ``name in samples`` で利用可否を判定します。
+    """
+    return {name: test_data_dir / name for name in _RAW_FILES + _JPEG_FILES
+            if (test_data_dir / name).exists()}
+
+
+@pytest.fixture(scope="session")
+def _raw_master(samples: Dict[str, Path], tmp_path_factory) -> Path:
+    """RAWファイルの参照用コピー（セッション内で共有、読み取り専用として扱う）"""
+    return _copy_master(samples, tmp_path_factory.mktemp("raw_master"), _RAW_FILES)
+
+
+@pytest.fixture(scope="session")
+def _jpeg_master(samples: Dict[str, Path], tmp_path_factory) -> Path:
+    """JPEGファイルの参照用コピー（セッション内で共有、読み取り専用として扱う）"""
+    return _copy_master(samples, tmp_path_factory.mktemp("jpeg_master"), _JPEG_FILES)
+
+
+def _set_home(monkeypatch, home: Path) -> None:
+    """インデックスキャッシュの保存先（ホームディレクトリ配下）を指定ディレクトリに切り替える"""
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setenv("USERPROFILE", str(home))  # Windows
+
+
+@pytest.fixture(scope="session")
+def _prebuilt_index(_raw_master: Path, tmp_path_factory) -> Path:
+    """
+    RAWマスターディレクトリのインデックスをセッション内で1回だけ構築
+
+    Returns:
+        構築したキャッシュを含むホームディレクトリ
+    """
+    home = tmp_path_factory.mktemp("prebuilt_home")
+    with pytest.MonkeyPatch.context() as mp:
+        _set_home(mp, home)
+        IndexManager().build_or_update_index(_raw_master, True, False, False)
+    return home
+
+
+@pytest.fixture
+def prebuilt_cache(_prebuilt_index: Path, _raw_master: Path, isolated_home: Path) -> Path:
+    """
+    構築済みインデックスのキャッシュでワーカー専用ホームディレクトリのキャッシュを置き換える
+
+    Returns:
+        インデックス化済みのソースディレクトリ（RAWマスター、読み取り専用として扱う）
+    """
+    cache_subdir = Path('.raw_jpeg_matcher') / 'cache'
+    shutil.rmtree(isolated_home / cache_subdir, ignore_errors=True)
+    shutil.copytree(_prebuilt_index / cache_subdir, isolated_home / cache_subdir)
+    return _raw_master
+
+
+def _check_cli_index(index_manager: IndexManager, source_dir: Path, target_dir: Path, captured) -> None:
+    """indexコマンドの事後条件: インデックスが作成されている"""
+    indexed_dirs = index_manager.cache.list_indexed_directories()
+    assert len(indexed_dirs) == 1
+    # 同一ディレクトリかをstatで比較（シンボリックリンク等の表記の違いを考慮）
+    assert indexed_dirs[0][0].samefile(source_dir)
+
+
+def _check_cli_match(index_manager: IndexManager, source_dir: Path, target_dir: Path, captured) -> None:
+    """matchコマンドの事後条件: マッチしたRAWファイルがコピーされている"""
+    target_names = set(os.listdir(target_dir))
+    assert "test001.CR3" in target_names
+    assert "test002.cr3" in target_names
+
+
+def _check_cli_list_index(index_manager: IndexManager, source_dir: Path, target_dir: Path, captured) -> None:
+    """list-indexコマンドの事後条件: インデックス化されたディレクトリが出力されている"""
+    assert str(source_dir) in captured.out
+
+
+def _check_cli_clear_cache(index_manager: IndexManager, source_dir: Path, target_dir: Path, captured) -> None:
+    """clear-cacheコマンドの事後条件: キャッシュがクリアされている"""
+    assert len(index_manager.cache.list_indexed_directories()) == 0
 
 
 class TestIntegration:
     """統合テストクラス"""
     
     @pytest.fixture
-    def test_data_dir(self) -> Path:
-        """テストデータディレクトリのパスを取得"""
-        return Path(__file__).parent / "data"
-    
-    @pytest.fixture
-    def temp_source_dir(self, test_data_dir: Path) -> Path:
+    def temp_source_dir(self, _raw_master: Path, tmp_path_factory) -> Path:
         """一時的なソースディレクトリを作成（RAWファイル用）"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # RAWファイルをコピー
-            raw_files = [
-                "test001.CR3",
-                "test002.cr3", 
-                "test004.CR3"
-            ]
-            
-            for raw_file in raw_files:
-                src_file = test_data_dir / raw_file
-                if src_file.exists():
-                    shutil.copy2(src_file, temp_path / raw_file)
-            
-            yield temp_path
+        return _link_files(_raw_master, tmp_path_factory.mktemp("source"))
     
     @pytest.fixture
-    def temp_target_dir(self, test_data_dir: Path) -> Path:
+    def temp_target_dir(self, _jpeg_master: Path, tmp_path_factory) -> Path:
         """一時的なターゲットディレクトリを作成（JPEGファイル用）"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # JPEGファイルをコピー
-            jpeg_files = [
-                "test001.JPG",
-                "test002.jpg",
-                "test003.JPG",
-                "test004.JPG"
-            ]
-            
-            for jpeg_file in jpeg_files:
-                src_file = test_data_dir / jpeg_file
-                if src_file.exists():
-                    shutil.copy2(src_file, temp_path / jpeg_file)
-            
-            yield temp_path
+        return _link_files(_jpeg_master, tmp_path_factory.mktemp("target"))
+    
+    @pytest.fixture
+    def index_manager(self, isolated_home: Path) -> IndexManager:
+        """テスト内で共有するIndexManager（キャッシュの保存先はワーカー専用ホーム）"""
+        return IndexManager()
     
     @pytest.fixture
-    def clean_cache(self):
+    def match_manager(self, isolated_home: Path) -> MatchManager:
+        """テスト内で共有するMatchManager（キャッシュの保存先はワーカー専用ホーム）"""
+        return MatchManager()
+    
+    @pytest.fixture
+    def clean_cache(self, index_manager: IndexManager):
         """テスト前後でキャッシュをクリア"""
         # テスト前にキャッシュをクリア
-        index_manager = IndexManager()
         index_manager.clear_cache()
         
         yield
@@ -82,7 +194,7 @@ class TestIntegration:
         # テスト後にキャッシュをクリア
         index_manager.clear_cache()
     
-    def test_end_to_end_workflow(self, temp_source_dir: Path, temp_target_dir: Path, clean_cache):
+    def test_end_to_end_workflow(self, temp_source_dir: Path, temp_target_dir: Path, clean_cache, index_manager: IndexManager, match_manager: MatchManager):
         """
         エンドツーエンドの処理フローをテスト
         
@@ -93,7 +205,6 @@ class TestIntegration:
         5. clear-cacheコマンドでキャッシュクリア
         """
         # 1. indexコマンドでRAWファイルをインデックス化
-        index_manager = IndexManager()
         index_manager.build_or_update_index(
             source_dir=temp_source_dir,
             recursive=True,
@@ -104,17 +215,14 @@ class TestIntegration:
         # 2. インデックスが作成されたことを確認
         indexed_dirs = index_manager.cache.list_indexed_directories()
         assert len(indexed_dirs) == 1
-        # パスの正規化を考慮して比較
-        assert indexed_dirs[0][0].resolve() == temp_source_dir.resolve()
+        # 同一ディレクトリかをstatで比較（シンボリックリンク等の表記の違いを考慮）
+        assert indexed_dirs[0][0].samefile(temp_source_dir)
         assert indexed_dirs[0][2] == 3  # RAWファイル数
         
         # 3. matchコマンドでマッチング処理
-        match_manager = MatchManager()
-        
         # マッチング前のターゲットディレクトリのファイル数を確認
-        initial_files = list(temp_target_dir.glob("*"))
-        initial_jpeg_count = len([f for f in initial_files if f.suffix.lower() in ['.jpg', '.jpeg']])
-        initial_raw_count = len([f for f in initial_files if f.suffix.lower() in ['.cr2', '.cr3', '.nef', '.arw']])
+        initial_jpeg_count = _count_by_ext(temp_target_dir, JPG_EXTS)
+        initial_raw_count = _count_by_ext(temp_target_dir, RAW_EXTS)
         
         assert initial_jpeg_count == 4  # test001.JPG, test002.jpg, test003.JPG, test004.JPG
         assert initial_raw_count == 0   # 初期状態ではRAWファイルはない
@@ -128,9 +236,8 @@ class TestIntegration:
         )
         
         # 4. 結果の検証
-        final_files = list(temp_target_dir.glob("*"))
-        final_jpeg_count = len([f for f in final_files if f.suffix.lower() in ['.jpg', '.jpeg']])
-        final_raw_count = len([f for f in final_files if f.suffix.lower() in ['.cr2', '.cr3', '.nef', '.arw']])
+        final_jpeg_count = _count_by_ext(temp_target_dir, JPG_EXTS)
+        final_raw_count = _count_by_ext(temp_target_dir, RAW_EXTS)
         
         # JPEGファイル数は変わらない
         assert final_jpeg_count == 4
@@ -143,10 +250,11 @@ class TestIntegration:
         expected_raw_count = 2  # test001.CR3, test002.cr3
         assert final_raw_count == expected_raw_count
         
-        # 具体的なファイルの存在確認
-        assert (temp_target_dir / "test001.CR3").exists()
-        assert (temp_target_dir / "test002.cr3").exists()
-        assert not (temp_target_dir / "test004.CR3").exists()  # 撮影日時が異なるためマッチしない
+        # 具体的なファイルの存在確認（ディレクトリを1回だけ読み取る）
+        target_names = set(os.listdir(temp_target_dir))
+        assert "test001.CR3" in target_names
+        assert "test002.cr3" in target_names
+        assert "test004.CR3" not in target_names  # 撮影日時が異なるためマッチしない
         
         # 5. clear-cacheコマンドでキャッシュクリア
         index_manager.clear_cache()
@@ -155,115 +263,63 @@ class TestIntegration:
         indexed_dirs_after_clear = index_manager.cache.list_indexed_directories()
         assert len(indexed_dirs_after_clear) == 0
     
-    def test_cli_index_command(self, temp_source_dir: Path, clean_cache, monkeypatch):
-        """CLIのindexコマンドをテスト"""
-        # コマンドライン引数を設定
-        test_args = ['raw-jpeg-matcher', 'index', str(temp_source_dir), '--verbose']
-        monkeypatch.setattr(sys, 'argv', test_args)
-        
-        # CLIを実行
-        exit_code = main()
-        assert exit_code == 0
-        
-        # インデックスが作成されたことを確認
-        index_manager = IndexManager()
-        indexed_dirs = index_manager.cache.list_indexed_directories()
-        assert len(indexed_dirs) == 1
-        # パスの正規化を考慮して比較
-        assert indexed_dirs[0][0].resolve() == temp_source_dir.resolve()
-    
-    def test_cli_match_command(self, temp_source_dir: Path, temp_target_dir: Path, clean_cache, monkeypatch):
-        """CLIのmatchコマンドをテスト"""
-        # まずインデックスを作成
-        index_manager = IndexManager()
-        index_manager.build_or_update_index(
-            source_dir=temp_source_dir,
-            recursive=True,
-            force_rebuild=False,
-            verbose=False
-        )
+    def test_cli_index_command(self, temp_source_dir: Path, temp_target_dir: Path, clean_cache,
+                               index_manager: IndexManager, monkeypatch, capsys):
+        """CLIのindexコマンドをテスト（構築済みインデックスを使わず、空のキャッシュから作成する）"""
+        # インデックスが存在しないことを確認
+        assert len(index_manager.cache.list_indexed_directories()) == 0
         
         # コマンドライン引数を設定
-        test_args = ['raw-jpeg-matcher', 'match', str(temp_target_dir), '--verbose']
-        monkeypatch.setattr(sys, 'argv', test_args)
+        monkeypatch.setattr(sys, 'argv', ['raw-jpeg-matcher', 'index', str(temp_source_dir), '--verbose'])
         
         # CLIを実行
         exit_code = main()
         assert exit_code == 0
         
-        # マッチしたRAWファイルがコピーされていることを確認
-        assert (temp_target_dir / "test001.CR3").exists()
-        assert (temp_target_dir / "test002.cr3").exists()
+        # インデックスが作成されていることを確認
+        _check_cli_index(index_manager, temp_source_dir, temp_target_dir, capsys.readouterr())
     
-    def test_cli_list_index_command(self, temp_source_dir: Path, clean_cache, monkeypatch, capsys):
-        """CLIのlist-indexコマンドをテスト"""
-        # まずインデックスを作成
-        index_manager = IndexManager()
-        index_manager.build_or_update_index(
-            source_dir=temp_source_dir,
-            recursive=True,
-            force_rebuild=False,
-            verbose=False
-        )
+    @pytest.mark.parametrize("args, check", [
+        (['match', '{target}', '--verbose'], _check_cli_match),
+        (['list-index', '--verbose'], _check_cli_list_index),
+        (['clear-cache'], _check_cli_clear_cache),
+    ], ids=['match', 'list-index', 'clear-cache'])
+    def test_cli_commands(self, args: List[str], check, prebuilt_cache: Path,
+                          temp_target_dir: Path, index_manager: IndexManager, monkeypatch, capsys):
+        """CLIの各コマンドをテスト（構築済みインデックスを共有し、引数と事後条件のみを変える）"""
+        # 構築済みインデックスが存在することを確認
+        assert len(index_manager.cache.list_indexed_directories()) == 1
         
         # コマンドライン引数を設定
-        test_args = ['raw-jpeg-matcher', 'list-index', '--verbose']
+        test_args = ['raw-jpeg-matcher'] + [
+            arg.format(source=prebuilt_cache, target=temp_target_dir) for arg in args
+        ]
         monkeypatch.setattr(sys, 'argv', test_args)
         
         # CLIを実行
         exit_code = main()
         assert exit_code == 0
         
-        # 出力を確認
-        captured = capsys.readouterr()
-        assert str(temp_source_dir) in captured.out
+        # コマンドごとの事後条件を確認
+        check(index_manager, prebuilt_cache, temp_target_dir, capsys.readouterr())
     
-    def test_cli_clear_cache_command(self, temp_source_dir: Path, clean_cache, monkeypatch):
-        """CLIのclear-cacheコマンドをテスト"""
-        # まずインデックスを作成
-        index_manager = IndexManager()
-        index_manager.build_or_update_index(
-            source_dir=temp_source_dir,
-            recursive=True,
-            force_rebuild=False,
-            verbose=False
-        )
-        
-        # インデックスが存在することを確認
-        indexed_dirs = index_manager.cache.list_indexed_directories()
-        assert len(indexed_dirs) == 1
-        
-        # コマンドライン引数を設定
-        test_args = ['raw-jpeg-matcher', 'clear-cache']
-        monkeypatch.setattr(sys, 'argv', test_args)
-        
-        # CLIを実行
-        exit_code = main()
-        assert exit_code == 0
+    def test_source_filter_functionality(self, prebuilt_cache: Path, temp_target_dir: Path, samples: Dict[str, Path], index_manager: IndexManager, match_manager: MatchManager):
+        """ソースフィルター機能をテスト（1つ目のソースは構築済みインデックスを使用）"""
+        temp_source_dir = prebuilt_cache
         
-        # キャッシュがクリアされたことを確認
-        indexed_dirs_after_clear = index_manager.cache.list_indexed_directories()
-        assert len(indexed_dirs_after_clear) == 0
-    
-    def test_source_filter_functionality(self, temp_source_dir: Path, temp_target_dir: Path, clean_cache):
-        """ソースフィルター機能をテスト"""
         # 追加のソースディレクトリを作成
         with tempfile.TemporaryDirectory() as temp_dir2:
             temp_source_dir2 = Path(temp_dir2)
             
             # 異なるRAWファイルをコピー（test003に対応するRAWファイルを作成）
-            test_data_dir = Path(__file__).parent / "data"
-            if (test_data_dir / "test001.CR3").exists():
+            if "test001.CR3" in samples:
                 # test001.CR3をtest003.CR3として別ディレクトリにコピー
-                shutil.copy2(test_data_dir / "test001.CR3", temp_source_dir2 / "test003.CR3")
+                shutil.copy2(samples["test001.CR3"], temp_source_dir2 / "test003.CR3")
             
-            # 両方のディレクトリをインデックス化
-            index_manager = IndexManager()
-            index_manager.build_or_update_index(temp_source_dir, True, False, False)
+            # 2つ目のディレクトリをインデックス化（1つ目は構築済み）
             index_manager.build_or_update_index(temp_source_dir2, True, False, False)
             
             # ソースフィルターを使用してマッチング
-            match_manager = MatchManager()
             match_manager.find_and_copy_matches(
                 target_dir=temp_target_dir,
                 recursive=True,
@@ -276,18 +332,16 @@ class TestIntegration:
             assert (temp_target_dir / "test002.cr3").exists()
             assert not (temp_target_dir / "test003.CR3").exists()  # フィルターで除外される
     
-    def test_no_recursive_option(self, temp_source_dir: Path, temp_target_dir: Path, clean_cache):
+    def test_no_recursive_option(self, temp_source_dir: Path, temp_target_dir: Path, clean_cache, samples: Dict[str, Path], index_manager: IndexManager):
         """--no-recursiveオプションをテスト"""
         # サブディレクトリを作成してRAWファイルを配置
         sub_dir = temp_source_dir / "subdir"
         sub_dir.mkdir()
         
-        test_data_dir = Path(__file__).parent / "data"
-        if (test_data_dir / "test001.CR3").exists():
-            shutil.copy2(test_data_dir / "test001.CR3", sub_dir / "test005.CR3")
+        if "test001.CR3" in samples:
+            shutil.copy2(samples["test001.CR3"], sub_dir / "test005.CR3")
         
         # --no-recursiveでインデックス化
-        index_manager = IndexManager()
         index_manager.build_or_update_index(
             source_dir=temp_source_dir,
             recursive=False,  # サブディレクトリを検索しない
@@ -310,10 +364,19 @@ class TestIntegration:
         assert "test004.CR3" in indexed_files
         assert "test005.CR3" not in indexed_files  # サブディレクトリのファイルは除外
     
-    def test_force_rebuild_option(self, temp_source_dir: Path, clean_cache):
+    def test_force_rebuild_option(self, temp_source_dir: Path, clean_cache, monkeypatch, index_manager: IndexManager):
         """--force-rebuildオプションをテスト"""
+        # インデックスの更新日時に使用する時計を固定（待機せずに時刻を進める）
+        class FakeDatetime(datetime):
+            current = datetime(2024, 1, 1, 12, 0, 0)
+            
+            @classmethod
+            def now(cls, tz=None):
+                return cls.current
+        
+        monkeypatch.setattr("src.indexer.datetime", FakeDatetime)
+        
         # 最初のインデックス作成
-        index_manager = IndexManager()
         index_manager.build_or_update_index(temp_source_dir, True, False, False)
         
         # インデックスの最終更新時刻を取得
@@ -321,9 +384,8 @@ class TestIntegration:
         assert first_index is not None
         first_update_time = first_index.last_updated
         
-        # 少し待機
-        import time
-        time.sleep(0.1)
+        # 時計を1秒進める
+        FakeDatetime.current += timedelta(seconds=1)
         
         # 強制再構築
         index_manager.build_or_update_index(temp_source_dir, True, True, False)
@@ -335,10 +397,9 @@ class TestIntegration:
         
         assert second_update_time > first_update_time
     
-    def test_cross_platform_path_handling(self, temp_source_dir: Path, clean_cache):
+    def test_cross_platform_path_handling(self, temp_source_dir: Path, clean_cache, index_manager: IndexManager):
         """クロスプラットフォームのパス処理をテスト"""
         # 異なるパス表現でも正しく処理されることを確認
-        index_manager = IndexManager()
         
         # 絶対パスでインデックス作成
         index_manager.build_or_update_index(temp_source_dir.resolve(), True, False, False)
@@ -370,122 +431,88 @@ class TestIntegration:
         exit_code = main()
         assert exit_code == 1  # エラーで終了
     
-    def test_matching_different_raw_formats(self, temp_target_dir: Path, clean_cache):
+    def test_matching_different_raw_formats(self, temp_target_dir: Path, clean_cache, samples: Dict[str, Path], index_manager: IndexManager, match_manager: MatchManager):
         """異なるRAW形式のマッチングをテスト（模擬）"""
         # 実際のテストでは、各カメラメーカーのRAWファイルが必要
         # ここでは既存のCR3ファイルを使用して基本的な動作を確認
         
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_source_dir = Path(temp_dir)
-            test_data_dir = Path(__file__).parent / "data"
             
             # 異なる拡張子でRAWファイルをコピー（模擬的に）
-            if (test_data_dir / "test001.CR3").exists():
+            if "test001.CR3" in samples:
                 # CR3ファイルを異なる拡張子でコピー（実際のファイル形式は同じ）
-                shutil.copy2(test_data_dir / "test001.CR3", temp_source_dir / "test001.NEF")
-                shutil.copy2(test_data_dir / "test002.cr3", temp_source_dir / "test002.arw")
+                shutil.copy2(samples["test001.CR3"], temp_source_dir / "test001.NEF")
+                shutil.copy2(samples["test002.cr3"], temp_source_dir / "test002.arw")
             
             # インデックス作成
-            index_manager = IndexManager()
             index_manager.build_or_update_index(temp_source_dir, True, False, False)
             
             # マッチング処理
-            match_manager = MatchManager()
             match_manager.find_and_copy_matches(temp_target_dir, True, None, False)
             
             # 異なる拡張子のRAWファイルもマッチングされることを確認
             # （実際のExif情報は同じなので、マッチするはず）
-            raw_files = list(temp_target_dir.glob("*.NEF")) + list(temp_target_dir.glob("*.arw"))
-            assert len(raw_files) >= 1  # 少なくとも1つはマッチする
+            raw_count = _count_by_ext(temp_target_dir, frozenset({'.nef', '.arw'}))
+            assert raw_count >= 1  # 少なくとも1つはマッチする
     
-    def test_case_insensitive_matching(self, temp_target_dir: Path, clean_cache):
+    def test_case_insensitive_matching(self, temp_target_dir: Path, clean_cache, samples: Dict[str, Path], index_manager: IndexManager, match_manager: MatchManager):
         """大文字小文字を区別しないマッチングをテスト"""
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_source_dir = Path(temp_dir)
-            test_data_dir = Path(__file__).parent / "data"
             
             # 大文字小文字が異なるファイル名でRAWファイルをコピー
-            if (test_data_dir / "test001.CR3").exists():
-                shutil.copy2(test_data_dir / "test001.CR3", temp_source_dir / "TEST001.cr3")
-                shutil.copy2(test_data_dir / "test002.cr3", temp_source_dir / "Test002.CR3")
+            if "test001.CR3" in samples:
+                shutil.copy2(samples["test001.CR3"], temp_source_dir / "TEST001.cr3")
+                shutil.copy2(samples["test002.cr3"], temp_source_dir / "Test002.CR3")
             
             # インデックス作成
-            index_manager = IndexManager()
             index_manager.build_or_update_index(temp_source_dir, True, False, False)
             
             # マッチング処理
-            match_manager = MatchManager()
             match_manager.find_and_copy_matches(temp_target_dir, True, None, False)
             
             # 大文字小文字が異なってもマッチングされることを確認
-            copied_raw_files = [f for f in temp_target_dir.glob("*") 
-                              if f.suffix.lower() in ['.cr2', '.cr3', '.nef', '.arw']]
-            assert len(copied_raw_files) >= 1
+            assert _count_by_ext(temp_target_dir, RAW_EXTS) >= 1
     
-    def test_windows_path_compatibility(self, clean_cache):
-        """Windowsパス形式の互換性をテスト（模擬）"""
-        # Windowsスタイルのパス文字列を使用してテスト
-        # 実際のWindowsでなくても、パス処理の互換性を確認
-        
-        # Windowsスタイルのパス文字列（模擬）
-        windows_style_paths = [
-            "C:\\Users\\Test\\Photos\\RAW",
-            "D:\\Photography\\2024\\January",
-            "E:\\Backup\\Images"
-        ]
-        
-        # pathlibがこれらのパスを適切に処理できることを確認
-        for path_str in windows_style_paths:
-            try:
-                # Pathオブジェクトとして処理
-                path_obj = Path(path_str)
-                
-                # パスの各部分が正しく解析されることを確認
-                assert path_obj.parts is not None
-                assert len(path_obj.parts) > 0
-                
-                # 文字列表現が取得できることを確認
-                str_repr = str(path_obj)
-                assert isinstance(str_repr, str)
-                assert len(str_repr) > 0
-                
-            except Exception as e:
-                pytest.fail(f"Windowsパス処理でエラー: {path_str} - {e}")
+    @pytest.mark.skipif(_PLATFORM != "Windows", reason="Windowsでのみ確認するパス解析")
+    @pytest.mark.parametrize("path_str", [
+        "C:\\Users\\Test\\Photos\\RAW",
+        "D:\\Photography\\2024\\January",
+        "E:\\Backup\\Images"
+    ])
+    def test_windows_path_compatibility(self, path_str: str):
+        """Windowsパス形式の互換性をテスト"""
+        # パスの各部分が正しく解析され、ドライブ付きの絶対パスとして扱われることを確認
+        path_obj = Path(path_str)
+        assert path_obj.drive and path_obj.is_absolute() and str(path_obj) == path_str
     
-    def test_platform_specific_behavior(self, clean_cache):
-        """プラットフォーム固有の動作をテスト"""
-        import platform
-        
-        current_platform = platform.system()
-        
-        if current_platform == "Darwin":  # macOS
-            # macOSでの動作確認
-            test_path = Path("/Users/test/Documents")
-            assert test_path.is_absolute()
-            
-        elif current_platform == "Windows":  # Windows
-            # Windowsでの動作確認
-            test_path = Path("C:\\Users\\test\\Documents")
-            assert test_path.is_absolute()
-            
-        elif current_platform == "Linux":  # Linux
-            # Linuxでの動作確認
-            test_path = Path("/home/test/Documents")
-            assert test_path.is_absolute()
-        
-        # 共通の動作確認
-        temp_path = Path(tempfile.gettempdir())
-        assert temp_path.exists()
-        assert temp_path.is_dir()
+    @pytest.mark.skipif(_PLATFORM != "Darwin", reason="macOS固有の動作確認")
+    def test_platform_specific_behavior_macos(self):
+        """プラットフォーム固有の動作をテスト（macOS）"""
+        assert Path("/Users/test/Documents").is_absolute()
+    
+    @pytest.mark.skipif(_PLATFORM != "Windows", reason="Windows固有の動作確認")
+    def test_platform_specific_behavior_windows(self):
+        """プラットフォーム固有の動作をテスト（Windows）"""
+        assert Path("C:\\Users\\test\\Documents").is_absolute()
+    
+    @pytest.mark.skipif(_PLATFORM != "Linux", reason="Linux固有の動作確認")
+    def test_platform_specific_behavior_linux(self):
+        """プラットフォーム固有の動作をテスト（Linux）"""
+        assert Path("/home/test/Documents").is_absolute()
+    
+    def test_temp_dir_available(self):
+        """一時ディレクトリが利用可能であることをテスト（全プラットフォーム共通）"""
+        assert Path(tempfile.gettempdir()).is_dir()
     
-    def test_large_file_collection_simulation(self, clean_cache):
+    def test_large_file_collection_simulation(self, clean_cache, samples: Dict[str, Path], index_manager: IndexManager, match_manager: MatchManager):
         """大規模ファイルコレクションの模擬テスト"""
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_source_dir = Path(temp_dir)
             temp_target_dir = Path(temp_dir) / "target"
             temp_target_dir.mkdir()
             
-            test_data_dir = Path(__file__).parent / "data"
             
             # 複数のサブディレクトリを作成して、ファイルを分散配置
             subdirs = ["2024-01", "2024-02", "2024-03"]
@@ -495,20 +522,19 @@ class TestIntegration:
                 sub_path.mkdir()
                 
                 # 各サブディレクトリにRAWファイルをコピー
-                if (test_data_dir / "test001.CR3").exists():
-                    shutil.copy2(test_data_dir / "test001.CR3", sub_path / f"{subdir}_001.CR3")
-                if (test_data_dir / "test002.cr3").exists():
-                    shutil.copy2(test_data_dir / "test002.cr3", sub_path / f"{subdir}_002.cr3")
+                if "test001.CR3" in samples:
+                    shutil.copy2(samples["test001.CR3"], sub_path / f"{subdir}_001.CR3")
+                if "test002.cr3" in samples:
+                    shutil.copy2(samples["test002.cr3"], sub_path / f"{subdir}_002.cr3")
             
             # 対応するJPEGファイルをターゲットディレクトリに配置
             for subdir in subdirs:
-                if (test_data_dir / "test001.JPG").exists():
-                    shutil.copy2(test_data_dir / "test001.JPG", temp_target_dir / f"{subdir}_001.JPG")
-                if (test_data_dir / "test002.jpg").exists():
-                    shutil.copy2(test_data_dir / "test002.jpg", temp_target_dir / f"{subdir}_002.jpg")
+                if "test001.JPG" in samples:
+                    shutil.copy2(samples["test001.JPG"], temp_target_dir / f"{subdir}_001.JPG")
+                if "test002.jpg" in samples:
+                    shutil.copy2(samples["test002.jpg"], temp_target_dir / f"{subdir}_002.jpg")
             
             # インデックス作成
-            index_manager = IndexManager()
             index_manager.build_or_update_index(temp_source_dir, True, False, False)
             
             # インデックスが正しく作成されたことを確認
@@ -517,12 +543,10 @@ class TestIntegration:
             assert indexed_dirs[0][2] == 6  # 6個のRAWファイル（3サブディレクトリ × 2ファイル）
             
             # マッチング処理
-            match_manager = MatchManager()
             match_manager.find_and_copy_matches(temp_target_dir, True, None, False)
             
             # マッチしたRAWファイルがコピーされていることを確認
-            copied_raw_files = [f for f in temp_target_dir.glob("*") 
-                              if f.suffix.lower() in ['.cr2', '.cr3', '.nef', '.arw']]
+            copied_raw_count = _count_by_ext(temp_target_dir, RAW_EXTS)
             
             # 少なくとも一部のファイルがマッチしてコピーされることを確認
-            assert len(copied_raw_files) >= 3  # 各サブディレクトリから少なくとも1つ
\ No newline at end of file
+            assert copied_raw_count >= 3  # 各サブディレクトリから少なくとも1つ
\ No newline at end of file
@@ -10,24 +10,87 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
-from hypothesis import given, settings, strategies as st
+from hypothesis import given, strategies as st
 
+from src.indexer import RawFileIndex
+from src.logger import ProgressLogger
 from src.match_manager import MatchManager
-from src.models import CopyResult, MatchResult, RawFileInfo
+from src.models import CopyResult, MatchMethod, MatchResult, RawFileInfo
+
+
+pytestmark = pytest.mark.property
+
+
+# 警告メッセージのテストで使用する不足ディレクトリ（例ごとにスライスして使用）
+_MISSING_DIRS = tuple(Path(f"/missing/dir{i}") for i in range(6))
+
+
+@st.composite
+def _summary_counts(draw):
+    """処理件数の組を生成（コピー結果の合計がマッチ数以下、マッチ数がJPEG数以下）"""
+    jpeg = draw(st.integers(min_value=0, max_value=100))
+    match = draw(st.integers(min_value=0, max_value=jpeg))
+    success = draw(st.integers(min_value=0, max_value=match))
+    skipped = draw(st.integers(min_value=0, max_value=match - success))
+    failed = draw(st.integers(min_value=0, max_value=match - success - skipped))
+    return jpeg, match, success, skipped, failed
+
+
+@pytest.fixture(scope="module")
+def manager():
+    """プロパティテストで共有するMatchManager（例ごとにキャッシュ等のサブシステムを作り直さない）
+
+    各テストはモックを``with``ブロック内でのみ適用し、progress_logger も設定しないため、
+    例の間で状態は残りません。
+    """
+    return MatchManager()
+
+
+@pytest.fixture(scope="module")
+def availability_manager():
+    """インデックス有無判定のテスト用MatchManager（キャッシュと警告表示をモックに差し替え済み）
+
+    専用のインスタンスに直接モックを設定するため、例ごとのpatchの適用・解除が不要です。
+    """
+    manager = MatchManager()
+    manager.cache = MagicMock()
+    manager._display_index_warning = MagicMock()
+    return manager
+
+
+def _run_pooled_matching(jpeg_files, matched_names, copy_result=None):
+    """スキャン結果とマッチ結果をモックしてfind_and_copy_matchesを実行"""
+    # Exif読み取りはfind_matchesごとモックするため、ExifToolの有無に依存しないよう差し替える
+    with patch('src.match_manager.ExifReader'):
+        manager = MatchManager()
+    progress_logger = MagicMock(spec=ProgressLogger)
+
+    def fake_find_matches(files):
+        # ワーカーからは1ファイルずつ呼び出される
+        return [
+            MatchResult(jpeg_path=f, raw_path=f.with_suffix(".CR2"),
+                        match_method=MatchMethod.BASENAME_ONLY)
+            for f in files if f.name in matched_names
+        ]
+
+    if copy_result is None:
+        copy_result = CopyResult(success=len(matched_names), skipped=0, failed=0, errors=[])
+    with patch('src.match_manager.create_default_logger', return_value=progress_logger), \
+         patch.object(manager, '_load_global_index', return_value=RawFileIndex()), \
+         patch.object(manager, '_check_index_availability', return_value=True), \
+         patch.object(manager.file_scanner, 'iter_jpeg_files', return_value=iter(jpeg_files)), \
+         patch('src.match_manager.Matcher.find_matches', side_effect=fake_find_matches) as mock_find, \
+         patch.object(manager.copier, 'copy_files', return_value=copy_result) as mock_copy:
+        manager.find_and_copy_matches(Path("/target"), True, None, verbose=True)
+
+    return progress_logger, mock_find, mock_copy
 
 
 class TestMatchManagerProperties:
     """MatchManagerのプロパティテスト"""
     
-    @given(
-        jpeg_count=st.integers(min_value=0, max_value=100),
-        match_count=st.integers(min_value=0, max_value=100),
-        success_count=st.integers(min_value=0, max_value=100),
-        skipped_count=st.integers(min_value=0, max_value=50),
-        failed_count=st.integers(min_value=0, max_value=50)
-    )
-    @settings(max_examples=100, deadline=None)
-    def test_processing_summary_accuracy_property(self, jpeg_count, match_count, success_count, skipped_count, failed_count):
+    @given(counts=_summary_counts())
+    def test_processing_summary_accuracy_property(self, counts):
         """
         **Feature: raw-jpeg-matcher, Property 8: 処理サマリーの正確性**
         
@@ -36,68 +99,48 @@ class TestMatchManagerProperties:
         
         検証対象: 要件 5.5
         """
-        # match_countがjpeg_count以下になるように調整
-        match_count = min(match_count, jpeg_count)
-        
-        # コピー結果の合計がマッチ数以下になるように調整
-        total_copy_operations = success_count + skipped_count + failed_count
-        if total_copy_operations > match_count:
-            # 比例配分で調整
-            if total_copy_operations > 0:
-                ratio = match_count / total_copy_operations
-                success_count = int(success_count * ratio)
-                skipped_count = int(skipped_count * ratio)
-                failed_count = match_count - success_count - skipped_count
-                failed_count = max(0, failed_count)  # 負の値を防ぐ
-        
-        # テスト用のMatchManagerを作成
-        manager = MatchManager()
+        jpeg_count, match_count, success_count, skipped_count, failed_count = counts
         
-        # モックのCopyResultを作成
+        # 先頭のmatch_count個のJPEGがマッチするようにスキャン結果を作成
+        jpeg_files = [Path(f"/target/IMG_{i:03d}.jpg") for i in range(jpeg_count)]
+        matched_names = {f.name for f in jpeg_files[:match_count]}
+        errors = [(f"/target/IMG_{i:03d}.CR2", "コピー失敗") for i in range(failed_count)]
         copy_result = CopyResult(
             success=success_count,
             skipped=skipped_count,
             failed=failed_count,
-            errors=[]
-        )
-        
-        # ProcessingStatsを作成してlog_processing_completeメソッドをテスト
-        from src.models import ProcessingStats
-        stats = ProcessingStats(
-            raw_files_found=100,
-            jpeg_files_found=jpeg_count,
-            matches_found=match_count,
-            files_copied=success_count,
-            files_skipped=skipped_count,
-            files_failed=failed_count,
-            errors=[]
+            errors=errors
         )
         
-        # プログレスロガーを初期化してテスト
-        from src.logger import create_default_logger
-        manager.progress_logger = create_default_logger(verbose=False)
-        manager.progress_logger.log_processing_complete(stats)
+        # find_and_copy_matchesがProcessingStatsを作成してプログレスロガーに渡す
+        progress_logger, _, mock_copy = _run_pooled_matching(jpeg_files, matched_names, copy_result)
         
-        # プロパティ検証: コピー操作の合計がマッチ数と一致すること
-        total_reported = success_count + skipped_count + failed_count
-        assert total_reported <= match_count, (
-            f"コピー操作の合計({total_reported})がマッチ数({match_count})を超えています"
-        )
+        if match_count == 0:
+            # マッチがなければコピーもサマリー出力も行わない
+            mock_copy.assert_not_called()
+            progress_logger.log_processing_complete.assert_not_called()
+            return
         
-        # 統計情報の整合性を検証
+        # プロパティ検証: 報告される統計情報が処理結果と一致すること
+        progress_logger.log_processing_complete.assert_called_once()
+        stats = progress_logger.log_processing_complete.call_args.args[0]
         assert stats.jpeg_files_found == jpeg_count, "JPEGファイル数が一致しません"
         assert stats.matches_found == match_count, "マッチ数が一致しません"
+        assert len(mock_copy.call_args.args[0]) == match_count, "コピー対象数がマッチ数と一致しません"
         assert stats.files_copied == success_count, "コピー成功数が一致しません"
         assert stats.files_skipped == skipped_count, "スキップ数が一致しません"
         assert stats.files_failed == failed_count, "失敗数が一致しません"
+        assert stats.errors == errors, "エラー一覧が一致しません"
+        assert stats.files_copied + stats.files_skipped + stats.files_failed <= stats.matches_found, (
+            "コピー操作の合計がマッチ数を超えています"
+        )
     
     @given(
         has_directories=st.booleans(),
         has_matching_filter=st.booleans(),
         directory_count=st.integers(min_value=0, max_value=10)
     )
-    @settings(max_examples=100, deadline=None)
-    def test_index_shortage_warning_display_property(self, has_directories, has_matching_filter, directory_count):
+    def test_index_shortage_warning_display_property(self, availability_manager, has_directories, has_matching_filter, directory_count):
         """
         **Feature: raw-jpeg-matcher, Property 13: インデックス不足時の警告表示**
         
@@ -106,8 +149,6 @@ class TestMatchManagerProperties:
         
         検証対象: 要件 10.7
         """
-        manager = MatchManager()
-        
         # テスト用のディレクトリリストを作成
         if has_directories and directory_count > 0:
             directories = [
@@ -118,42 +159,43 @@ class TestMatchManagerProperties:
             directories = []
         
         # ソースフィルターの設定
-        source_filter = "/test/dir0" if has_matching_filter and directories else None
+        source_filter = Path("/test/dir0") if has_matching_filter and directories else None
         
-        # list_indexed_directoriesをモック
-        with patch.object(manager.cache, 'list_indexed_directories', return_value=directories):
-            # _display_index_warningをモック
-            with patch.object(manager, '_display_index_warning') as mock_warning:
-                result = manager._check_index_availability(source_filter)
+        # モックの戻り値と呼び出し記録をこの例用に設定
+        manager = availability_manager
+        manager.cache.list_indexed_directories.return_value = directories
+        mock_warning = manager._display_index_warning
+        mock_warning.reset_mock()
+        result = manager._check_index_availability(source_filter)
+        
+        # プロパティ検証: インデックスが不足している場合の動作
+        if not directories:
+            # ディレクトリが全くない場合
+            assert not result, "ディレクトリがない場合はFalseを返すべき"
+            mock_warning.assert_called_once_with([])
+            
+        elif source_filter and has_matching_filter:
+            # フィルターが指定されているが、マッチするディレクトリがない場合
+            filter_path = Path(source_filter)
+            dir_paths = {d for d, _, _ in directories}
+            matching = filter_path in dir_paths
+            
+            if not matching:
+                assert not result, "マッチするディレクトリがない場合はFalseを返すべき"
+                mock_warning.assert_called_once_with([filter_path])
+            else:
+                assert result, "マッチするディレクトリがある場合はTrueを返すべき"
+                mock_warning.assert_not_called()
                 
-                # プロパティ検証: インデックスが不足している場合の動作
-                if not directories:
-                    # ディレクトリが全くない場合
-                    assert not result, "ディレクトリがない場合はFalseを返すべき"
-                    mock_warning.assert_called_once_with([])
-                    
-                elif source_filter and has_matching_filter:
-                    # フィルターが指定されているが、マッチするディレクトリがない場合
-                    filter_path = Path(source_filter)
-                    matching = any(d == filter_path for d, _, _ in directories)
-                    
-                    if not matching:
-                        assert not result, "マッチするディレクトリがない場合はFalseを返すべき"
-                        mock_warning.assert_called_once_with([filter_path])
-                    else:
-                        assert result, "マッチするディレクトリがある場合はTrueを返すべき"
-                        mock_warning.assert_not_called()
-                        
-                else:
-                    # ディレクトリが存在し、フィルター条件も満たす場合
-                    assert result, "利用可能なインデックスがある場合はTrueを返すべき"
-                    mock_warning.assert_not_called()
+        else:
+            # ディレクトリが存在し、フィルター条件も満たす場合
+            assert result, "利用可能なインデックスがある場合はTrueを返すべき"
+            mock_warning.assert_not_called()
     
     @given(
         missing_dir_count=st.integers(min_value=0, max_value=5)
     )
-    @settings(max_examples=100, deadline=None)
-    def test_index_warning_message_completeness_property(self, missing_dir_count):
+    def test_index_warning_message_completeness_property(self, manager, missing_dir_count):
         """
         **Feature: raw-jpeg-matcher, Property 13: インデックス不足時の警告表示**
         
@@ -161,18 +203,20 @@ class TestMatchManagerProperties:
         
         検証対象: 要件 10.7
         """
-        manager = MatchManager()
-        
         # 不足ディレクトリのリストを作成
-        missing_directories = [Path(f"/missing/dir{i}") for i in range(missing_dir_count)]
+        missing_directories = list(_MISSING_DIRS[:missing_dir_count])
+        
+        # 出力をキャプチャ（呼び出し記録の文字列化を避け、引数をそのまま保持する）
+        captured = []
+        
+        def _fake_print(*args, **kwargs):
+            captured.append(' '.join(str(a) for a in args))
         
-        # 出力をキャプチャ
-        with patch('builtins.print') as mock_print:
+        with patch('builtins.print', _fake_print):
             manager._display_index_warning(missing_directories)
         
         # 出力内容を取得
-        print_calls = [str(call) for call in mock_print.call_args_list]
-        output_text = ' '.join(print_calls)
+        output_text = '\n'.join(captured)
         
         # プロパティ検証: 警告メッセージの完全性
         
@@ -183,8 +227,8 @@ class TestMatchManagerProperties:
         assert "index" in output_text.lower(), "インデックス作成の指示が含まれていません"
         
         # 3. 不足ディレクトリが指定されている場合、それらが出力に含まれていること
-        for directory in missing_directories:
-            assert str(directory) in output_text, f"不足ディレクトリ {directory} が出力に含まれていません"
+        for directory_str in map(str, missing_directories):
+            assert directory_str in output_text, f"不足ディレクトリ {directory_str} が出力に含まれていません"
         
         # 4. コマンド例が含まれていること
         assert "raw-jpeg-matcher" in output_text, "コマンド例が含まれていません"
@@ -217,6 +261,47 @@ class TestMatchManagerBasicOperations:
             
             assert global_index.file_count == 0
     
+    def test_load_global_index_with_source_filter(self):
+        """ソースフィルター指定時は該当ディレクトリのインデックスのみ読み込むテスト"""
+        manager = MatchManager()
+        
+        dir_index = RawFileIndex()
+        dir_index.add(RawFileInfo(
+            path=Path("/test/dir0/IMG_001.CR2"),
+            basename="img_001",
+            capture_datetime=None,
+            file_size=100
+        ))
+        
+        with patch.object(manager.cache, 'list_indexed_directories') as mock_list:
+            with patch.object(manager.cache, 'load_directory_index', return_value=dir_index) as mock_load:
+                global_index = manager._load_global_index(Path("/test/dir0"))
+                
+                assert global_index.file_count == 1
+                mock_load.assert_called_once_with(Path("/test/dir0"))
+                mock_list.assert_not_called()
+    
+    def test_non_canonical_source_filter(self):
+        """正規化されていないソースフィルターでも該当ディレクトリのインデックスを使用するテスト"""
+        with patch('src.match_manager.ExifReader'):
+            manager = MatchManager()
+        progress_logger = MagicMock(spec=ProgressLogger)
+        indexed_dir = Path("/test/dir0").resolve()
+        
+        dir_index = RawFileIndex()
+        directories = [(indexed_dir, datetime.now(), 0)]
+        with patch('src.match_manager.create_default_logger', return_value=progress_logger), \
+             patch.object(manager.cache, 'list_indexed_directories', return_value=directories), \
+             patch.object(manager.cache, 'load_directory_index', return_value=dir_index) as mock_load, \
+             patch.object(manager, '_display_index_warning') as mock_warning, \
+             patch.object(manager.file_scanner, 'iter_jpeg_files', return_value=iter([])) as mock_scan:
+            manager.find_and_copy_matches(Path("/target"), True, f"{indexed_dir}/../dir0/", verbose=False)
+        
+        mock_load.assert_called_once_with(indexed_dir)
+        mock_warning.assert_not_called()
+        progress_logger.log_processing_start.assert_called_once_with([indexed_dir], Path("/target"))
+        mock_scan.assert_called_once()
+    
     def test_check_index_availability_no_directories(self):
         """ディレクトリが存在しない場合のインデックス可用性チェック"""
         manager = MatchManager()
@@ -226,4 +311,42 @@ class TestMatchManagerBasicOperations:
                 result = manager._check_index_availability(None)
                 
                 assert not result
-                mock_warning.assert_called_once_with([])
\ No newline at end of file
+                mock_warning.assert_called_once_with([])
+    
+    def test_pooled_matching_results(self):
+        """並列マッチングの結果がJPEGパス順に集計されコピーされるテスト"""
+        jpeg_files = [Path(f"/target/IMG_{i:03d}.jpg") for i in (5, 1, 4, 2, 3)]
+        matched_names = {"IMG_001.jpg", "IMG_003.jpg", "IMG_005.jpg"}
+        
+        progress_logger, mock_find, mock_copy = _run_pooled_matching(jpeg_files, matched_names)
+        
+        # すべてのJPEGが1回ずつマッチングされている
+        assert mock_find.call_count == len(jpeg_files)
+        assert sorted(call.args[0][0] for call in mock_find.call_args_list) == sorted(jpeg_files)
+        
+        # コピー対象はJPEGパス順
+        copied = mock_copy.call_args.args[0]
+        assert [m.jpeg_path.name for m in copied] == ["IMG_001.jpg", "IMG_003.jpg", "IMG_005.jpg"]
+        
+        # 統計情報の件数
+        progress_logger.log_matching_start.assert_called_once()
+        progress_logger.log_matching_complete.assert_called_once()
+        assert progress_logger.log_matching_complete.call_args.args[0] == 3
+        stats = progress_logger.log_processing_complete.call_args.args[0]
+        assert stats.jpeg_files_found == 5
+        assert stats.matches_found == 3
+        
+        # 進捗は最初と最後のファイルで出力され、最後の時点で先行する結果が集計されている
+        progress_calls = progress_logger.log_matching_progress.call_args_list
+        assert [c.args[1] for c in progress_calls] == [0, 4]
+        assert all(c.args[0] == 5 for c in progress_calls)
+    
+    def test_pooled_matching_empty_target(self):
+        """JPEGファイルがない場合はマッチング開始ログもコピーも行わないテスト"""
+        progress_logger, mock_find, mock_copy = _run_pooled_matching([], set())
+        
+        progress_logger.log_info.assert_any_call("JPEGファイルが見つかりませんでした。")
+        progress_logger.log_matching_start.assert_not_called()
+        progress_logger.log_matching_complete.assert_not_called()
+        mock_find.assert_not_called()
+        mock_copy.assert_not_called()
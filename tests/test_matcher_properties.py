@@ -4,22 +4,26 @@ Matcherのプロパティベーステスト
 Property 5: 日時マッチングの厳密性を検証します。
 """
 
+import string
 from datetime import datetime, timedelta
 from pathlib import Path
-from hypothesis import given, strategies as st
-from hypothesis import settings
+import pytest
+from hypothesis import given, settings, strategies as st
 from unittest.mock import Mock
 
-from src.models import RawFileInfo, JpegFileInfo, MatchResult
+from src.models import RawFileInfo, JpegFileInfo, MatchMethod, MatchResult
 from src.matcher import Matcher
 from src.indexer import RawFileIndex
 
 
+pytestmark = pytest.mark.property
+
+
 class MockExifReader:
     """テスト用のExifReaderのモック実装"""
     
-    def __init__(self):
-        self.datetime_map = {}  # Path -> datetime のマッピング
+    def __init__(self, datetime_map=None):
+        self.datetime_map = datetime_map if datetime_map is not None else {}  # Path -> datetime のマッピング
     
     def set_datetime(self, file_path: Path, capture_datetime: datetime) -> None:
         """ファイルの撮影日時を設定"""
@@ -30,26 +34,40 @@ class MockExifReader:
         return self.datetime_map.get(file_path)
 
 
+# プロパティテストで共有するモック（例ごとにマッピングだけを差し替える）
+_SHARED_EXIF_READER = MockExifReader()
+
+
+# ストラテジー間で共有する部品（例ごとに再構築しない）
+# ベース名は英数字のみ（空白やファイル名に使えない文字を含まないため除外フィルター不要）
+_BASENAME_ALPHA = string.ascii_letters + string.digits
+_BASENAME = st.text(alphabet=_BASENAME_ALPHA, min_size=1, max_size=20)
+_DT_MIN = datetime(2020, 1, 1)
+_DT_MAX = datetime(2024, 12, 31)
+_DT = st.datetimes(min_value=_DT_MIN, max_value=_DT_MAX)
+_SIZE = st.integers(min_value=1000000, max_value=50000000)
+
+
+def _datetime_other_than(excluded: datetime):
+    """指定した日時を除く範囲の日時ストラテジー（filterによる棄却を発生させない）"""
+    one_us = timedelta(microseconds=1)
+    ranges = []
+    if excluded > _DT_MIN:
+        ranges.append(st.datetimes(min_value=_DT_MIN, max_value=excluded - one_us))
+    if excluded < _DT_MAX:
+        ranges.append(st.datetimes(min_value=excluded + one_us, max_value=_DT_MAX))
+    return st.one_of(ranges)
+
+
 # Hypothesis strategies for generating test data
 @st.composite
 def datetime_matching_scenario_strategy(draw):
     """日時マッチングのテストシナリオを生成するストラテジー"""
     # 基準となる撮影日時
-    base_datetime = draw(st.datetimes(
-        min_value=datetime(2020, 1, 1),
-        max_value=datetime(2024, 12, 31)
-    ))
+    base_datetime = draw(_DT)
     
     # ベース名
-    basename = draw(st.text(
-        alphabet=st.characters(
-            whitelist_categories=('Lu', 'Ll', 'Nd'),
-            min_codepoint=32,
-            max_codepoint=126
-        ),
-        min_size=1,
-        max_size=20
-    ).filter(lambda x: x.strip() and not any(c in x for c in '<>:"|?*')))
+    basename = draw(_BASENAME)
     
     # JPEGファイル情報
     jpeg_path = Path(f"/jpeg/{basename}.jpg")
@@ -68,23 +86,20 @@ def datetime_matching_scenario_strategy(draw):
         path=Path(f"/raw/{basename}_exact.CR2"),
         basename=basename.lower(),
         capture_datetime=base_datetime,  # 完全一致
-        file_size=draw(st.integers(min_value=1000000, max_value=50000000))
+        file_size=draw(_SIZE)
     )
     raw_files.append(exact_match_raw)
     
     # 他のRAWファイルは異なる日時を持つ
     for i in range(num_raw_files - 1):
         # 異なる日時を生成（完全一致を避ける）
-        different_datetime = draw(st.datetimes(
-            min_value=datetime(2020, 1, 1),
-            max_value=datetime(2024, 12, 31)
-        ).filter(lambda dt: dt != base_datetime))
+        different_datetime = draw(_datetime_other_than(base_datetime))
         
         raw_file = RawFileInfo(
             path=Path(f"/raw/{basename}_{i}.CR2"),
             basename=basename.lower(),
             capture_datetime=different_datetime,
-            file_size=draw(st.integers(min_value=1000000, max_value=50000000))
+            file_size=draw(_SIZE)
         )
         raw_files.append(raw_file)
     
@@ -95,62 +110,68 @@ def datetime_matching_scenario_strategy(draw):
     }
 
 
-@st.composite
-def no_datetime_match_scenario_strategy(draw):
-    """日時が一致しないシナリオを生成するストラテジー"""
-    # 基準となる撮影日時
-    jpeg_datetime = draw(st.datetimes(
-        min_value=datetime(2020, 1, 1),
-        max_value=datetime(2024, 12, 31)
-    ))
-    
-    # ベース名
-    basename = draw(st.text(
-        alphabet=st.characters(
-            whitelist_categories=('Lu', 'Ll', 'Nd'),
-            min_codepoint=32,
-            max_codepoint=126
-        ),
-        min_size=1,
-        max_size=20
-    ).filter(lambda x: x.strip() and not any(c in x for c in '<>:"|?*')))
-    
-    # JPEGファイル情報
-    jpeg_path = Path(f"/jpeg/{basename}.jpg")
+# 日時マッチングの同値クラスごとの代表ケース
+# (ベース名, JPEGの撮影日時, RAWファイル候補の撮影日時)
+_EXACT_MATCH_CASES = [
+    ("IMG_001", datetime(2024, 1, 1), [datetime(2024, 1, 1), datetime(2023, 6, 1)]),
+    ("xyz", datetime(2020, 12, 31, 23, 59, 59, 999999), [datetime(2020, 12, 31, 23, 59, 59, 999999)]),
+    ("Photo9", datetime(2022, 5, 5, 10, 0, 0),
+     [datetime(2022, 5, 5, 10, 0, 1), datetime(2022, 5, 5, 9, 59, 59), datetime(2022, 5, 5, 10, 0, 0)]),
+    ("a", datetime(2020, 1, 1), [datetime(2020, 1, 1, 0, 0, 0, 1), datetime(2020, 1, 1)]),  # 1マイクロ秒違いの候補
+    ("MixedCase", datetime(2024, 12, 31), [None, datetime(2024, 12, 31)]),  # 撮影日時のない候補
+]
+
+_NO_MATCH_CASES = [
+    ("IMG_001", datetime(2024, 1, 1), [datetime(2023, 6, 1)]),
+    ("a", datetime(2020, 1, 1), [datetime(2020, 1, 1, 0, 0, 0, 1)]),  # 1マイクロ秒違い
+    ("xyz", datetime(2022, 5, 5, 10, 0, 0), [datetime(2022, 5, 5, 10, 0, 1), datetime(2022, 5, 5, 9, 59, 59)]),
+    ("Photo9", datetime(2024, 12, 31, 23, 59, 59),
+     [datetime(2023, 12, 31, 23, 59, 59), datetime(2024, 12, 30, 23, 59, 59), datetime(2024, 12, 31, 23, 58, 59)]),
+    ("MixedCase", datetime(2024, 12, 31), [None]),  # RAWに撮影日時がない
+]
+
+# (ベース名, RAWファイル候補の撮影日時) ※JPEGの撮影日時はNone
+_BASENAME_ONLY_CASES = [
+    ("IMG_001", [datetime(2024, 1, 1)]),
+    ("xyz", [None]),
+    ("Photo9", [None, datetime(2022, 5, 5)]),
+    ("a", [datetime(2020, 1, 1), datetime(2021, 1, 1), None]),
+]
+
+
+def _scenario(basename, jpeg_datetime, raw_datetimes):
+    """ケースのパラメータからJPEGファイル情報とRAWファイル候補を作成"""
     jpeg_info = JpegFileInfo(
-        path=jpeg_path,
+        path=Path(f"/jpeg/{basename}.jpg"),
         basename=basename.lower(),
         capture_datetime=jpeg_datetime
     )
-    
-    # すべてのRAWファイルが異なる日時を持つ
-    num_raw_files = draw(st.integers(min_value=1, max_value=3))
-    raw_files = []
-    
-    for i in range(num_raw_files):
-        # JPEGとは異なる日時を生成
-        different_datetime = draw(st.datetimes(
-            min_value=datetime(2020, 1, 1),
-            max_value=datetime(2024, 12, 31)
-        ).filter(lambda dt: dt != jpeg_datetime))
-        
-        raw_file = RawFileInfo(
+    raw_files = [
+        RawFileInfo(
             path=Path(f"/raw/{basename}_{i}.CR2"),
             basename=basename.lower(),
-            capture_datetime=different_datetime,
-            file_size=draw(st.integers(min_value=1000000, max_value=50000000))
+            capture_datetime=raw_datetime,
+            file_size=25000000
         )
-        raw_files.append(raw_file)
+        for i, raw_datetime in enumerate(raw_datetimes)
+    ]
+    return jpeg_info, raw_files
+
+
+def _find_matches(jpeg_info, raw_files):
+    """RAWファイル候補からインデックスを作成し、JPEGファイルのマッチングを実行"""
+    # RAWファイルからインデックスを作成
+    index = RawFileIndex.from_iterable(raw_files)
     
-    return {
-        'jpeg_info': jpeg_info,
-        'raw_files': raw_files
-    }
+    # 共有のモックExifReaderにこのケースの撮影日時を設定
+    mock_exif_reader = _SHARED_EXIF_READER
+    mock_exif_reader.datetime_map = {jpeg_info.path: jpeg_info.capture_datetime}
+    
+    return Matcher(mock_exif_reader, index).find_matches([jpeg_info.path])
 
 
-@settings(max_examples=100)
-@given(datetime_matching_scenario_strategy())
-def test_datetime_matching_strictness_property_exact_match(scenario):
+@pytest.mark.parametrize("basename,base_dt,raw_dts", _EXACT_MATCH_CASES)
+def test_datetime_matching_strictness_property_exact_match(basename, base_dt, raw_dts):
     """
     **Feature: raw-jpeg-matcher, Property 5: 日時マッチングの厳密性**
     **検証対象: 要件 3.3**
@@ -160,25 +181,11 @@ def test_datetime_matching_strictness_property_exact_match(scenario):
     
     このテストは完全一致のケースを検証します。
     """
-    # テストデータを取得
-    jpeg_info = scenario['jpeg_info']
-    raw_files = scenario['raw_files']
-    expected_match_path = scenario['expected_match_path']
-    
-    # インデックスを作成してRAWファイルを追加
-    index = RawFileIndex()
-    for raw_file in raw_files:
-        index.add(raw_file)
-    
-    # モックExifReaderを作成
-    mock_exif_reader = MockExifReader()
-    mock_exif_reader.set_datetime(jpeg_info.path, jpeg_info.capture_datetime)
-    
-    # Matcherを作成
-    matcher = Matcher(mock_exif_reader, index)
+    jpeg_info, raw_files = _scenario(basename, base_dt, raw_dts)
+    expected_match_path = raw_files[raw_dts.index(base_dt)].path
     
     # マッチングを実行
-    matches = matcher.find_matches([jpeg_info.path])
+    matches = _find_matches(jpeg_info, raw_files)
     
     # プロパティ検証: 日時マッチングの厳密性
     # 1. 完全一致する日時を持つRAWファイルが存在する場合、必ずマッチする
@@ -196,9 +203,23 @@ def test_datetime_matching_strictness_property_exact_match(scenario):
     assert match.jpeg_path == jpeg_info.path
 
 
-@settings(max_examples=100)
-@given(no_datetime_match_scenario_strategy())
-def test_datetime_matching_strictness_property_no_match(scenario):
+@settings(max_examples=10)
+@given(datetime_matching_scenario_strategy())
+def test_datetime_matching_strictness_smoke(scenario):
+    """
+    日時マッチングの厳密性の回帰確認（ランダムなベース名と日時による少数例）
+    
+    代表ケースで表せない入力の組み合わせに対する退行を検出します。
+    """
+    matches = _find_matches(scenario['jpeg_info'], scenario['raw_files'])
+    
+    assert len(matches) == 1
+    assert matches[0].raw_path == scenario['expected_match_path']
+    assert matches[0].match_method == 'basename_and_datetime'
+
+
+@pytest.mark.parametrize("basename,jpeg_dt,raw_dts", _NO_MATCH_CASES)
+def test_datetime_matching_strictness_property_no_match(basename, jpeg_dt, raw_dts):
     """
     **Feature: raw-jpeg-matcher, Property 5: 日時マッチングの厳密性**
     **検証対象: 要件 3.3**
@@ -208,106 +229,27 @@ def test_datetime_matching_strictness_property_no_match(scenario):
     
     このテストは完全一致しないケースを検証します。
     """
-    # テストデータを取得
-    jpeg_info = scenario['jpeg_info']
-    raw_files = scenario['raw_files']
-    
-    # インデックスを作成してRAWファイルを追加
-    index = RawFileIndex()
-    for raw_file in raw_files:
-        index.add(raw_file)
-    
-    # モックExifReaderを作成
-    mock_exif_reader = MockExifReader()
-    mock_exif_reader.set_datetime(jpeg_info.path, jpeg_info.capture_datetime)
-    
-    # Matcherを作成
-    matcher = Matcher(mock_exif_reader, index)
+    jpeg_info, raw_files = _scenario(basename, jpeg_dt, raw_dts)
     
     # マッチングを実行
-    matches = matcher.find_matches([jpeg_info.path])
+    matches = _find_matches(jpeg_info, raw_files)
     
     # プロパティ検証: 日時マッチングの厳密性
     # 完全一致する日時を持つRAWファイルが存在しない場合、マッチしない
     assert len(matches) == 0, f"日時が一致しないのにマッチしました: JPEG={jpeg_info.capture_datetime}, RAW日時={[r.capture_datetime for r in raw_files]}"
 
 
-@st.composite
-def basename_only_matching_scenario_strategy(draw):
-    """JPEGに撮影日時がない場合のシナリオを生成するストラテジー"""
-    # ベース名
-    basename = draw(st.text(
-        alphabet=st.characters(
-            whitelist_categories=('Lu', 'Ll', 'Nd'),
-            min_codepoint=32,
-            max_codepoint=126
-        ),
-        min_size=1,
-        max_size=20
-    ).filter(lambda x: x.strip() and not any(c in x for c in '<>:"|?*')))
-    
-    # JPEGファイル情報（撮影日時なし）
-    jpeg_path = Path(f"/jpeg/{basename}.jpg")
-    jpeg_info = JpegFileInfo(
-        path=jpeg_path,
-        basename=basename.lower(),
-        capture_datetime=None  # 撮影日時なし
-    )
-    
-    # RAWファイル候補を生成
-    num_raw_files = draw(st.integers(min_value=1, max_value=3))
-    raw_files = []
-    
-    for i in range(num_raw_files):
-        # 任意の日時（またはNone）
-        capture_datetime = draw(st.one_of(
-            st.none(),
-            st.datetimes(
-                min_value=datetime(2020, 1, 1),
-                max_value=datetime(2024, 12, 31)
-            )
-        ))
-        
-        raw_file = RawFileInfo(
-            path=Path(f"/raw/{basename}_{i}.CR2"),
-            basename=basename.lower(),
-            capture_datetime=capture_datetime,
-            file_size=draw(st.integers(min_value=1000000, max_value=50000000))
-        )
-        raw_files.append(raw_file)
-    
-    return {
-        'jpeg_info': jpeg_info,
-        'raw_files': raw_files
-    }
-
-
-@settings(max_examples=100)
-@given(basename_only_matching_scenario_strategy())
-def test_basename_only_matching_when_no_jpeg_datetime(scenario):
+@pytest.mark.parametrize("basename,raw_dts", _BASENAME_ONLY_CASES)
+def test_basename_only_matching_when_no_jpeg_datetime(basename, raw_dts):
     """
     JPEGに撮影日時がない場合のベース名のみマッチングをテスト
     
     これは厳密性プロパティの補完テストです。
     """
-    # テストデータを取得
-    jpeg_info = scenario['jpeg_info']
-    raw_files = scenario['raw_files']
+    jpeg_info, raw_files = _scenario(basename, None, raw_dts)
     
-    # インデックスを作成してRAWファイルを追加
-    index = RawFileIndex()
-    for raw_file in raw_files:
-        index.add(raw_file)
-    
-    # モックExifReaderを作成（JPEGの撮影日時はNone）
-    mock_exif_reader = MockExifReader()
-    mock_exif_reader.set_datetime(jpeg_info.path, None)
-    
-    # Matcherを作成
-    matcher = Matcher(mock_exif_reader, index)
-    
-    # マッチングを実行
-    matches = matcher.find_matches([jpeg_info.path])
+    # マッチングを実行（JPEGの撮影日時はNone）
+    matches = _find_matches(jpeg_info, raw_files)
     
     # プロパティ検証: JPEGに撮影日時がない場合の動作
     # 1. ベース名が一致するRAWファイルがある場合、マッチする
@@ -390,4 +332,98 @@ def test_matcher_no_match():
     matches = matcher.find_matches([jpeg_path])
     
     # 結果を検証（マッチしない）
-    assert len(matches) == 0
\ No newline at end of file
+    assert len(matches) == 0
+
+
+def test_match_statistics_by_method():
+    """マッチ方法ごとの統計集計テスト"""
+    matches = [
+        MatchResult(Path("/test/a.jpg"), Path("/test/a.CR2"), MatchMethod.BASENAME_AND_DATETIME),
+        MatchResult(Path("/test/b.jpg"), Path("/test/b.CR2"), MatchMethod.BASENAME_ONLY),
+        MatchResult(Path("/test/c.jpg"), Path("/test/c.CR2"), MatchMethod.BASENAME_AND_DATETIME),
+    ]
+    
+    matcher = Matcher(MockExifReader(), RawFileIndex())
+    stats = matcher.get_match_statistics(matches)
+    
+    assert stats == {
+        'total_matches': 3,
+        'basename_and_datetime_matches': 2,
+        'basename_only_matches': 1
+    }
+    # 文字列としても比較可能
+    assert MatchMethod.BASENAME_ONLY == 'basename_only'
+
+
+def test_match_result_coerces_match_method():
+    """文字列で指定したマッチ方法はMatchMethodに変換され、不明な値はエラーになるテスト"""
+    match = MatchResult(Path("/test/a.jpg"), Path("/test/a.CR2"), 'basename_only')
+    assert match.match_method is MatchMethod.BASENAME_ONLY
+    
+    with pytest.raises(ValueError, match="不明なマッチング方法"):
+        MatchResult(Path("/test/a.jpg"), Path("/test/a.CR2"), 'unknown')
+
+
+def test_match_statistics_ignores_unknown_method():
+    """作成後に不明なマッチ方法が設定された結果は統計の内訳に含めないテスト"""
+    match = MatchResult(Path("/test/a.jpg"), Path("/test/a.CR2"), MatchMethod.BASENAME_ONLY)
+    match.match_method = 'unknown'
+    
+    stats = Matcher(MockExifReader(), RawFileIndex()).get_match_statistics([match])
+    
+    assert stats == {
+        'total_matches': 1,
+        'basename_and_datetime_matches': 0,
+        'basename_only_matches': 0
+    }
+
+
+def test_matcher_reuses_lookup_for_same_key():
+    """同じベース名と撮影日時のJPEGはインデックス検索を1回だけ行うテスト"""
+    capture_datetime = datetime(2024, 1, 1, 12, 0, 0)
+    raw_path = Path("/raw/IMG_001.CR2")
+    jpeg_paths = [Path("/a/IMG_001.jpg"), Path("/b/IMG_001.JPG")]
+    
+    index = RawFileIndex()
+    index.add(RawFileInfo(
+        path=raw_path,
+        basename="img_001",
+        capture_datetime=capture_datetime,
+        file_size=25000000
+    ))
+    index.find_by_basename = Mock(wraps=index.find_by_basename)
+    
+    mock_exif_reader = MockExifReader()
+    for jpeg_path in jpeg_paths:
+        mock_exif_reader.set_datetime(jpeg_path, capture_datetime)
+    
+    matches = Matcher(mock_exif_reader, index).find_matches(jpeg_paths)
+    
+    assert [m.jpeg_path for m in matches] == jpeg_paths
+    assert all(m.raw_path == raw_path for m in matches)
+    assert index.find_by_basename.call_count == 1
+
+
+def test_matcher_discards_lookup_when_index_replaced():
+    """indexを差し替えると以前の検索結果を再利用しないテスト"""
+    capture_datetime = datetime(2024, 1, 1, 12, 0, 0)
+    jpeg_path = Path("/a/IMG_001.jpg")
+    raw_path = Path("/raw/IMG_001.CR2")
+    
+    mock_exif_reader = MockExifReader()
+    mock_exif_reader.set_datetime(jpeg_path, capture_datetime)
+    
+    matcher = Matcher(mock_exif_reader, RawFileIndex())
+    assert matcher.find_matches([jpeg_path]) == []
+    
+    index = RawFileIndex()
+    index.add(RawFileInfo(
+        path=raw_path,
+        basename="img_001",
+        capture_datetime=capture_datetime,
+        file_size=25000000
+    ))
+    matcher.index = index
+    
+    matches = matcher.find_matches([jpeg_path])
+    assert [m.raw_path for m in matches] == [raw_path]
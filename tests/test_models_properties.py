@@ -4,14 +4,19 @@
 Property 6: インデックスの完全性を検証します。
 """
 
+import string
+from collections.abc import Collection
 from datetime import datetime
 from pathlib import Path
+import pytest
 from hypothesis import given, strategies as st
-from hypothesis import settings
 
 from src.models import RawFileInfo
 
 
+pytestmark = pytest.mark.property
+
+
 class MockRawFileIndex:
     """テスト用のRAWファイルインデックスのモック実装"""
 
@@ -22,27 +27,29 @@ class MockRawFileIndex:
         """インデックスにRAWファイル情報を追加"""
         self.files[info.path] = info
 
-    def get_all_files(self) -> list[RawFileInfo]:
-        """すべてのファイル情報を取得"""
-        return list(self.files.values())
+    def get_all_files(self) -> Collection[RawFileInfo]:
+        """すべてのファイル情報を取得（リストを作らず辞書のビューを返す）"""
+        return self.files.values()
 
 
 # Hypothesis strategies for generating test data
+# ファイルごとに描画する要素のストラテジー（ループ内で毎回生成せずモジュールレベルで共有）
+_EXT = st.sampled_from(('.CR2', '.NEF', '.ARW', '.RAF', '.ORF', '.DNG'))
+_DT = st.one_of(
+    st.none(),
+    st.datetimes(min_value=datetime(2000, 1, 1), max_value=datetime(2024, 12, 31))
+)
+_SIZE = st.integers(min_value=1, max_value=100_000_000)
+
+
 @st.composite
 def unique_raw_files_strategy(draw):
     """一意のパスを持つRawFileInfoオブジェクトのリストを生成するストラテジー"""
     # 一意のファイル名を生成
     num_files = draw(st.integers(min_value=1, max_value=20))
     filenames = draw(st.lists(
-        st.text(
-            alphabet=st.characters(
-                whitelist_categories=('Lu', 'Ll', 'Nd'),
-                min_codepoint=32,
-                max_codepoint=126
-            ),
-            min_size=1,
-            max_size=50
-        ).filter(lambda x: x.strip() and not any(c in x for c in '<>:"|?*')),
+        # 英数字のみ（空白やファイル名に使えない文字を含まないため除外フィルター不要）
+        st.text(alphabet=string.ascii_letters + string.digits, min_size=1, max_size=50),
         min_size=num_files,
         max_size=num_files,
         unique=True  # 一意のファイル名を保証
@@ -51,25 +58,17 @@ def unique_raw_files_strategy(draw):
     raw_files = []
     for i, filename in enumerate(filenames):
         # RAW拡張子を追加
-        extension = draw(st.sampled_from([
-            '.CR2', '.NEF', '.ARW', '.RAF', '.ORF', '.DNG'
-        ]))
+        extension = draw(_EXT)
         path = Path(f"/test/path/{filename}{extension}")
 
         # ベース名（拡張子なし、小文字）
         basename = filename.lower()
 
         # 撮影日時（オプショナル）
-        capture_datetime = draw(st.one_of(
-            st.none(),
-            st.datetimes(
-                min_value=datetime(2000, 1, 1),
-                max_value=datetime(2024, 12, 31)
-            )
-        ))
+        capture_datetime = draw(_DT)
 
         # ファイルサイズ
-        file_size = draw(st.integers(min_value=1, max_value=100_000_000))
+        file_size = draw(_SIZE)
 
         raw_files.append(RawFileInfo(
             path=path,
@@ -81,7 +80,6 @@ def unique_raw_files_strategy(draw):
     return raw_files
 
 
-@settings(max_examples=100)
 @given(unique_raw_files_strategy())
 def test_index_completeness_property(raw_files):
     """
@@ -101,39 +99,36 @@ def test_index_completeness_property(raw_files):
 
     # インデックスから全ファイル情報を取得
     indexed_files = index.get_all_files()
+    indexed_by_path = {f.path: f for f in indexed_files}
 
     # プロパティ検証: インデックスの完全性
     # 1. すべてのRAWファイルがインデックスに含まれている
     assert len(indexed_files) == len(raw_files)
 
-    # 2. 各ファイルについて、必要な情報がすべて保存されている
-    indexed_paths = {f.path for f in indexed_files}
-    original_paths = {f.path for f in raw_files}
-    assert indexed_paths == original_paths
+    # 型の確認は代表の1件で行う（フィールドの値は下のループで元の値と比較する）
+    sample = next(iter(indexed_files))
+    assert isinstance(sample.basename, str)
+    assert isinstance(sample.path, Path)
+    assert sample.capture_datetime is None or isinstance(sample.capture_datetime, datetime)
+    assert isinstance(sample.file_size, int)
 
-    # 3. 各ファイルの詳細情報が正確に保存されている
+    # 2. 各ファイルの詳細情報が正確に保存されている
+    # （パスは一意で件数も一致するため、全ファイルが見つかればパスの集合も一致する）
     for original_file in raw_files:
-        # インデックスから対応するファイルを見つける
-        indexed_file = next(
-            f for f in indexed_files if f.path == original_file.path
-        )
+        # インデックスから対応するファイルを見つける（見つからなければKeyError）
+        indexed_file = indexed_by_path[original_file.path]
 
         # ベース名が保存されている
         assert indexed_file.basename == original_file.basename
-        assert isinstance(indexed_file.basename, str)
 
         # フルパスが保存されている
         assert indexed_file.path == original_file.path
-        assert isinstance(indexed_file.path, Path)
 
         # 撮影日時が保存されている（利用可能な場合）
         assert indexed_file.capture_datetime == original_file.capture_datetime
-        if indexed_file.capture_datetime is not None:
-            assert isinstance(indexed_file.capture_datetime, datetime)
 
         # ファイルサイズが保存されている
         assert indexed_file.file_size == original_file.file_size
-        assert isinstance(indexed_file.file_size, int)
         assert indexed_file.file_size > 0
 
 
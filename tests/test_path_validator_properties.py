@@ -6,16 +6,32 @@ Property 2: クロスプラットフォームパス処理
 """
 
 import os
-import tempfile
+from functools import lru_cache
 from pathlib import Path
+from unittest.mock import patch
 from hypothesis import given, strategies as st, assume
-from hypothesis import settings
 import pytest
 
-from src.path_validator import PathValidator
+from src.path_validator import PathValidator, _DISK_USAGE_TTL
 from src.exceptions import ValidationError
 
 
+pytestmark = pytest.mark.property
+
+
+# @given本体から繰り返し呼び出す検証関数（例ごとの属性参照を避けるためモジュールレベルで束縛）
+_validate_dir = PathValidator.validate_directory
+_validate_writable = PathValidator.validate_writable_directory
+# 正規化はHypothesisの縮小で同じ入力が繰り返されるためテスト内でのみキャッシュする
+# （キーは入力文字列のため、相対パスや~を含むパスの結果はカレントディレクトリやHOMEを
+#  変更すると古くなる。このモジュールではどちらも変更しない）
+_normalize = lru_cache(maxsize=1024)(PathValidator.normalize_path)
+
+# PathValidatorのエラーメッセージに含まれるべき文言
+_ERR_NOT_EXIST = "存在しません"
+_ERR_NOT_DIR = "ディレクトリではありません"
+
+
 # テスト用のディレクトリ作成ヘルパー
 def create_test_directory(base_path: Path, name: str, 
                          readable: bool = True, writable: bool = True) -> Path:
@@ -24,7 +40,8 @@ def create_test_directory(base_path: Path, name: str,
     test_dir.mkdir(exist_ok=True)
     
     # 権限設定（Unixライクシステムでのみ有効）
-    if hasattr(os, 'chmod'):
+    # 読み書き可能（デフォルト）の場合はmkdir時の権限のままとし、chmodを省略
+    if hasattr(os, 'chmod') and not (readable and writable):
         mode = 0o000
         if readable:
             mode |= 0o444
@@ -37,20 +54,38 @@ def create_test_directory(base_path: Path, name: str,
     return test_dir
 
 
+@pytest.fixture(scope="module")
+def shared_tmp(tmp_path_factory):
+    """モジュール内で共有する一時ディレクトリ（例ごとの mkdtemp/rmtree を避ける）
+
+    tmp_path_factory の基底ディレクトリは pytest-xdist のワーカーごとに分かれるため、
+    ``pytest -n auto`` で並列実行してもワーカー間で共有されません。
+
+    作成するディレクトリ・ファイルと存在しないパスの名前が衝突しないよう、
+    用途ごとのサブディレクトリに分けています。
+    """
+    base = tmp_path_factory.mktemp("pv")
+    for name in ("dirs", "files", "missing"):
+        (base / name).mkdir()
+    return base
+
+
 # ファイルシステムで安全に使用できる文字のストラテジー
+# 使用できない文字と空白はアルファベット段階で除外し、filterによる棄却を発生させない
 safe_filename_strategy = st.text(
     alphabet=st.characters(
         whitelist_categories=('Lu', 'Ll', 'Nd'),
         min_codepoint=32,
-        max_codepoint=126
+        max_codepoint=126,
+        blacklist_characters='<>:"|?*\\/. \t\n\r'
     ),
     min_size=1,
     max_size=50
-).filter(lambda x: x.strip() and not any(c in x for c in '<>:"|?*\\/.'))
+)
+
 
-@settings(max_examples=100)
 @given(safe_filename_strategy)
-def test_directory_validation_consistency_property(directory_name):
+def test_valid_dir_accepted(shared_tmp, directory_name):
     """
     **Feature: raw-jpeg-matcher, Property 1: ディレクトリ検証の一貫性**
     **検証対象: 要件 1.1, 1.2, 1.3**
@@ -58,100 +93,93 @@ def test_directory_validation_consistency_property(directory_name):
     任意のディレクトリパスに対して、検証関数は存在しアクセス可能な
     ディレクトリを受け入れ、存在しないまたはアクセス不可能なパスを
     無効なパスを含む明確なエラーメッセージとともに拒否すべきである。
+
+    このテストは存在しアクセス可能なディレクトリの受け入れを検証します。
     """
+    # 前の例と同名の場合は既存のディレクトリを再利用
+    # パスは文字列で組み立ててからPathに一度だけ変換
+    valid_dir = Path(f"{shared_tmp}/dirs/{directory_name}")
+    valid_dir.mkdir(exist_ok=True)
     
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        
-        # ケース1: 存在しアクセス可能なディレクトリ
-        valid_dir = create_test_directory(temp_path, directory_name, 
-                                        readable=True, writable=True)
-        
-        # 存在しアクセス可能なディレクトリは検証を通過すべき
-        try:
-            PathValidator.validate_directory(valid_dir)
-            # 例外が発生しなければ成功
-            validation_passed = True
-        except ValidationError:
-            validation_passed = False
-        
-        assert validation_passed, f"存在するディレクトリの検証が失敗: {valid_dir}"
-        
-        # ケース2: 存在しないディレクトリ
-        non_existent_dir = temp_path / f"non_existent_{directory_name}"
-        
-        # 存在しないディレクトリは ValidationError を発生させるべき
-        with pytest.raises(ValidationError) as exc_info:
-            PathValidator.validate_directory(non_existent_dir)
-        
-        # エラーメッセージにパス情報が含まれているべき
-        error_message = str(exc_info.value)
-        assert str(non_existent_dir) in error_message
-        assert "存在しません" in error_message
-        
-        # ケース3: ファイル（ディレクトリではない）
-        test_file = temp_path / f"test_file_{directory_name}.txt"
-        test_file.write_text("test content")
-        
-        # ファイルパスは ValidationError を発生させるべき
-        with pytest.raises(ValidationError) as exc_info:
-            PathValidator.validate_directory(test_file)
-        
-        # エラーメッセージにパス情報が含まれているべき
-        error_message = str(exc_info.value)
-        assert str(test_file) in error_message
-        assert "ディレクトリではありません" in error_message
+    # 存在しアクセス可能なディレクトリは検証を通過すべき
+    try:
+        _validate_dir(valid_dir)
+        # 例外が発生しなければ成功
+        validation_passed = True
+    except ValidationError:
+        validation_passed = False
+    
+    assert validation_passed, f"存在するディレクトリの検証が失敗: {valid_dir}"
 
 
-@settings(max_examples=50)
 @given(safe_filename_strategy)
-def test_writable_directory_validation_property(directory_name):
+def test_missing_dir_rejected(shared_tmp, directory_name):
+    """
+    ディレクトリ検証の一貫性（Property 1）: 存在しないディレクトリの拒否
+
+    ファイルシステムへの書き込みは行いません。
+    """
+    non_existent_dir = Path(f"{shared_tmp}/missing/non_existent_{directory_name}")
+    
+    # 存在しないディレクトリは ValidationError を発生させるべき
+    with pytest.raises(ValidationError) as exc_info:
+        _validate_dir(non_existent_dir)
+    
+    # エラーメッセージにパス情報が含まれているべき
+    error_message = str(exc_info.value)
+    assert str(non_existent_dir) in error_message
+    assert _ERR_NOT_EXIST in error_message
+
+
+@given(safe_filename_strategy)
+def test_file_path_rejected(shared_tmp, directory_name):
+    """
+    ディレクトリ検証の一貫性（Property 1）: ファイル（ディレクトリではない）の拒否
+    """
+    test_file = Path(f"{shared_tmp}/files/test_file_{directory_name}.txt")
+    test_file.touch()
+    
+    # ファイルパスは ValidationError を発生させるべき
+    with pytest.raises(ValidationError) as exc_info:
+        _validate_dir(test_file)
+    
+    # エラーメッセージにパス情報が含まれているべき
+    error_message = str(exc_info.value)
+    assert str(test_file) in error_message
+    assert _ERR_NOT_DIR in error_message
+
+
+@given(safe_filename_strategy)
+def test_writable_directory_validation_property(shared_tmp, directory_name):
     """
     書き込み可能ディレクトリ検証のプロパティテスト
     """
     
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        
-        # 書き込み可能なディレクトリ
-        writable_dir = create_test_directory(temp_path, directory_name,
-                                           readable=True, writable=True)
-        
-        # 書き込み可能なディレクトリは検証を通過すべき
-        try:
-            PathValidator.validate_writable_directory(writable_dir)
-            validation_passed = True
-        except ValidationError:
-            validation_passed = False
-        
-        assert validation_passed, f"書き込み可能ディレクトリの検証が失敗: {writable_dir}"
+    # 書き込み可能なディレクトリ
+    writable_dir = create_test_directory(shared_tmp / "dirs", directory_name,
+                                       readable=True, writable=True)
+    
+    # 書き込み可能なディレクトリは検証を通過すべき
+    try:
+        _validate_writable(writable_dir)
+        validation_passed = True
+    except ValidationError:
+        validation_passed = False
+    
+    assert validation_passed, f"書き込み可能ディレクトリの検証が失敗: {writable_dir}"
 
 
 # パス正規化のテスト用ストラテジー
-@st.composite
-def path_string_strategy(draw):
-    """様々なパス文字列を生成するストラテジー"""
-    # パスの種類を選択
-    path_type = draw(st.sampled_from(['relative', 'absolute', 'home']))
-    
-    # パス要素を生成（ファイルシステムで安全な文字のみ）
-    path_elements = draw(st.lists(
-        safe_filename_strategy,
-        min_size=1,
-        max_size=5
-    ))
-    
-    if path_type == 'relative':
-        return '/'.join(path_elements)
-    elif path_type == 'absolute':
-        return '/' + '/'.join(path_elements)
-    else:  # home
-        return '~/' + '/'.join(path_elements)
-
-
-@settings(max_examples=100)
-@given(path_string_strategy())
-def test_cross_platform_path_processing_property(path_string):
+# パスの種類ごとのプレフィックス（種類ごとに確実に検証するためparametrizeで指定）
+_PATH_PREFIXES = {'relative': '', 'absolute': '/', 'home': '~/'}
+
+# パス要素（ファイルシステムで安全な文字のみ）
+path_elements_strategy = st.lists(safe_filename_strategy, min_size=1, max_size=5)
+
+
+@pytest.mark.parametrize("kind", list(_PATH_PREFIXES))
+@given(path_elements=path_elements_strategy)
+def test_cross_platform_path_processing_property(kind, path_elements):
     """
     **Feature: raw-jpeg-matcher, Property 2: クロスプラットフォームパス処理**
     **検証対象: 要件 1.4**
@@ -160,8 +188,10 @@ def test_cross_platform_path_processing_property(path_string):
     システムは適切なオペレーティングシステム上でパスを正しく
     解析し処理すべきである。
     """
-    # パス正規化を実行
-    normalized_path = PathValidator.normalize_path(path_string)
+    path_string = _PATH_PREFIXES[kind] + '/'.join(path_elements)
+    
+    # パス正規化を実行（テスト内でキャッシュした正規化関数を使用）
+    normalized_path = _normalize(path_string)
     
     # プロパティ検証
     # 1. 結果はPathオブジェクトであるべき
@@ -170,74 +200,80 @@ def test_cross_platform_path_processing_property(path_string):
     # 2. 正規化されたパスは絶対パスであるべき
     assert normalized_path.is_absolute()
     
-    # 3. パス文字列から正規化されたパスを再構築できるべき
-    # （同じ入力に対して一貫した結果を返すべき）
-    normalized_again = PathValidator.normalize_path(path_string)
-    assert normalized_path == normalized_again
-    
-    # 4. 正規化されたパスの文字列表現は有効であるべき
+    # 3. 正規化されたパスの文字列表現は有効であるべき
     path_str = str(normalized_path)
     assert len(path_str) > 0
     
-    # 5. パスの各部分は有効な文字のみを含むべき
+    # 4. パスの各部分は有効な文字のみを含むべき
     # （プラットフォーム固有の無効文字がないことを確認）
     for part in normalized_path.parts:
         if part not in ('/', '\\'):  # ルート要素を除く
             assert len(part) > 0
 
 
-def test_normalize_path_with_home_directory():
-    """ホームディレクトリ展開のテスト"""
-    # ホームディレクトリを含むパス
-    home_path = "~/test/directory"
-    normalized = PathValidator.normalize_path(home_path)
+@pytest.mark.parametrize("path_string", ["~/test/directory", "test/directory"], ids=["home", "relative"])
+def test_normalize_path_basic(path_string):
+    """ホームディレクトリ展開と相対パスの正規化テスト"""
+    normalized = PathValidator.normalize_path(path_string)
     
-    # ホームディレクトリが展開されているべき
+    # ホームディレクトリが展開され、絶対パスに変換されているべき
     assert not str(normalized).startswith('~')
     assert normalized.is_absolute()
 
 
-def test_normalize_path_with_current_directory():
-    """相対パスの正規化テスト"""
-    # 相対パス
-    relative_path = "test/directory"
-    normalized = PathValidator.normalize_path(relative_path)
-    
-    # 絶対パスに変換されているべき
-    assert normalized.is_absolute()
+def test_normalize_path_consistency():
+    """同じ入力に対して同じ正規化結果を返すテスト"""
+    for path_string in ("~/test/directory", "test/directory", "/test/directory"):
+        assert PathValidator.normalize_path(path_string) == PathValidator.normalize_path(path_string)
 
 
-def test_disk_space_check_property():
+def test_disk_space_check_property(shared_tmp):
     """ディスク容量チェックのプロパティテスト"""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        
-        # 非常に小さな容量要求（常に満たされるべき）
-        small_requirement = 1  # 1バイト
-        result = PathValidator.check_disk_space(temp_path, small_requirement)
-        assert result is True
-        
-        # 非常に大きな容量要求（通常は満たされない）
-        large_requirement = 10**18  # 1エクサバイト
-        result = PathValidator.check_disk_space(temp_path, large_requirement)
-        assert result is False
+    # 非常に小さな容量要求（常に満たされるべき）
+    small_requirement = 1  # 1バイト
+    result = PathValidator.check_disk_space(shared_tmp, small_requirement)
+    assert result is True
+    
+    # 非常に大きな容量要求（通常は満たされない）
+    large_requirement = 10**18  # 1エクサバイト
+    result = PathValidator.check_disk_space(shared_tmp, large_requirement)
+    assert result is False
 
 
-def test_disk_usage_info_property():
+def test_disk_usage_info_property(shared_tmp):
     """ディスク使用量情報取得のプロパティテスト"""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
+    usage_info = PathValidator.get_disk_usage_info(shared_tmp)
+    
+    if usage_info is not None:
+        total, used, free = usage_info
+        
+        # 基本的な整合性チェック
+        assert isinstance(total, int)
+        assert isinstance(used, int)
+        assert isinstance(free, int)
+        assert total > 0
+        assert used >= 0
+        assert free >= 0
+        assert used + free <= total  # 使用量+空き容量 <= 総容量
         
-        usage_info = PathValidator.get_disk_usage_info(temp_path)
+        # shutil.disk_usageの名前付きタプルがそのまま返される
+        assert usage_info.free == free
+
+
+def test_disk_usage_cache_expires(shared_tmp, monkeypatch):
+    """ディスク使用量は同じファイルシステム内で共有され、有効期間を過ぎると再取得されるテスト"""
+    now = 1000.0
+    monkeypatch.setattr("src.path_validator.time.monotonic", lambda: now)
+    monkeypatch.setattr(PathValidator, "_disk_usage_cache", {})
+    
+    with patch("src.path_validator.shutil.disk_usage", return_value=(100, 40, 60)) as mock_usage:
+        # 同じファイルシステム上の別ディレクトリはキャッシュを共有する
+        assert PathValidator.get_disk_usage_info(shared_tmp) == (100, 40, 60)
+        assert PathValidator.check_disk_space(shared_tmp / "dirs", 60)
+        assert mock_usage.call_count == 1
         
-        if usage_info is not None:
-            total, used, free = usage_info
-            
-            # 基本的な整合性チェック
-            assert isinstance(total, int)
-            assert isinstance(used, int)
-            assert isinstance(free, int)
-            assert total > 0
-            assert used >= 0
-            assert free >= 0
-            assert used + free <= total  # 使用量+空き容量 <= 総容量
\ No newline at end of file
+        # 有効期間を過ぎると再取得する
+        mock_usage.return_value = (100, 90, 10)
+        now += _DISK_USAGE_TTL
+        assert not PathValidator.check_disk_space(shared_tmp, 60)
+        assert mock_usage.call_count == 2